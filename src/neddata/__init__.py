@@ -9,6 +9,36 @@ from neddata.datamodel import (
     DataDir,
     Catalog,
 )
+from neddata.cache import LoadCache
 
 
-from neddata.abbey.catalog import cat as abbey_catalog
+# =====================================================================
+# === Lazy Dataset Catalogs
+# =====================================================================
+# > Importing a catalog.py builds its pooch & Catalog, so we only do that
+# > on first attribute access, e.g. `neddata.abbey_catalog` (PEP 562)
+
+import importlib
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from neddata.abbey.catalog import cat as abbey_catalog
+    from neddata.federation import cat as catalog
+
+_CATALOGS: dict[str, str] = {
+    "abbey_catalog": "neddata.abbey.catalog",
+    "catalog": "neddata.federation",  # < All datasets, "abbey/kdb/..."
+}
+
+
+def __getattr__(name: str):
+    if name in _CATALOGS:
+        cat = importlib.import_module(_CATALOGS[name]).cat
+        globals()[name] = cat  # < Cache, __getattr__ isn't called again
+        return cat
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_CATALOGS])
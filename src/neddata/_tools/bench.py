@@ -0,0 +1,652 @@
+import argparse
+import fnmatch
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from dataclasses import asdict, dataclass, field
+from functools import cached_property
+from pathlib import Path
+
+from typing import Any, Callable, Iterable, NamedTuple, Sequence
+
+
+# ================================================================== #
+# === CLI wiring                                                     #
+# ================================================================== #
+
+CMD_NAME = "bench"  # < Name of the command, used in CLI
+CMD_ALIASES = ["b"]  # < Alias shortcut of the command
+DOC = f"Benchmark catalogue construction, loaders, search and pandas helpers on synthetic inputs scaled from the abbey files. Aliases: {CMD_ALIASES}"
+DOC_RUN = "Run the suite, print the timings and save them as JSON, e.g. as a baseline."
+DOC_COMPARE = "Compare results against a baseline JSON, exits 1 if a benchmark got slower than the threshold, or is missing from the current results (unless excluded by --select)."
+
+
+def _add_my_parser(subparsers: argparse._SubParsersAction) -> None:
+    p: argparse.ArgumentParser = subparsers.add_parser(
+        name=CMD_NAME,
+        aliases=CMD_ALIASES,
+        description=DOC,
+        help=DOC,
+    )
+    actions = p.add_subparsers(dest="action", required=True)
+
+    ### run
+    r = actions.add_parser("run", description=DOC_RUN, help=DOC_RUN)
+    _add_suite_args(r)
+    r.add_argument(
+        "-o", "--out", type=Path, default=None, help="Save results as JSON"
+    )
+    # > Entrypoint, retrieved as args.func in cli.py
+    r.set_defaults(func=_run_run)
+
+    ### compare
+    c = actions.add_parser("compare", description=DOC_COMPARE, help=DOC_COMPARE)
+    c.add_argument("baseline", type=Path, help="JSON written by `bench run`")
+    c.add_argument(
+        "current",
+        type=Path,
+        nargs="?",
+        default=None,
+        help="JSON to compare (default: run the suite now, at the scale "
+        "of the baseline)",
+    )
+    c.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative slowdown of the median that counts as regression",
+    )
+    c.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.001,
+        help="Ignore slowdowns below this many seconds (timer noise)",
+    )
+    _add_suite_args(c)
+    c.set_defaults(func=_run_compare)
+
+
+def _add_suite_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "-k",
+        "--select",
+        nargs="*",
+        default=None,
+        help="Glob patterns over benchmark names, e.g. 'load/*'",
+    )
+    p.add_argument(
+        "-s",
+        "--scale",
+        type=int,
+        default=None,
+        help=f"Copies of the abbey files per input (default: {SCALE})",
+    )
+    p.add_argument("-n", "--repeat", type=int, default=5)
+
+
+def _run_run(args: argparse.Namespace) -> None:
+    result = run_suite(
+        scale=args.scale or SCALE,
+        repeat=args.repeat,
+        select=args.select,
+        progress=_progress,
+    )
+    print(result)
+    if args.out:
+        print(f"Saved to {result.to_json(args.out)}", file=sys.stderr)
+
+
+def _run_compare(args: argparse.Namespace) -> None:
+    baseline = SuiteResult.from_json(args.baseline)
+    if args.select:
+        baseline.timings = {
+            k: t
+            for k, t in baseline.timings.items()
+            if any(fnmatch.fnmatchcase(k, p) for p in args.select)
+        }
+    if args.current:
+        current = SuiteResult.from_json(args.current)
+    else:
+        current = run_suite(
+            scale=args.scale or baseline.meta.get("scale", SCALE),
+            repeat=args.repeat,
+            select=args.select or list(baseline.timings),
+            progress=_progress,
+        )
+    comparison = compare(
+        baseline, current, threshold=args.threshold, min_delta=args.min_delta
+    )
+    print(comparison)
+    if comparison.regressions:
+        sys.exit(1)
+
+
+def _progress(name: str, timing: "Timing") -> None:
+    print(f"{timing!r}", file=sys.stderr)
+
+
+# ================================================================== #
+# === Inputs                                                         #
+# ================================================================== #
+# > Real abbey files, repeated *scale* times. Every copy gets its first
+# > column (the id) suffixed with the copy number, so rows stay unique
+# > and ids stay integers, quirks like "5.175.792" coordinates and ";"
+# > inside the last regest column are kept as they are.
+
+SCALE = 10  # < ~41k KDB rows, ~27k regest rows
+KDB_KEY = "KDB/KDB_Complete.csv"
+REGESTS_KEY = "Regests/2_ben-Cist Identifizierungen.csv"
+
+
+def scale_lines(text: str, scale: int) -> str:
+    """Repeat the data lines of a delimited *text* *scale* times, with the
+    first field of copy ``i > 0`` suffixed by ``i``."""
+    header, *lines = text.rstrip("\n").split("\n")
+    out = [header]
+    for i in range(scale):
+        if i == 0:
+            out.extend(lines)
+            continue
+        width = len(str(scale - 1))
+        suffix = f"{i:0{width}d}"
+        for line in lines:
+            first, sep, rest = line.partition(";")
+            out.append(f"{first}{suffix}{sep}{rest}")
+    return "\n".join(out) + "\n"
+
+
+class Inputs:
+    """Synthetic inputs in *workdir*, created on first access.
+
+    :param scale: Copies of the abbey files, keys for the catalogue
+    """
+
+    def __init__(self, workdir: Path, scale: int = SCALE) -> None:
+        self.workdir = Path(workdir)
+        self.scale = scale
+
+    @cached_property
+    def _abbey(self):
+        from neddata.abbey import catalog
+
+        return catalog
+
+    def _real_text(self, key: str) -> str:
+        """Text of an abbey file as shipped in the package, read without
+        the network (no pooch fetch)."""
+        from importlib.resources import files
+
+        path = self._abbey.cat[key].path.as_posix()  # < Key -> file name
+        return (files(self._abbey.DATASET) / path).read_text(encoding="utf-8")
+
+    def _write(self, name: str, text: str) -> Path:
+        path = self.workdir / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    # === Files ======================================================
+
+    @cached_property
+    def kdb_csv(self) -> Path:
+        """KDB table, ";"-separated with unparsed coordinates."""
+        text = scale_lines(self._real_text(KDB_KEY), self.scale)
+        return self._write("kdb.csv", text)
+
+    @cached_property
+    def regests_csv(self) -> Path:
+        """Regests, ";" also inside the last column."""
+        text = scale_lines(self._real_text(REGESTS_KEY), self.scale)
+        return self._write("regests.csv", text)
+
+    @cached_property
+    def csv(self) -> Path:
+        """KDB table as plain ","-separated CSV."""
+        path = self.workdir / "default.csv"
+        self.kdb_frame.to_csv(path, index=False)
+        return path
+
+    @cached_property
+    def xlsx(self) -> Path:
+        """KDB table as workbook, one copy per 10 of *scale*: openpyxl
+        parses ~4k rows/s, the full scale would dominate the suite."""
+        from openpyxl import Workbook
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("KDB")
+        copies = max(1, self.scale // 10)
+        rows = len(self.kdb_frame) // self.scale * copies
+        df = self.kdb_frame.iloc[:rows]
+        ws.append(list(df.columns))
+        for row in df.itertuples(index=False):
+            ws.append([None if v != v else v for v in row])  # < NaN
+        path = self.workdir / "default.xlsx"
+        wb.save(path)
+        return path
+
+    @cached_property
+    def json(self) -> Path:
+        """Regests as a list of records."""
+        path = self.workdir / "default.json"
+        self.regests_frame.to_json(path, orient="records", force_ascii=False)
+        return path
+
+    @cached_property
+    def txt(self) -> Path:
+        return self._write("default.txt", self.regests_csv.read_text("utf-8"))
+
+    @cached_property
+    def npy(self) -> Path:
+        """Embedding-like float32 matrix, 1000 rows per copy."""
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        path = self.workdir / "default.npy"
+        vectors = rng.standard_normal((1000 * self.scale, 384))
+        np.save(path, vectors.astype(np.float32))
+        return path
+
+    # === Frames =====================================================
+
+    @cached_property
+    def kdb_frame(self):
+        """KDB table with coordinates still as strings."""
+        import pandas as pd
+
+        return pd.read_csv(
+            self.kdb_csv, sep=";", dtype={"Lon": str, "Lat": str}
+        )
+
+    @cached_property
+    def regests_frame(self):
+        return self._abbey.load_ben_cist_data(self.regests_csv)
+
+    # === Catalogue ==================================================
+
+    @cached_property
+    def registry(self) -> dict[str, str]:
+        """Abbey registry, copied into 100 sub-directories per copy."""
+        real = self._abbey.POOCHY.registry
+        return {
+            f"copy_{i:05d}/{fname}": sha
+            for i in range(100 * self.scale)
+            for fname, sha in real.items()
+        }
+
+    @cached_property
+    def pooch(self):
+        import pooch
+
+        return pooch.create(
+            path=self.workdir / "pooch",
+            base_url="https://example.invalid/",
+            registry=self.registry,
+        )
+
+    @cached_property
+    def catalog(self):
+        from neddata.datamodel import Catalog
+
+        return Catalog(self._abbey.DATASET, pooch=self.pooch)
+
+
+# ================================================================== #
+# === Benchmarks                                                     #
+# ================================================================== #
+
+
+class Case(NamedTuple):
+    """What a benchmark times: ``run(*args())``, *args* is called outside
+    the timer, e.g. to copy a frame that *run* modifies in place."""
+
+    run: Callable[..., Any]
+    n: int  # < Size of the input: rows, records, keys
+    args: Callable[[], tuple] = tuple
+
+
+BENCHMARKS: dict[str, Callable[[Inputs], Case]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """Register a function ``(inputs) -> Case`` as benchmark *name*."""
+
+    def decorator(setup: Callable[[Inputs], Case]) -> Callable:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+### Catalogue
+@benchmark("catalog/build")
+def _catalog_build(inp: Inputs) -> Case:
+    from neddata.datamodel import Catalog
+
+    pooch = inp.pooch
+    return Case(
+        lambda: Catalog(inp._abbey.DATASET, pooch=pooch), len(inp.registry)
+    )
+
+
+@benchmark("catalog/glob")
+def _catalog_glob(inp: Inputs) -> Case:
+    cat = inp.catalog
+    return Case(lambda: cat.glob("*/kdb/kdb_complete*.csv"), len(cat.keys()))
+
+
+@benchmark("catalog/search")
+def _catalog_search(inp: Inputs) -> Case:
+    cat = inp.catalog
+    return Case(lambda: cat.search("kdb complete 2"), len(cat.keys()))
+
+
+### Default loaders, one per file type
+def _default_loader(ext: str) -> Callable[[Inputs], Case]:
+    def setup(inp: Inputs) -> Case:
+        from neddata.utils import fileio
+
+        path: Path = getattr(inp, ext)
+        loader = fileio.get_default_loader(path)
+        n = len(loader(path).splitlines() if ext == "txt" else loader(path))
+        return Case(lambda: loader(path), n)
+
+    return setup
+
+
+for _ext in ("csv", "json", "txt", "xlsx", "npy"):
+    benchmark(f"load/default_{_ext}")(_default_loader(_ext))
+
+
+### Custom abbey loaders
+@benchmark("load/load_utf8_csv")
+def _load_utf8_csv(inp: Inputs) -> Case:
+    load, path = inp._abbey.load_utf8_csv, inp.kdb_csv
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        n = len(load(path))
+    return Case(lambda: _quiet(load, path), n)
+
+
+@benchmark("load/load_ben_cist_data")
+def _load_ben_cist_data(inp: Inputs) -> Case:
+    load, path = inp._abbey.load_ben_cist_data, inp.regests_csv
+    return Case(lambda: load(path), len(inp.regests_frame))
+
+
+### Pandas helpers
+@benchmark("pd/lon_lat_to_numeric")
+def _lon_lat_to_numeric(inp: Inputs) -> Case:
+    from neddata.utils.pd import LON_LAT_RANGES, lon_lat_to_numeric
+
+    df = inp.kdb_frame[["Lon", "Lat"]]
+    return Case(
+        lambda d: _quiet(lon_lat_to_numeric, d, ranges=LON_LAT_RANGES),
+        len(df),
+        args=lambda: (df.copy(),),
+    )
+
+
+@benchmark("pd/implode")
+def _implode(inp: Inputs) -> Case:
+    from neddata.utils.pd import implode
+
+    df = inp.regests_frame
+    ### Like Regests/2_Ben-Cist_Identifizierungen.UNIQUE.py
+    return Case(lambda: implode(df, groupby_col="complete_no_tags"), len(df))
+
+
+@benchmark("pd/warn_if_nan_increases")
+def _warn_if_nan_increases(inp: Inputs) -> Case:
+    import pandas as pd
+
+    from neddata.utils.pd import warn_if_nan_increases
+
+    df = inp.regests_frame
+
+    def run(d: pd.DataFrame) -> None:
+        ### Every column monitored, id_RG loses its non-numeric ids
+        with warn_if_nan_increases(d):
+            d["id_RG"] = pd.to_numeric(d["id_RG"], errors="coerce")
+
+    return Case(lambda d: _quiet(run, d), len(df), args=lambda: (df.copy(),))
+
+
+def _quiet(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call *func* with warnings suppressed, they'd flood the output."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return func(*args, **kwargs)
+
+
+# ================================================================== #
+# === Run                                                            #
+# ================================================================== #
+
+
+@dataclass
+class Timing:
+    name: str
+    n: int
+    median_s: float
+    min_s: float
+    max_s: float
+    repeat: int
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.name:<28} {_fmt_s(self.median_s):>10} "
+            f"(min {_fmt_s(self.min_s)}, n={self.n:,})"
+        )
+
+
+@dataclass
+class SuiteResult:
+    timings: dict[str, Timing]
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    def __repr__(self) -> str:
+        head = f"<{self.__class__.__name__}(scale={self.meta.get('scale')})>"
+        return "\n".join([head, *(repr(t) for t in self.timings.values())])
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def to_json(self, path: Path | str) -> Path:
+        """Write the result as JSON, creating parent directories."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+    @classmethod
+    def from_json(cls, path: Path | str) -> "SuiteResult":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        timings = {k: Timing(**t) for k, t in data["timings"].items()}
+        return cls(timings=timings, meta=data.get("meta", {}))
+
+
+def _fmt_s(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.2f} ms"
+    return f"{seconds:.3f} s"
+
+
+def _meta(scale: int, repeat: int) -> dict[str, Any]:
+    import os
+    from importlib.metadata import version
+
+    versions = {}
+    for dist in ("neddata", "pandas", "numpy", "pyarrow", "openpyxl"):
+        try:
+            versions[dist] = version(dist)
+        except Exception:
+            versions[dist] = None
+    return {
+        "scale": scale,
+        "repeat": repeat,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": versions,
+    }
+
+
+def select_benchmarks(patterns: Iterable[str] | None = None) -> list[str]:
+    """Names of the registered benchmarks matching any of *patterns*."""
+    if not patterns:
+        return list(BENCHMARKS)
+    return [
+        name
+        for name in BENCHMARKS
+        if any(fnmatch.fnmatchcase(name, p) for p in patterns)
+    ]
+
+
+def time_case(
+    name: str, case: Case, repeat: int = 5, warmup: int = 1
+) -> Timing:
+    """Time *case* *repeat* times after *warmup* untimed calls."""
+    times = []
+    for i in range(warmup + repeat):
+        args = case.args()
+        t = time.perf_counter()
+        case.run(*args)
+        if i >= warmup:
+            times.append(time.perf_counter() - t)
+    return Timing(
+        name=name,
+        n=case.n,
+        median_s=statistics.median(times),
+        min_s=min(times),
+        max_s=max(times),
+        repeat=repeat,
+    )
+
+
+def run_suite(
+    scale: int = SCALE,
+    repeat: int = 5,
+    select: Sequence[str] | None = None,
+    workdir: Path | None = None,
+    progress: Callable[[str, Timing], None] | None = None,
+) -> SuiteResult:
+    """Build the inputs and time every selected benchmark.
+
+    :param scale: Copies of the abbey files per input
+    :param select: Glob patterns over benchmark names, None = all
+    :param workdir: Where to write the inputs, default a temporary
+        directory that is removed afterwards
+    """
+    names = select_benchmarks(select)
+    timings = {}
+    with tempfile.TemporaryDirectory(prefix="neddata-bench-") as tmp:
+        inputs = Inputs(Path(workdir or tmp), scale=scale)
+        for name in names:
+            timing = time_case(name, BENCHMARKS[name](inputs), repeat)
+            timings[name] = timing
+            if progress:
+                progress(name, timing)
+    return SuiteResult(timings=timings, meta=_meta(scale, repeat))
+
+
+# ================================================================== #
+# === Compare                                                        #
+# ================================================================== #
+
+
+@dataclass
+class Comparison:
+    """Median of each benchmark, current / baseline."""
+
+    rows: list[tuple[str, float | None, float | None, str]]
+    threshold: float
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> list[str]:
+        """Slower benchmarks, and those missing from the current run (a
+        renamed or broken benchmark must not pass the gate)."""
+        return [
+            name
+            for name, *_, status in self.rows
+            if status in ("slower", "missing")
+        ]
+
+    def __repr__(self) -> str:
+        lines = [f"!! {w}" for w in self.warnings]
+        lines.append(
+            f"{'benchmark':<28} {'baseline':>10} {'current':>10}  ratio"
+        )
+        for name, base, cur, status in self.rows:
+            b = _fmt_s(base) if base is not None else "-"
+            c = _fmt_s(cur) if cur is not None else "-"
+            ratio = f"{cur / base:5.2f}x" if base and cur else "     "
+            mark = "" if status == "ok" else f"  {status}"
+            lines.append(f"{name:<28} {b:>10} {c:>10}  {ratio}{mark}")
+        n = len(self.regressions)
+        lines.append(
+            f"{n} regression(s) past +{self.threshold:.0%} or missing"
+            if n
+            else f"No regressions past +{self.threshold:.0%}"
+        )
+        return "\n".join(lines)
+
+
+def compare(
+    baseline: SuiteResult,
+    current: SuiteResult,
+    threshold: float = 0.25,
+    min_delta: float = 0.001,
+) -> Comparison:
+    """Flag benchmarks whose median got slower than ``1 + threshold``
+    times the baseline.
+
+    :param min_delta: Slowdowns of fewer seconds are timer noise, not
+        regressions
+    """
+    warns = []
+    for key in ("scale", "python", "platform"):
+        b, c = baseline.meta.get(key), current.meta.get(key)
+        if b != c:
+            warns.append(f"{key} differs: baseline {b}, current {c}")
+    rows = []
+    for name in dict.fromkeys([*baseline.timings, *current.timings]):
+        b, c = baseline.timings.get(name), current.timings.get(name)
+        if b is None or c is None:
+            status = "new" if b is None else "missing"
+            rows.append(
+                (name, b and b.median_s, c and c.median_s, status)
+            )
+            continue
+        slower = (
+            c.median_s > b.median_s * (1 + threshold)
+            and c.median_s - b.median_s > min_delta
+        )
+        faster = b.median_s > c.median_s * (1 + threshold)
+        status = "slower" if slower else "faster" if faster else "ok"
+        rows.append((name, b.median_s, c.median_s, status))
+    return Comparison(rows=rows, threshold=threshold, warnings=warns)
+
+
+if __name__ == "__main__":
+    # %%
+    result = run_suite(scale=2, repeat=3, progress=_progress)
+    print(result)
+
+    # %%
+    ### Same run, compared to itself with a halved baseline
+    halved = SuiteResult(
+        timings={
+            k: Timing(**{**asdict(t), "median_s": t.median_s / 2})
+            for k, t in result.timings.items()
+        },
+        meta=result.meta,
+    )
+    print(compare(halved, result))
@@ -0,0 +1,74 @@
+import argparse
+import importlib
+import sys
+
+
+# ================================================================== #
+# === CLI wiring                                                     #
+# ================================================================== #
+
+CMD_NAME = "cache"  # < Name of the command, used in CLI
+CMD_ALIASES = ["c"]  # < Alias shortcut of the command
+DOC = f"Inspect the local data cache of a dataset package. Aliases: {CMD_ALIASES}"
+DOC_VERIFY = "Check every cached file against `pooch_registry.txt` in parallel, report missing, corrupt and stale files. Exits 1 if the cache is not intact."
+
+
+def _add_my_parser(subparsers: argparse._SubParsersAction) -> None:
+    p: argparse.ArgumentParser = subparsers.add_parser(
+        name=CMD_NAME,
+        aliases=CMD_ALIASES,
+        description=DOC,
+        help=DOC,
+    )
+    actions = p.add_subparsers(dest="action", required=True)
+
+    ### verify
+    v = actions.add_parser("verify", description=DOC_VERIFY, help=DOC_VERIFY)
+    v.add_argument("package", help="Dataset package, e.g. neddata.abbey")
+    v.add_argument(
+        "patterns",
+        nargs="*",
+        default=None,
+        help="Glob patterns over catalogue keys (default: whole registry, "
+        "including stale files)",
+    )
+    v.add_argument(
+        "-j", "--workers", type=int, default=8, help="Parallel hashing"
+    )
+    v.add_argument(
+        "--refetch",
+        action="store_true",
+        help="Download missing and corrupt files again",
+    )
+    v.add_argument(
+        "--prune",
+        action="store_true",
+        help="Delete stale files (cached, but not in the registry)",
+    )
+    v.add_argument("-q", "--quiet", action="store_true")
+    # > Entrypoint, retrieved as args.func in cli.py
+    v.set_defaults(func=_run_verify)
+
+
+def _run_verify(args: argparse.Namespace) -> None:
+
+    ### Add "neddata." prefix if not present
+    if not args.package.startswith("neddata."):
+        args.package = "neddata." + args.package
+    cat = importlib.import_module(f"{args.package}.catalog").cat
+
+    ### Verify, print one line per file that is not fine
+    def progress(fname: str, status: str) -> None:
+        if status != "verified" and not args.quiet:
+            print(f"{status:>9}: {fname}", file=sys.stderr)
+
+    report = cat.verify(
+        args.patterns or None,
+        workers=args.workers,
+        refetch=args.refetch,
+        prune=args.prune,
+        progress=progress,
+    )
+    print(report)
+    if not report.ok:
+        sys.exit(1)
@@ -0,0 +1,121 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import textwrap
+
+from typing import Sequence
+
+
+# ================================================================== #
+# === CLI wiring                                                     #
+# ================================================================== #
+
+CMD_NAME = "importtime"  # < Name of the command, used in CLI
+CMD_ALIASES = ["imp"]  # < Alias shortcut of the command
+DOC = f"Benchmark cold-start import time of modules in fresh interpreters, e.g. `neddata` or `neddata:abbey_catalog` (also accesses the attribute). Aliases: {CMD_ALIASES}"
+
+
+def _add_my_parser(subparsers: argparse._SubParsersAction) -> None:
+    p: argparse.ArgumentParser = subparsers.add_parser(
+        name=CMD_NAME,
+        aliases=CMD_ALIASES,
+        description=DOC,
+        help=DOC,
+    )
+    p.add_argument(
+        "targets",
+        nargs="*",
+        default=["neddata"],
+        help="Modules to import, `module:attr` also accesses an attribute",
+    )
+    p.add_argument("-n", "--repeat", type=int, default=5)
+    p.add_argument(
+        "--top", type=int, default=10, help="Show the N slowest imports"
+    )
+    # > Entrypoint, retrieved as args.func in cli.py
+    p.set_defaults(func=_run)
+
+
+def _run(args: argparse.Namespace) -> None:
+    for target in args.targets:
+        print(format_report(measure_import(target, repeat=args.repeat), args.top))
+
+
+# ================================================================== #
+# === Measure                                                        #
+# ================================================================== #
+
+
+def _code(target: str) -> str:
+    """Python snippet that imports *target* and prints elapsed seconds."""
+    module, _, attr = target.partition(":")
+    access = f"getattr(m, {attr!r})" if attr else "None"
+    return textwrap.dedent(
+        f"""
+        import importlib, time
+        t = time.perf_counter()
+        m = importlib.import_module({module!r}); {access}
+        print(time.perf_counter() - t)
+        """
+    )
+
+
+def _parse_importtime(stderr: str) -> list[tuple[int, str]]:
+    """Parse `-X importtime` output into (cumulative µs, module) tuples."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    return rows
+
+
+def measure_import(
+    target: str = "neddata",
+    repeat: int = 5,
+    python: str = sys.executable,
+) -> dict:
+    """Import *target* in *repeat* fresh interpreters.
+
+    :return: dict with per-run seconds and the slowest imports (µs,
+        cumulative) of one extra run under ``python -X importtime``.
+    """
+    code = _code(target)
+    seconds = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [python, "-c", code], capture_output=True, text=True, check=True
+        )
+        seconds.append(float(out.stdout.strip().splitlines()[-1]))
+    ### One more run for the per-module breakdown
+    out = subprocess.run(
+        [python, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = sorted(_parse_importtime(out.stderr), reverse=True)
+    return {
+        "target": target,
+        "seconds": seconds,
+        "median_s": statistics.median(seconds),
+        "min_s": min(seconds),
+        "modules": modules,
+    }
+
+
+def format_report(result: dict, top: int = 10) -> str:
+    lines = [
+        f"=== {result['target']}: median {result['median_s'] * 1000:.1f} ms, "
+        f"min {result['min_s'] * 1000:.1f} ms ({len(result['seconds'])} runs)"
+    ]
+    for cumulative, name in result["modules"][:top]:
+        lines.append(f"  {cumulative / 1000:8.1f} ms  {name}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(format_report(measure_import("neddata")))
+    print(format_report(measure_import("neddata:abbey_catalog")))
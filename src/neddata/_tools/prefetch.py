@@ -0,0 +1,58 @@
+import argparse
+import importlib
+import sys
+
+
+# ================================================================== #
+# === CLI wiring                                                     #
+# ================================================================== #
+
+CMD_NAME = "prefetch"  # < Name of the command, used in CLI
+CMD_ALIASES = ["pre"]  # < Alias shortcut of the command
+DOC = f"Download and verify all files of a dataset package in parallel, e.g. to warm CI images or compute nodes. Aliases: {CMD_ALIASES}"
+
+
+def _add_my_parser(subparsers: argparse._SubParsersAction) -> None:
+    p: argparse.ArgumentParser = subparsers.add_parser(
+        name=CMD_NAME,
+        aliases=CMD_ALIASES,
+        description=DOC,
+        help=DOC,
+    )
+    p.add_argument("package", help="Dataset package, e.g. neddata.abbey")
+    p.add_argument(
+        "patterns",
+        nargs="*",
+        default=["*"],
+        help="Glob patterns over catalogue keys, e.g. 'kdb/*' (default: all)",
+    )
+    p.add_argument(
+        "-j", "--workers", type=int, default=8, help="Parallel downloads"
+    )
+    p.add_argument("-q", "--quiet", action="store_true")
+    # > Entrypoint, retrieved as args.func in cli.py
+    p.set_defaults(func=_run)
+
+
+def _run(args: argparse.Namespace) -> None:
+
+    ### Add "neddata." prefix if not present
+    if not args.package.startswith("neddata."):
+        args.package = "neddata." + args.package
+    cat = importlib.import_module(f"{args.package}.catalog").cat
+
+    ### Prefetch, print one line per file
+    done = 0
+
+    def progress(fname: str, error: BaseException | None) -> None:
+        nonlocal done
+        done += 1
+        if error is not None:
+            print(f"[{done}] ✗ {fname}: {error}", file=sys.stderr)
+        elif not args.quiet:
+            print(f"[{done}] ✓ {fname}", file=sys.stderr)
+
+    report = cat.prefetch(args.patterns, workers=args.workers, progress=progress)
+    print(report)
+    if not report.ok:
+        sys.exit(1)
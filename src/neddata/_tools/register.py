@@ -22,6 +22,19 @@ def _add_my_parser(subparsers: argparse._SubParsersAction) -> None:
         help=DOC,
     )
     p.add_argument("package", help="Dataset package, e.g. neddata.abbey")
+    p.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes hashing changed files (default: all cores)",
+    )
+    p.add_argument(
+        "--no-memo",
+        dest="memo",
+        action="store_false",
+        help="Re-hash every file, ignoring memoized hashes",
+    )
     # > Entrypoint, retrieved as args.func in cli.py
     p.set_defaults(func=_run)
 
@@ -37,4 +50,4 @@ def _run(args: argparse.Namespace) -> None:
     assert_editable("neddata")
 
     ### Register
-    make_pooch_registry(pkg_path)
+    make_pooch_registry(pkg_path, workers=args.workers, memo=args.memo)
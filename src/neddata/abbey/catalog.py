@@ -1,9 +1,14 @@
 """Loads datasets"""
 
 # %%
+from __future__ import annotations
+
 from pathlib import Path
 
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 ### Local Imports
 from neddata import datamodel as dm
@@ -51,6 +56,7 @@ cat = dm.Catalog(
     DATASET,
     dir_patterns=DATADIR_PATTERNS,
     pooch=POOCHY,
+    columnar="parquet",  # < Sidecars skip re-parsing (needs pyarrow)
 )
 
 if __name__ == "__main__":
@@ -69,16 +75,20 @@ if __name__ == "__main__":
 @cat.set_loader("Regests/2_ben-Cist Identifizierungen.csv")
 def load_ben_cist_data(path: Path) -> pd.DataFrame:
     """Import CSV file that ignores the separator in the last column."""
-    ### Read the whole file as plain text, one Python string per line
-    with open(path, "r", encoding="utf-8") as f:
-        lines = f.read().splitlines()
-    ### Split each line at the first 6 semicolons only
-    rows = [line.split(";", 6) for line in lines]
-    columns = rows[0]  # < first line is the header
-    rows = rows[1:]  # < remove header from data
-    ### Build the DataFrame and name your columns
-    df = pd.DataFrame(rows, columns=columns).drop_duplicates()
-    return df
+    ### Split each line at the first 6 semicolons only, drop repeated rows
+    return u.fileio.load_bounded_split(
+        path, sep=";", maxsplit=6, drop_duplicates=True
+    )
+
+
+@cat.set_chunker("Regests/2_ben-Cist Identifizierungen.csv")
+def iterchunks_ben_cist_data(
+    path: Path, chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """Stream the file in chunks, split like :func:`load_ben_cist_data`."""
+    return u.fileio.iterchunks_bounded_split(
+        path, chunksize, sep=";", maxsplit=6, drop_duplicates=True
+    )
 
 
 if __name__ == "__main__":
@@ -101,9 +111,11 @@ if __name__ == "__main__":
 
 # %%
 @cat.set_loader("KDB/KDB*.csv")
-def load_utf8_csv(path: Path) -> pd.DataFrame:
+def load_utf8_csv(path: Path, dtype: Any = None) -> pd.DataFrame:
     """Load a CSV file with UTF-8 encoding."""
-    df = pd.read_csv(path, encoding="utf-8", sep=";")
+    import pandas as pd
+
+    df = pd.read_csv(path, encoding="utf-8", sep=";", dtype=dtype)
     ### Convert Lon and Lat to numeric if they exist
     if all(col in df.columns for col in ["Lon", "Lat"]):
         u.pd.lon_lat_to_numeric(df=df, columns=["Lon", "Lat"])
@@ -117,6 +129,23 @@ if __name__ == "__main__":
     df = cat.load(_key)
     display(df.head())
 
+
+# %%
+@cat.set_chunker("KDB/KDB*.csv")
+def iterchunks_utf8_csv(path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Stream a KDB CSV in chunks, converted like :func:`load_utf8_csv`."""
+    for df in u.fileio.iterchunks_csv(
+        path, chunksize, encoding="utf-8", sep=";"
+    ):
+        if all(col in df.columns for col in ["Lon", "Lat"]):
+            u.pd.lon_lat_to_numeric(df=df, columns=["Lon", "Lat"])
+        yield df
+
+
+if __name__ == "__main__":
+    for chunk in cat.iter_chunks("KDB/KDB_complete_2.csv", chunksize=1000):
+        print(chunk.shape, chunk["Lon"].dtype)
+
     # %%
     _key = "KDB/KDB_ben-cist.csv"
     print(cat[_key].path)  # < Print the path to the file
@@ -126,3 +155,62 @@ if __name__ == "__main__":
     _key = "KDB/KDB_complete_2.csv"
     print(cat[_key].path)  # < Print the path to the file
     print(cat[_key].loader)  # type: ignore
+
+
+# %%
+# =====================================================================
+# === Schemas: Declared dtypes per file
+# =====================================================================
+# > Repetitive text becomes categorical, unique text arrow strings, and
+# > numbers get explicit widths, so chunks of iter_chunks() agree with
+# > each other. See neddata.schema for the dtype strings.
+
+cat.set_schema(
+    "KDB/KDB*.csv",
+    {
+        "id_gsn": "int32",  # < 5-digit GSN ids
+        "monastery_name": "string[pyarrow]",
+        "Lon": "float32",  # < ~0.1 m at these coordinates
+        "Lat": "float32",
+        "Standort": "string[pyarrow]",
+        "diocese": "category",
+        "order_name": "category",
+        "order_begin_tpq": "Int16",  # < Years, missing in some files
+        "order_end_tpq": "Int16",
+        "alt_label_diocese": "category",
+        "RG_Abkuerzung": "category",
+        "id_order": "int16",
+    },
+)
+
+cat.set_schema(
+    "Regests/2_ben-Cist Identifizierungen.csv",
+    {
+        "id_RG": "string[pyarrow]",
+        "Kloster_ID": "string[pyarrow]",
+        "Quellenname": "category",
+        "Quellenname_status": "category",
+        "RG_ID_all": "string[pyarrow]",
+        "url_RG": "string[pyarrow]",
+        "complete_no_tags": "string[pyarrow]",
+    },
+)
+
+cat.set_schema(
+    "Regests/2_Ben-Cist.xlsx",
+    {
+        "id_RG_all": "string[pyarrow]",
+        "complete_no_tags": "string[pyarrow]",
+        "url_RG": "string[pyarrow]",
+        "date_min_norm": "string[pyarrow]",
+        "date_max_norm": "string[pyarrow]",
+    },
+)
+
+if __name__ == "__main__":
+    for _key in [
+        "KDB/KDB_complete.csv",
+        "Regests/2_Ben-Cist_Identifizierungen.csv",
+        "Regests/2_Ben-Cist.xlsx",
+    ]:
+        print(cat.schema_report(_key))
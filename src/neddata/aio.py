@@ -0,0 +1,153 @@
+"""Asyncio-native fetching for Catalog.aload():
+- afetch(): Download a registry file without blocking the event loop
+- open_session(): Shared HTTP session for many afetch() calls
+
+Downloads stream over aiohttp (optional dependency) and are verified with
+pooch's own hash check, mirroring pooch.Pooch.fetch(): Existing files are
+re-hashed (unless verified before and unchanged, see
+:func:`neddata.cache.fetch_verified`) and updated on mismatch, downloads
+land in a temporary file and are only moved into the cache if the hash
+matches. Without aiohttp, pooch.fetch() runs in a worker thread instead.
+"""
+
+# %%
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.util
+import os
+from pathlib import Path
+
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+if TYPE_CHECKING:
+    import pooch
+
+
+CHUNK_SIZE = 1 << 16  # < 64 KiB per read from the socket
+
+
+def aiohttp_available() -> bool:
+    """Check whether aiohttp is installed, without importing it."""
+    return importlib.util.find_spec("aiohttp") is not None
+
+
+@contextlib.asynccontextmanager
+async def open_session() -> AsyncIterator[Any]:
+    """Yield an ``aiohttp.ClientSession``, or None if aiohttp is missing."""
+    if not aiohttp_available():
+        yield None
+        return
+    import aiohttp
+
+    async with aiohttp.ClientSession(trust_env=True) as session:  # < Proxies
+        yield session
+
+
+# =====================================================================
+# === Fetch
+# =====================================================================
+
+
+async def afetch(
+    poochy: pooch.Pooch,
+    fname: str,
+    session: Any = None,
+    semaphore: asyncio.Semaphore | None = None,
+    strict: bool = False,
+) -> Path:
+    """Async counterpart of ``poochy.fetch(fname)``.
+
+    :param session: From :func:`open_session`, None falls back to a thread.
+    :param semaphore: Bounds the number of concurrent downloads.
+    :param strict: Always re-hash existing files.
+    """
+    from neddata import instrument
+    from neddata.cache import fetch_verified, is_verified, mark_verified
+
+    semaphore = semaphore or asyncio.Semaphore(1)
+    if session is None:
+        async with semaphore:
+            return await asyncio.to_thread(
+                fetch_verified, poochy, fname, strict
+            )
+
+    from pooch.hashes import hash_matches
+
+    known_hash = poochy.registry[fname]
+    local = Path(poochy.abspath) / fname
+    if not strict and is_verified(poochy, fname, local):
+        return local  # !! Verified before, unchanged since
+    ### Existing file: Verify in a thread (hashing is CPU/disk bound)
+    if local.exists():
+        with instrument.stage("verify"):
+            up_to_date = await asyncio.to_thread(
+                hash_matches, str(local), known_hash
+            )
+        if up_to_date:
+            mark_verified(poochy, fname, local)
+            return local  # !! Up to date
+    ### (Re-)Download with retries, like pooch.core.stream_download()
+    import aiohttp
+
+    url = poochy.get_url(fname)
+    retryable = (ValueError, aiohttp.ClientError, asyncio.TimeoutError)
+    attempts = 1 + poochy.retry_if_failed
+    for i in range(attempts):
+        try:
+            async with semaphore:
+                await _adownload(url, local, known_hash, session)
+            instrument.note(bytes_downloaded=local.stat().st_size)
+            mark_verified(poochy, fname, local)
+            break
+        except retryable:
+            if i == attempts - 1:
+                raise
+            await asyncio.sleep(min(i + 1, 10))  # < Same backoff as pooch
+    return local
+
+
+async def _adownload(
+    url: str, local: Path, known_hash: str | None, session: Any
+) -> None:
+    """Stream *url* to a temporary file, check the hash, then move it."""
+    from pooch.hashes import hash_matches
+
+    from neddata import instrument
+
+    local.parent.mkdir(parents=True, exist_ok=True)
+    task_id = id(asyncio.current_task())
+    tmp = local.with_name(f".{local.name}.{os.getpid()}-{task_id}")
+    try:
+        with instrument.stage("download"):
+            async with session.get(url) as response:
+                response.raise_for_status()
+                with open(tmp, "wb") as f:
+                    async for chunk in response.content.iter_chunked(
+                        CHUNK_SIZE
+                    ):
+                        f.write(chunk)
+        ### Raises ValueError on mismatch, same message as pooch
+        with instrument.stage("verify"):
+            await asyncio.to_thread(
+                hash_matches,
+                str(tmp),
+                known_hash,
+                strict=True,
+                source=local.name,
+            )
+        os.replace(tmp, local)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    from neddata import abbey_catalog as cat
+
+    async def _demo() -> None:
+        async with open_session() as session:
+            p = await afetch(cat.pooch, "KDB/KDB_Ben-Cist.csv", session)
+            print(p)
+
+    asyncio.run(_demo())
@@ -0,0 +1,728 @@
+"""Caching layers for loaded resources:
+- LoadCache: In-memory LRU cache of loaded objects with a byte budget
+- Columnar sidecars: Parquet/Feather copies of parsed DataFrames on disk
+- FileHashMemo: sha256 of files, re-hashed only when their stat changes
+"""
+
+# %%
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Literal,
+    Sequence,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pooch
+
+    from neddata.schema import Schema
+
+
+### Derived artifacts live in hidden folders next to the pooch cache entries
+DERIVED_DIRNAME = ".neddata"
+
+
+# =====================================================================
+# === Size Estimation
+# =====================================================================
+
+
+def estimate_nbytes(obj: Any, _depth: int = 0) -> int:
+    """Estimate the memory footprint of a loaded object in bytes.
+
+    DataFrames/Series report their deep memory usage, arrays their buffer
+    size. Containers (dict, list, tuple) are summed recursively; deeply
+    nested structures are only approximated below a fixed depth.
+    """
+    ### pandas objects (checked by duck-typing to avoid importing pandas)
+    memory_usage = getattr(obj, "memory_usage", None)
+    if callable(memory_usage) and hasattr(obj, "index"):
+        usage = memory_usage(deep=True)  # < Series for frames, int for series
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    ### numpy arrays
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    ### Containers
+    size = sys.getsizeof(obj)
+    if _depth > 4:
+        return size  # !! Stop descending, good enough for a budget
+    if isinstance(obj, dict):
+        size += sum(
+            estimate_nbytes(k, _depth + 1) + estimate_nbytes(v, _depth + 1)
+            for k, v in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_nbytes(v, _depth + 1) for v in obj)
+    return size
+
+
+if __name__ == "__main__":
+    import numpy as np
+    import pandas as pd
+
+    print(estimate_nbytes(np.zeros(1000)))  # < 8000
+    print(estimate_nbytes(pd.DataFrame({"a": ["x" * 100] * 10})))
+    print(estimate_nbytes({"a": [1, 2, 3], "b": "text"}))
+
+
+# =====================================================================
+# === Views: Protect cached objects from callers
+# =====================================================================
+
+View = Literal["copy", "cow", "readonly"]
+
+
+def _is_pandas(obj: Any) -> bool:
+    return type(obj).__module__.startswith("pandas.") and hasattr(obj, "index")
+
+
+def _is_ndarray(obj: Any) -> bool:
+    return type(obj).__module__ == "numpy" and hasattr(obj, "setflags")
+
+
+def _pandas_cow_enabled() -> bool:
+    """Copy-on-Write is opt-in for pandas 2.x and the default for pandas 3."""
+    import pandas as pd
+
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return bool(pd.get_option("mode.copy_on_write"))
+
+
+def _freeze(obj: Any) -> Any:
+    """Return *obj* with its numpy buffers marked as non-writeable, so that
+    in-place writes through *any* view raise ``ValueError``.
+
+    pandas objects are copied once first: The copy consolidates the columns
+    into fresh buffers, otherwise existing (writeable) views would survive.
+    """
+    if _is_ndarray(obj):
+        arrays = [obj]
+    elif _is_pandas(obj):
+        obj = obj.copy()
+        frame = obj.to_frame() if obj.ndim == 1 else obj
+        arrays = [frame[c].to_numpy(copy=False) for c in frame.columns]
+    else:
+        return obj
+    for arr in arrays:
+        ### Walk up to the buffer owner, views inherit its flags
+        while _is_ndarray(arr):
+            arr.setflags(write=False)
+            arr = arr.base
+    return obj
+
+
+def make_view(obj: Any, view: View) -> Any:
+    """Hand out a cached object so that callers cannot corrupt each other.
+
+    :param view:
+        - ``"copy"``: Deep copy (always safe, costs one copy per hit).
+        - ``"cow"``: Shallow copy of pandas objects, isolated by pandas'
+          Copy-on-Write. Falls back to a deep copy if CoW is disabled.
+        - ``"readonly"``: Arrays and DataFrames share the cached (frozen)
+          buffers; in-place writes raise ``ValueError``. Other mutable
+          objects (dict, list) are deep-copied.
+    """
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return obj  # < Immutable anyway
+    if view == "readonly":
+        if _is_ndarray(obj):
+            return obj.view()
+        if _is_pandas(obj):
+            return obj.copy(deep=False)
+    elif view == "cow":
+        if _is_pandas(obj) and _pandas_cow_enabled():
+            return obj.copy(deep=False)
+    elif view != "copy":
+        raise ValueError(
+            f"Unknown view '{view}', choose from 'copy', 'cow', 'readonly'."
+        )
+    if hasattr(obj, "copy") and (_is_pandas(obj) or _is_ndarray(obj)):
+        return obj.copy()  # < Faster than deepcopy for array-likes
+    return copy.deepcopy(obj)
+
+
+# =====================================================================
+# === LoadCache
+# =====================================================================
+
+
+@dataclass
+class _Entry:
+    value: Any
+    nbytes: int
+
+
+class LoadCache:
+    """Thread-safe in-memory LRU cache for loaded resources with a byte budget.
+
+    Entries are keyed by the caller (usually ``(key, sha256, loader)``), so
+    a changed registry hash simply misses and the stale entry is evicted
+    over time. Objects larger than the whole budget are never cached.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 1 << 30,  # < 1 GiB
+        view: View = "copy",
+    ) -> None:
+        if view not in ("copy", "cow", "readonly"):
+            raise ValueError(
+                f"Unknown view '{view}', choose from 'copy', 'cow', 'readonly'."
+            )
+        self.max_bytes = max_bytes
+        self.view: View = view
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        ### Statistics
+        self.hits = 0
+        self.misses = 0
+
+    # =================================================================
+    # === Get & Put
+    # =================================================================
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a view of the cached object or *default* on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)  # < Mark as recently used
+            self.hits += 1
+        return make_view(entry.value, self.view)
+
+    def put(self, key: Hashable, value: Any) -> Any:
+        """Store *value* and return a view of it for the caller."""
+        nbytes = estimate_nbytes(value)
+        if nbytes > self.max_bytes:
+            return value  # !! Too large to cache, caller owns it
+        if self.view == "readonly":
+            value = _freeze(value)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = _Entry(value=value, nbytes=nbytes)
+            self._nbytes += nbytes
+            self._evict()
+        return make_view(value, self.view)
+
+    # =================================================================
+    # === Eviction
+    # =================================================================
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until we fit the budget."""
+        while self._nbytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._nbytes -= entry.nbytes
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry.nbytes
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Remove *key*, or every entry whose key tuple starts with *key*.
+        Without *key*, clear the cache."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._nbytes = 0
+                return
+            for k in list(self._entries):
+                if k == key or (isinstance(k, tuple) and k[:1] == (key,)):
+                    self._discard(k)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    # =================================================================
+    # === Representation
+    # =================================================================
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes held by the cache."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}(entries={len(self)}, "
+            f"nbytes={self._nbytes:,}/{self.max_bytes:,}, view='{self.view}', "
+            f"hits={self.hits}, misses={self.misses})>"
+        )
+
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    c = LoadCache(max_bytes=4_000, view="readonly")
+    df = c.put(("a", "sha"), pd.DataFrame({"x": range(100)}))
+    print(c)
+    try:
+        df.loc[0, "x"] = -1  # !! Raises, buffers are frozen
+    except ValueError as e:
+        print(e)
+    c.put(("b", "sha"), pd.DataFrame({"x": range(400)}))  # < Evicts "a"
+    print(c, ("a", "sha") in c)
+
+
+# =====================================================================
+# === Columnar Sidecars
+# =====================================================================
+# > Parsed DataFrames are written once as Parquet/Feather next to the
+# > source in the pooch cache. Later loads read the columnar copy and skip
+# > the parser (and even the download/hash check of the source).
+# > Frames that Arrow can't store losslessly (e.g. object columns mixing
+# > int and str, typical for xlsx) get no sidecar and are parsed on every
+# > load. No pickle fallback: The cache dir may be shared, and unpickling
+# > a file planted there runs its code.
+# !! Requires pyarrow (optional dependency); without it, sidecars are off.
+
+ColumnarFormat = Literal["parquet", "feather"]
+_SIDECAR_META = b"neddata"
+
+
+def columnar_available() -> bool:
+    """Check whether pyarrow is installed, without importing it."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+### Bump to invalidate all sidecars, e.g. when a helper that loaders call
+### (lon_lat_to_numeric, load_bounded_split, ...) changes its output
+SIDECAR_VERSION = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _runtime_token() -> str:
+    """Versions that change parsed frames without changing a loader's
+    source: neddata (helpers the loaders call), pandas and pyarrow."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    parts = [f"sidecar={SIDECAR_VERSION}"]
+    for dist in ("neddata", "pandas", "pyarrow"):
+        try:
+            parts.append(f"{dist}={version(dist)}")
+        except PackageNotFoundError:
+            parts.append(f"{dist}=-")
+    return " ".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def loader_token(loader: Callable[..., Any]) -> str:
+    """Short hash identifying a loader by its name, its source code and
+    the runtime (see :data:`SIDECAR_VERSION`). Sidecars live in the pooch
+    cache and survive upgrades, so editing a loader, upgrading neddata,
+    pandas or pyarrow, or bumping SIDECAR_VERSION invalidates them."""
+    try:
+        src = inspect.getsource(loader)
+    except (OSError, TypeError):
+        code = getattr(loader, "__code__", None)
+        src = code.co_code.hex() if code is not None else repr(loader)
+    ident = f"{loader.__module__}.{loader.__qualname__}\n{src}"
+    ident = f"{ident}\n{_runtime_token()}"
+    return hashlib.sha256(ident.encode()).hexdigest()[:12]
+
+
+def sidecar_path(
+    path_local: Path,
+    sha256: str,
+    loader: Callable[..., Any],
+    fmt: ColumnarFormat = "parquet",
+    schema: Schema | None = None,
+) -> Path:
+    """``<dir>/.neddata/<name>.<sha256[:16]>.<loader_token>.<fmt>``, with
+    ``-<schema.token>`` after the loader token if a schema is given."""
+    token = loader_token(loader)
+    if schema is not None:
+        token = f"{token}-{schema.token}"
+    fname = f"{path_local.name}.{sha256[:16]}.{token}.{fmt}"
+    return path_local.parent / DERIVED_DIRNAME / fname
+
+
+def find_sidecar(path: Path) -> Path | None:
+    """Return *path* if its sidecar was written."""
+    return path if path.is_file() else None
+
+
+def _null_sentinels(df: pd.DataFrame) -> dict[str, str] | None:
+    """Arrow returns missing strings as None, pandas parsers produce NaN.
+    Record which one each object column used, None if a column mixes them."""
+    sentinels: dict[str, str] = {}
+    for col in df.columns[df.dtypes == object]:
+        na = df[col][df[col].isna()]
+        kinds = {type(v).__name__ for v in na}
+        if not kinds:
+            continue
+        if kinds == {"float"}:
+            sentinels[col] = "nan"
+        elif kinds == {"NoneType"}:
+            sentinels[col] = "none"
+        else:
+            return None  # !! Mixed or pd.NA, roundtrip is not exact
+    return sentinels
+
+
+def _read_arrow(
+    path: Path, fmt: str, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
+    import numpy as np
+
+    if fmt == "feather":
+        from pyarrow import feather
+
+        if columns is not None:
+            import pyarrow as pa
+
+            with pa.OSFile(str(path)) as f:
+                names = pa.ipc.open_file(f).schema.names
+            columns = [c for c in columns if c in names]
+        table = feather.read_table(path, columns=columns)
+    else:
+        import pyarrow.parquet as pq
+
+        if columns is not None:
+            names = pq.read_schema(path).names
+            columns = [c for c in columns if c in names]
+        table = pq.read_table(path, columns=columns)
+    df = table.to_pandas()
+    if columns is not None:
+        df = df[columns]  # < Feather keeps the file's order
+    meta = json.loads((table.schema.metadata or {}).get(_SIDECAR_META, b"{}"))
+    for col, sentinel in meta.get("nulls", {}).items():
+        if sentinel == "nan" and col in df.columns:
+            df[col] = df[col].where(df[col].notna(), np.nan)
+    ### Arrow returns "string[python]", whatever the storage was
+    for col in meta.get("arrow_strings", []):
+        if col in df.columns:
+            df[col] = df[col].astype("string[pyarrow]")
+    return df
+
+
+def read_sidecar(
+    path: Path, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
+    """Read a sidecar written by :func:`write_sidecar`.
+
+    :param columns: Only these columns (those present), None = all
+    """
+    return _read_arrow(path, fmt=path.suffix[1:], columns=columns)
+
+
+def _frames_identical(a: pd.DataFrame, b: pd.DataFrame) -> bool:
+    return (
+        a.columns.equals(b.columns)
+        and a.index.equals(b.index)
+        and a.dtypes.equals(b.dtypes)
+        and a.equals(b)
+    )
+
+
+def _write_arrow(df: pd.DataFrame, path: Path, fmt: str) -> None:
+    """Write *df* with pyarrow, raise TypeError if it's not lossless."""
+    import pyarrow as pa
+
+    sentinels = _null_sentinels(df)
+    if sentinels is None or not all(isinstance(c, str) for c in df.columns):
+        raise TypeError("DataFrame can't be stored losslessly by Arrow")
+    try:
+        table = pa.Table.from_pandas(df)
+    except pa.ArrowException as e:
+        raise TypeError("DataFrame can't be converted to Arrow") from e
+    arrow_strings = [
+        col
+        for col, dtype in df.dtypes.items()
+        if getattr(dtype, "storage", None) == "pyarrow"
+    ]
+    meta = {
+        **(table.schema.metadata or {}),
+        _SIDECAR_META: json.dumps(
+            {"nulls": sentinels, "arrow_strings": arrow_strings}
+        ).encode(),
+    }
+    table = table.replace_schema_metadata(meta)
+    if fmt == "feather":
+        from pyarrow import feather
+
+        feather.write_feather(table, path)
+    else:
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, path)
+    ### Verify roundtrip before publishing the sidecar
+    if not _frames_identical(df, _read_arrow(path, fmt)):
+        raise TypeError("DataFrame changed during Arrow roundtrip")
+
+
+def write_sidecar(df: Any, path: Path) -> Path | None:
+    """Write *df* as columnar sidecar at *path*, atomically. Returns the
+    written path, or None for non-DataFrames, without pyarrow, or if the
+    Arrow roundtrip isn't exact."""
+    import pandas as pd
+
+    if not isinstance(df, pd.DataFrame) or not columnar_available():
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ### Unique temp file per process & thread, published by os.replace()
+    tmp = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}")
+    try:
+        try:
+            _write_arrow(df, tmp, fmt=path.suffix[1:])
+        except TypeError:
+            return None  # < Parsed again on every load
+        os.replace(tmp, path)  # < Atomic, safe for concurrent writers
+        return path
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+# =====================================================================
+# === File Hash Memo
+# =====================================================================
+# > Hashing every file of a dataset on every run is what makes registering
+# > slow. The memo remembers sha256 per (path, size, mtime_ns, inode) and
+# > only files whose stat changed are hashed again, in a process pool.
+
+
+def user_cache_dir() -> Path:
+    """``$XDG_CACHE_HOME/neddata`` (default ``~/.cache/neddata``)."""
+    cache_home = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_home / "neddata"
+
+
+def _stat_key(st: os.stat_result) -> tuple[int, int, int]:
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def _sha256_file(path: str) -> str:
+    """Top-level (picklable) hash function for the process pool."""
+    import pooch
+
+    return pooch.file_hash(path)  # < Same chunking & algorithm as pooch
+
+
+class FileHashMemo:
+    """Persistent memo ``(path, size, mtime_ns, inode) -> sha256`` in an
+    SQLite database. Safe to share between threads and processes."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS hashes (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            sha256 TEXT NOT NULL
+        )
+    """
+
+    def __init__(self, db: Path | None = None) -> None:
+        self.db = Path(db) if db else user_cache_dir() / "hashes.sqlite"
+        self.db.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db, timeout=30, check_same_thread=False
+        )
+        with self._lock, self._conn:
+            self._conn.execute(self._SCHEMA)
+
+    def __repr__(self) -> str:
+        return f"FileHashMemo('{self.db}')"
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, path: Path, st: os.stat_result | None = None) -> str | None:
+        """Memoized sha256 of *path*, None if unknown or changed since."""
+        path = Path(path).absolute()
+        st = st or path.stat()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, inode, sha256 FROM hashes WHERE path = ?",
+                (str(path),),
+            ).fetchone()
+        if row is None or tuple(row[:3]) != _stat_key(st):
+            return None
+        return row[3]
+
+    def put_many(
+        self, entries: Iterable[tuple[Path, os.stat_result, str]]
+    ) -> None:
+        rows = [
+            (str(Path(p).absolute()), *_stat_key(st), sha)
+            for p, st, sha in entries
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?)", rows
+            )
+
+    def put(self, path: Path, sha256: str, st: os.stat_result | None = None) -> None:
+        self.put_many([(path, st or Path(path).stat(), sha256)])
+
+    def hash_files(
+        self, paths: Iterable[Path], workers: int | None = None
+    ) -> tuple[dict[Path, str], list[Path]]:
+        """sha256 of every file in *paths*. Files that changed since they
+        were memoized (or are new) are hashed in a process pool.
+
+        :param workers: Processes, None = os.cpu_count(), 1 = no pool
+        :return: ``({path: sha256}, [re-hashed paths])``
+        """
+        hashes: dict[Path, str] = {}
+        stale: list[tuple[Path, os.stat_result]] = []
+        for p in paths:
+            st = Path(p).stat()
+            sha = self.get(p, st)
+            if sha is None:
+                stale.append((p, st))
+            else:
+                hashes[p] = sha
+        if len(stale) > 1 and workers != 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                fresh = list(pool.map(_sha256_file, [str(p) for p, _ in stale]))
+        else:
+            fresh = [_sha256_file(str(p)) for p, _ in stale]
+        self.put_many((p, st, sha) for (p, st), sha in zip(stale, fresh))
+        hashes.update((p, sha) for (p, _), sha in zip(stale, fresh))
+        return hashes, [p for p, _ in stale]
+
+
+# === Verified fetch ==================================================
+# > pooch.fetch() re-hashes an already cached file on every call to decide
+# > whether to download it again. A memo per cache directory remembers
+# > files that matched their registry hash: While their stat is unchanged,
+# > fetching them costs one stat() and one SQLite lookup.
+
+VERIFIED_DBNAME = "verified.sqlite"
+_verified_memos: dict[tuple[int, str], FileHashMemo | None] = {}
+_verified_lock = threading.Lock()
+
+
+def verified_memo(root: Path | str) -> FileHashMemo | None:
+    """Memo of verified files in ``<root>/.neddata/``, one per process
+    (SQLite connections must not cross a fork). None if the cache
+    directory is read-only."""
+    key = (os.getpid(), str(root))
+    with _verified_lock:
+        if key not in _verified_memos:
+            try:
+                db = Path(root) / DERIVED_DIRNAME / VERIFIED_DBNAME
+                _verified_memos[key] = FileHashMemo(db)
+            except (OSError, sqlite3.Error):
+                _verified_memos[key] = None  # < Fall back to hashing
+        return _verified_memos[key]
+
+
+def _expected_sha256(known_hash: str | None) -> str | None:
+    """Hex digest of a registry hash (``<hex>`` or ``sha256:<hex>``),
+    None for other algorithms."""
+    if not known_hash:
+        return None
+    alg, _, digest = known_hash.rpartition(":")
+    if alg.lower() not in ("", "sha256"):
+        return None
+    return digest.lower()
+
+
+def is_verified(
+    poochy: pooch.Pooch, fname: str, local: Path | None = None
+) -> bool:
+    """Whether *fname* is cached and unchanged since it last matched its
+    registry hash. Never hashes."""
+    expected = _expected_sha256(poochy.registry.get(fname))
+    memo = verified_memo(poochy.abspath) if expected else None
+    if memo is None:
+        return False
+    local = local or Path(poochy.abspath) / fname
+    try:
+        return memo.get(local) == expected
+    except (OSError, sqlite3.Error):
+        return False
+
+
+def mark_verified(
+    poochy: pooch.Pooch, fname: str, local: Path | None = None
+) -> None:
+    """Record that *fname* matches its registry hash (just checked)."""
+    expected = _expected_sha256(poochy.registry.get(fname))
+    memo = verified_memo(poochy.abspath) if expected else None
+    if memo is None:
+        return
+    try:
+        memo.put(local or Path(poochy.abspath) / fname, expected)
+    except (OSError, sqlite3.Error):
+        pass  # < Only an optimization
+
+
+def fetch_verified(
+    poochy: pooch.Pooch, fname: str, strict: bool = False
+) -> Path:
+    """``poochy.fetch(fname)``, without re-hashing a cached file that was
+    verified before and hasn't changed since (same path, size, mtime_ns,
+    inode and registry hash).
+
+    :param strict: Always re-hash, like plain ``pooch.fetch()``.
+    """
+    from neddata import instrument
+
+    if not strict and is_verified(poochy, fname):
+        return Path(poochy.abspath) / fname
+    local = instrument.timed_fetch(poochy, fname)  # < Downloads or hashes
+    mark_verified(poochy, fname, local)
+    return local
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    import numpy as np
+    import pandas as pd
+
+    df = pd.DataFrame({"a": [1.5, np.nan], "s": ["x", np.nan]})
+    with tempfile.TemporaryDirectory() as tmpdir:
+        p = sidecar_path(Path(tmpdir) / "f.csv", "0" * 64, pd.read_csv)
+        print(write_sidecar(df, p).name)
+        print(read_sidecar(find_sidecar(p)))
+        ### Mixed object columns are not stored losslessly -> None
+        p2 = p.with_name("g.csv" + p.name[5:])
+        print(write_sidecar(pd.DataFrame({"o": [1, "a"]}), p2))
+
+    ### File hash memo: 2nd run re-hashes nothing
+    with tempfile.TemporaryDirectory() as tmpdir:
+        memo = FileHashMemo(Path(tmpdir) / "hashes.sqlite")
+        files = [Path(tmpdir) / f"{i}.bin" for i in range(4)]
+        for f in files:
+            f.write_bytes(os.urandom(1 << 20))
+        print(len(memo.hash_files(files)[1]), len(memo.hash_files(files)[1]))
+        memo.close()
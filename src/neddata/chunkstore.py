@@ -0,0 +1,261 @@
+"""Random-access chunk store for parallel JSON arrays of a RAG index (e.g.
+``chunks.json``, ``chunks_metas.json`` and ``rag_chunks.json`` of
+``KDB_Complete_RAGI``):
+- build_chunk_store(): Merge the arrays once into JSONL with an index
+- ChunkStore: Fetch single records by position or by key (``id_gsn``)
+
+Layout of a store directory:
+- ``records.jsonl``: One JSON object per position, ``{<file stem>: value}``
+- ``offsets.npy``: int64, record *i* is ``records[offsets[i]:offsets[i+1]]``
+- ``keys.npy``: int64, sorted keys of all records that have one
+- ``positions.npy``: int64, position of the record of ``keys[j]``
+
+``records.jsonl`` is memory-mapped, the arrays are opened with
+``np.load(mmap_mode="r")``: Fetching *k* records parses *k* lines, not
+the whole corpus. Keys need not be unique, one monastery can have
+several chunks.
+"""
+
+# %%
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import shutil
+import threading
+from array import array
+from pathlib import Path
+
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+RECORDS_FNAME = "records.jsonl"
+OFFSETS_FNAME = "offsets.npy"
+KEYS_FNAME = "keys.npy"
+POSITIONS_FNAME = "positions.npy"
+
+
+# =====================================================================
+# === Build
+# =====================================================================
+
+
+def _record_key(record: Mapping[str, Any], key: str) -> int | None:
+    """*key* of the first dict-valued field that has it, e.g. the
+    ``id_gsn`` of the metadata."""
+    for value in record.values():
+        if isinstance(value, dict) and key in value:
+            k = value[key]
+            if not isinstance(k, int) or isinstance(k, bool):
+                raise ValueError(f"Key '{key}' must be an integer, got {k!r}")
+            return k
+    return None
+
+
+def build_chunk_store(
+    sources: Mapping[str, Path],
+    dest: Path,
+    key: str | None = "id_gsn",
+    chunksize: int = 1_000,
+) -> Path:
+    """Merge the parallel JSON arrays *sources* into a chunk store at
+    *dest*.
+
+    :param sources: Field name -> JSON file holding a list, all lists
+        must have the same length
+    :param key: Integer field of a dict-valued record (e.g. the metadata)
+        to index, None = only positions
+    """
+    import numpy as np
+
+    from neddata.utils.fileio import iterchunks_json
+
+    ### Write to a temporary dir per process & thread, then rename
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}-{threading.get_ident()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir()
+    try:
+        names = list(sources)
+        offsets = array("q", [0])  # < int64
+        keys, positions = array("q"), array("q")
+        ### Same chunksize for every source, so the chunks line up
+        streams = [iterchunks_json(sources[n], chunksize) for n in names]
+        with open(tmp / RECORDS_FNAME, "wb") as f:
+            for chunks in _zip_equal(streams, names):
+                for values in zip(*chunks):
+                    record = dict(zip(names, values))
+                    line = json.dumps(record, ensure_ascii=False) + "\n"
+                    data = line.encode("utf-8")
+                    f.write(data)
+                    k = _record_key(record, key) if key else None
+                    if k is not None:
+                        keys.append(k)
+                        positions.append(len(offsets) - 1)
+                    offsets.append(offsets[-1] + len(data))
+
+        keys_np = np.frombuffer(keys, dtype=np.int64)
+        order = np.argsort(keys_np, kind="stable")  # < Ties by position
+        np.save(tmp / OFFSETS_FNAME, np.frombuffer(offsets, dtype=np.int64))
+        np.save(tmp / KEYS_FNAME, keys_np[order])
+        np.save(
+            tmp / POSITIONS_FNAME,
+            np.frombuffer(positions, dtype=np.int64)[order],
+        )
+        try:
+            os.rename(tmp, dest)
+        except OSError:
+            if not dest.is_dir():
+                raise
+            # > Another process or thread was faster, its store is identical
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return dest
+
+
+def _zip_equal(
+    streams: Sequence[Iterator[list]], names: Sequence[str]
+) -> Iterator[tuple[list, ...]]:
+    """Zip chunk streams, raise ValueError if the lists differ in length."""
+    while True:
+        chunks = tuple(next(s, None) for s in streams)
+        if all(c is None for c in chunks):
+            return
+        lengths = {len(c) if c is not None else 0 for c in chunks}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"Sources differ in length: {', '.join(names)} are not parallel"
+            )
+        yield chunks
+
+
+# =====================================================================
+# === Read
+# =====================================================================
+
+
+class ChunkStore(Sequence[dict]):
+    """Read-only view of a chunk store. Behaves like the list of records
+    (``len()``, indexing, iteration yield dicts), plus lookup by key."""
+
+    def __init__(self, path: Path) -> None:
+        import numpy as np
+
+        self.path = Path(path)
+        self.offsets: np.ndarray = np.load(
+            self.path / OFFSETS_FNAME, mmap_mode="r"
+        )
+        self.keys: np.ndarray = np.load(self.path / KEYS_FNAME, mmap_mode="r")
+        self.positions: np.ndarray = np.load(
+            self.path / POSITIONS_FNAME, mmap_mode="r"
+        )
+        self._file = open(self.path / RECORDS_FNAME, "rb")
+        ### mmap can't map empty files
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if size
+            else b""
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ChunkStore('{self.path.name}', records={len(self)}, "
+            f"keys={len(self.keys)})"
+        )
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def close(self) -> None:
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> ChunkStore:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # === By position =================================================
+
+    def raw(self, i: int) -> bytes:
+        """Undecoded JSON line of record *i*, e.g. to pass through."""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"Record index out of range: {i}")
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self._mm[start:end]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return json.loads(self.raw(int(i)))
+
+    def __iter__(self) -> Iterator[dict]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def take(self, positions: Iterable[int]) -> list[dict]:
+        """Records at *positions*, e.g. the document ids of a retriever."""
+        return [self[int(i)] for i in positions]
+
+    # === By key ======================================================
+
+    def positions_of(self, key: int) -> np.ndarray:
+        """Positions of the records with *key*, empty if there are none."""
+        lo = self.keys.searchsorted(key, side="left")
+        hi = self.keys.searchsorted(key, side="right")
+        return self.positions[lo:hi]
+
+    def get(self, key: int) -> list[dict]:
+        """Records with *key* (e.g. ``id_gsn``), in stored order.
+
+        :raises KeyError: If no record has *key*
+        """
+        positions = self.positions_of(key)
+        if not len(positions):
+            raise KeyError(key)
+        return self.take(positions)
+
+
+if __name__ == "__main__":
+    import time
+
+    from neddata import abbey_catalog as cat
+
+    # %%
+    ### Build (once) and open the store of the RAGI index
+    ragi = cat["kdb/kdb_complete_ragi/"]
+    t = time.perf_counter()
+    store = ragi.chunk_store()
+    print(store, f"{(time.perf_counter() - t) * 1000:.1f} ms")
+
+    # %%
+    ### Equivalence with the JSON arrays
+    t = time.perf_counter()
+    parsed = {}
+    for fname in ("chunks.json", "chunks_metas.json", "rag_chunks.json"):
+        with open(ragi.path_local / fname, encoding="utf-8") as f:
+            parsed[Path(fname).stem] = json.load(f)
+    print(f"json.load: {(time.perf_counter() - t) * 1000:.1f} ms")
+    records = [dict(zip(parsed, v)) for v in zip(*parsed.values())]
+    ### NaN != NaN, compare the JSON
+    assert json.dumps(list(store)) == json.dumps(records)
+
+    # %%
+    ### k lookups
+    t = time.perf_counter()
+    hits = store.take([3, 1_000, 4_000])
+    print(f"take(3): {(time.perf_counter() - t) * 1000:.3f} ms")
+    print(hits[0]["rag_chunks"])
+    print([r["chunks_metas"]["order_name"] for r in store.get(11)])
@@ -1,11 +1,72 @@
 # neddata/cli.py
 import sys
 import argparse
+import importlib
+from dataclasses import dataclass
 
-from ._tools import register
 
+# =====================================================================
+# === Subcommand Registry
+# =====================================================================
+# > Every command lives in its own module (neddata._tools.<cmd>) that
+# > provides _add_my_parser() and _run(). Only the module of the command
+# > that is actually run gets imported, so `neddata --help` stays fast.
+# => Add new commands here!
 
-def main() -> None:
+
+@dataclass(frozen=True)
+class Command:
+    name: str
+    module: str
+    aliases: tuple[str, ...] = ()
+    help: str = ""
+
+
+COMMANDS: list[Command] = [
+    Command(
+        name="register",
+        module="neddata._tools.register",
+        aliases=("reg",),
+        help="Make or update the `pooch_registry.txt` of a dataset package",
+    ),
+    Command(
+        name="importtime",
+        module="neddata._tools.importtime",
+        aliases=("imp",),
+        help="Benchmark cold-start import time of modules",
+    ),
+    Command(
+        name="prefetch",
+        module="neddata._tools.prefetch",
+        aliases=("pre",),
+        help="Download and verify a dataset package in parallel",
+    ),
+    Command(
+        name="cache",
+        module="neddata._tools.cache",
+        aliases=("c",),
+        help="Inspect the local data cache, e.g. `cache verify`",
+    ),
+    Command(
+        name="bench",
+        module="neddata._tools.bench",
+        aliases=("b",),
+        help="Benchmark loaders & helpers, compare against a baseline",
+    ),
+]
+
+
+def _selected_command(argv: list[str]) -> Command | None:
+    """Return the command named by the first positional argument."""
+    name = next((a for a in argv if not a.startswith("-")), None)
+    for cmd in COMMANDS:
+        if name == cmd.name or name in cmd.aliases:
+            return cmd
+    return None
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
 
     # =================================================================
     # === Build Parser
@@ -22,14 +83,20 @@ def main() -> None:
         dest="cmd", required=True
     )
 
-    ### Edit subparser in place to include script-specific parsers
-    register._add_my_parser(subparsers)
+    ### Full parser only for the selected command, stubs for the others
+    selected = _selected_command(argv)
+    for cmd in COMMANDS:
+        if cmd is selected:
+            module = importlib.import_module(cmd.module)
+            module._add_my_parser(subparsers)
+        else:
+            subparsers.add_parser(cmd.name, aliases=cmd.aliases, help=cmd.help)
 
     # =================================================================
     # === Handle Cases
     # =================================================================
 
-    if len(sys.argv) == 1:  # < Only the program name was entered
+    if not argv:  # < Only the program name was entered
         PARSER.print_help(sys.stderr)
         PARSER.exit(1)
 
@@ -37,7 +104,7 @@ def main() -> None:
     # === Execute
     # =================================================================
 
-    args = PARSER.parse_args()
+    args = PARSER.parse_args(argv)
     # > args.func was set to _run()
     args.func(args)  # < ⚠ pass the Namespace to the handler
 
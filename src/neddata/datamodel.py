@@ -7,14 +7,19 @@ from __future__ import annotations
 from importlib.resources import files
 from importlib.resources.abc import Traversable
 from pathlib import Path
-import fnmatch
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import os
+from dataclasses import dataclass, field
+import functools
+import hashlib
 import difflib
 import textwrap
-
-import pooch
-from rapidfuzz import fuzz
+import threading
+import time
 
 from typing import (
+    TYPE_CHECKING,
     Callable,
     Dict,
     Iterable,
@@ -26,6 +31,31 @@ from typing import (
 )
 
 import neddata.utils as u
+from neddata import instrument
+from neddata.utils.keyindex import KeyIndex, PatternMap, compile_globs
+from neddata.cache import (
+    DERIVED_DIRNAME,
+    LoadCache,
+    View,
+    ColumnarFormat,
+    columnar_available,
+    sidecar_path,
+    find_sidecar,
+    read_sidecar,
+    write_sidecar,
+    fetch_verified,
+    mark_verified,
+)
+
+# > pooch (requests) and rapidfuzz are imported where needed, keeping
+# > `import neddata` cheap for short-lived workers
+if TYPE_CHECKING:
+    import pooch
+
+    from neddata.retrieval import BM25Index
+    from neddata.schema import Schema, SchemaReport
+    from neddata.chunkstore import ChunkStore
+    from neddata.tokenstore import TokenStore
 
 
 # =====================================================================
@@ -79,12 +109,17 @@ example tree structure:
 # === Resource, DataFile, DataDir
 # =====================================================================
 
+_MISSING = object()  # < Sentinel for cache misses (None is a valid object)
+
 
 class Resource:
 
-    def __init__(self, path: Path, pooch: pooch.Pooch) -> None:
+    def __init__(
+        self, path: Path, pooch: pooch.Pooch, strict: bool = False
+    ) -> None:
         self.path = path  # < Path relative to the package root
         self.pooch = pooch
+        self.strict = strict  # < Re-hash cached files on every fetch
 
         if path.is_absolute():
             raise ValueError(
@@ -120,21 +155,130 @@ class DataFile(Resource):
         path: Path,
         pooch: pooch.Pooch,
         loader: Callable[[Path], Any] | None = None,
+        columnar: ColumnarFormat | None = None,
+        chunker: Callable[[Path, int], Iterator[Any]] | None = None,
+        strict: bool = False,
+        schema: Schema | None = None,
     ) -> None:
-        super().__init__(path, pooch)
+        super().__init__(path, pooch, strict)
         self.loader = loader
+        self.columnar = columnar  # < Sidecar format, None disables sidecars
+        self.chunker = chunker  # < Custom chunker, see iter_chunks()
+        self.schema = schema  # < Declared dtypes, see Catalog.set_schema()
 
     def load(self) -> Any:
         if self.loader is None:
             raise ValueError(f"No loader for {self.stem}")
-        ### (Download and) Resolve Local Filepath (default is OS cache)
-        local_fp = Path(self.pooch.fetch(self.path.as_posix()))
+        with instrument.record(self.path.as_posix(), "DataFile"):
+            ### Columnar sidecar from an earlier load: Skip fetch & parse
+            obj = self._load_sidecar()
+            if obj is _MISSING:
+                obj = self.parse(self.fetch())
+            instrument.result(obj)
+            return obj
+
+    def parse(self, local_fp: Path) -> Any:
+        """Run the loader on the already fetched *local_fp*."""
+        if self.loader is None:
+            raise ValueError(f"No loader for {self.stem}")
         try:
-            return self.loader(local_fp)  # < Load file
+            with instrument.stage("parse"):
+                obj = self._call_loader(local_fp)  # < Load file
         except Exception as e:
             raise ValueError(
                 f"Failed to load '{self.name}' with loader '{self.loader.__name__ if self.loader else 'unknown loader'}'"
             ) from e
+        instrument.note(source="parse", bytes_read=local_fp.stat().st_size)
+        sidecar = self._sidecar_path()
+        if sidecar is not None:
+            write_sidecar(obj, sidecar)  # < No-op for non-DataFrames
+        return obj
+
+    def _call_loader(self, local_fp: Path) -> Any:
+        """Run the loader, with the schema's text dtypes as ``dtype=`` if
+        the loader takes them, then cast the remaining columns."""
+        if self.schema is None:
+            return self.loader(local_fp)
+        from neddata.schema import accepts_dtype
+
+        kwargs = {}
+        dtypes = self.schema.parse_dtypes()
+        if dtypes and accepts_dtype(self.loader):
+            kwargs["dtype"] = dtypes
+        return self.schema.apply(self.loader(local_fp, **kwargs))
+
+    def iter_chunks(self, chunksize: int = 10_000) -> Iterator[Any]:
+        """Yield the file piece by piece instead of loading it at once:
+        DataFrames of *chunksize* rows for CSV, lists of *chunksize* records
+        for JSON arrays. Files with a custom loader need a custom chunker
+        (see :meth:`Catalog.set_chunker`), the default one would parse them
+        differently than the loader does.
+
+        Schema columns whose dtype depends on the values (``"downcast"``,
+        ``"category"``) take the dtypes of the full frame from its sidecar,
+        so chunks concatenate to the loaded frame. Without a sidecar (no
+        :meth:`load` yet, or sidecars off) each chunk resolves them on its
+        own: Widths and categories may then differ between chunks, and
+        ``pd.concat`` falls back to wider or object columns."""
+        chunker = self.chunker
+        if chunker is None and self.loader is u.fileio.get_default_loader(
+            self.path
+        ):
+            chunker = u.fileio.get_default_chunker(self.path)
+        if chunker is None:
+            raise ValueError(f"No chunker for {self.name}")
+        if self.schema is None:
+            yield from chunker(self.fetch(), chunksize)
+            return
+        resolved = self._sidecar_dtypes(self.schema.value_dependent)
+        for chunk in chunker(self.fetch(), chunksize):
+            yield self.schema.apply(chunk, resolved)
+
+    def _sidecar_dtypes(self, columns: list[str]) -> dict[str, Any]:
+        """Dtypes of *columns* in the sidecar of an earlier load, {} if
+        there is none. Reads only these columns."""
+        sidecar = self._sidecar_path() if columns else None
+        written = find_sidecar(sidecar) if sidecar is not None else None
+        if written is None:
+            return {}
+        try:
+            df = read_sidecar(written, columns=columns)
+        except Exception:
+            return {}  # < _load_sidecar cleans up broken ones
+        return df.dtypes.to_dict()
+
+    def fetch(self) -> Path:
+        """(Download and) Resolve Local Filepath (default is OS cache).
+        Files verified before are not re-hashed, unless *strict*."""
+        return fetch_verified(self.pooch, self.path.as_posix(), self.strict)
+
+    def _load_sidecar(self) -> Any:
+        """Return the DataFrame of an earlier load, or _MISSING."""
+        sidecar = self._sidecar_path()
+        written = find_sidecar(sidecar) if sidecar is not None else None
+        if written is None:
+            return _MISSING
+        try:
+            with instrument.stage("parse"):
+                obj = read_sidecar(written)
+            size = written.stat().st_size
+            instrument.note(source="sidecar", bytes_read=size)
+            return obj
+        except Exception:
+            # > Corrupt or unreadable (ArrowInvalid, OSError, ...): parse again
+            written.unlink(missing_ok=True)
+            return _MISSING
+
+    def _sidecar_path(self) -> Path | None:
+        """Sidecar keyed by the registry hash and the loader, if enabled."""
+        if self.columnar is None or self.loader is None:
+            return None
+        sha256 = self.pooch.registry.get(self.path.as_posix())
+        if sha256 is None or not columnar_available():
+            return None
+        return sidecar_path(
+            self.path_local, sha256, self.loader, self.columnar, self.schema
+        )
 
 
 # === DataDir ========================================================
@@ -147,15 +291,21 @@ class DataDir(Resource):
     directory itself is catalogued.
     """
 
-    def __init__(self, path: Path, pooch: pooch.Pooch) -> None:
-        super().__init__(path, pooch)
+    def __init__(
+        self, path: Path, pooch: pooch.Pooch, strict: bool = False
+    ) -> None:
+        super().__init__(path, pooch, strict)
         self._unpacked = False  # < Whether the archive has been extracted
+        self._chunk_stores: Dict[Path, ChunkStore] = {}  # < Open per dest
+        self._chunk_stores_lock = threading.Lock()
         # self._ensure_downloaded()
 
     def load(self) -> Path:
         """DataDir does not load anything, it is a directory."""
-        self._ensure_downloaded()  # < Ensure all files are downloaded
-        return self.path_local
+        with instrument.record(self.path.as_posix(), "DataDir"):
+            instrument.note(source="dir")
+            self._ensure_downloaded()  # < Ensure all files are downloaded
+            return self.path_local
         # local_fp = Path(self.pooch.fetch(self.path.as_posix()))
 
     def list(self) -> list[str]:
@@ -169,16 +319,17 @@ class DataDir(Resource):
 
     def _ensure_downloaded(self) -> None:
         """
-        Fetch all required files **once**. Idempotent and safe
-        under multiprocessing thanks to Pooch's file lock.
+        Fetch all required files. Idempotent and safe under
+        multiprocessing thanks to Pooch's file lock.
         """
-
-        if self.path_local.exists():
-            return  # !! already cached
         if self.is_archive:
-            self._fetch_archive()
-        else:
-            self._fetch_piecewise()
+            if not self.path_local.exists():
+                self._fetch_archive()
+            return
+        # !! The directory may exist but be incomplete, e.g. holding only
+        # !! the files of fetch_file(). Check every file, verified ones
+        # !! are not re-hashed.
+        self._fetch_piecewise()
 
     def _fetch_archive(self) -> None:
         """Unpack the directory if it is an archive.
@@ -193,12 +344,16 @@ class DataDir(Resource):
             return  # !! already unpacked
 
         ### Unpack
+        import pooch
+
         processor = (
             pooch.Untar(extract_dir=str(self.path))
             if self.name.endswith((".tar.gz", ".tgz", ".tar"))
             else pooch.Unzip(extract_dir=str(self.path))  # zip variant
         )
-        self.pooch.fetch(self.path.as_posix(), processor=processor)
+        instrument.timed_fetch(
+            self.pooch, self.path.as_posix(), processor=processor
+        )
         self._unpacked = True  # < Mark as unpacked
 
     def _fetch_piecewise(self) -> None:
@@ -209,11 +364,109 @@ class DataDir(Resource):
             raise ValueError(
                 f"Cannot fetch piecewise {self.name}: Is an archive (zip/tar)."
             )
+        for fname in self.registry_files():
+            fetch_verified(self.pooch, fname, self.strict)
+
+    def registry_files(self) -> list[str]:
+        """Registry entries (posix paths) of the files inside this directory."""
+        if self.is_archive:
+            return [self.path.as_posix()]
         prefix = f"{self.path.as_posix()}/"
-        for fname in self.pooch.registry:
-            fname: str
-            if fname.startswith(prefix):
-                self.pooch.fetch(fname)
+        return [f for f in self.pooch.registry if f.startswith(prefix)]
+
+    def fetch_file(self, fname: str) -> tuple[Path, str]:
+        """Local path and sha256 of the file *fname* inside this directory.
+        Fetches only that file, unless the directory is an archive."""
+        entry = (self.path / fname).as_posix()
+        if self.is_archive:
+            self._ensure_downloaded()
+            src = self.path_local / fname
+            if not src.is_file():
+                raise FileNotFoundError(f"'{fname}' is not in {self.name}")
+            ### Archives have no per-file hash in the registry
+            import pooch
+
+            return src, pooch.file_hash(str(src))
+        if entry not in self.pooch.registry:
+            raise FileNotFoundError(f"'{fname}' is not in {self.name}")
+        local = fetch_verified(self.pooch, entry, self.strict)
+        return local, self.pooch.registry[entry]
+
+    def _derived_path(self, fname: str, sha256: str, suffix: str) -> Path:
+        """``<dir>/.neddata/<fname>.<sha256[:16]>.<suffix>``"""
+        derived = f"{fname}.{sha256[:16]}.{suffix}"
+        return self.path_local / DERIVED_DIRNAME / derived
+
+    def token_store(self, fname: str = "chunks_tokenized.json") -> TokenStore:
+        """Memory-mapped :class:`~neddata.tokenstore.TokenStore` of the
+        tokenized corpus *fname* (a nested JSON list of token strings).
+        Built once into ``<dir>/.neddata/``, keyed by the file hash."""
+        return self._token_store(fname)[0]
+
+    def _token_store(self, fname: str) -> tuple[TokenStore, str]:
+        """Token store of *fname* and the sha256 of *fname*."""
+        from neddata.tokenstore import TokenStore, build_token_store
+
+        src, sha256 = self.fetch_file(fname)
+        dest = self._derived_path(fname, sha256, "tokens")
+        if not dest.is_dir():
+            build_token_store(src, dest)
+        return TokenStore(dest), sha256
+
+    def chunk_store(
+        self,
+        fnames: Sequence[str] = (
+            "chunks.json",
+            "chunks_metas.json",
+            "rag_chunks.json",
+        ),
+        key: str | None = "id_gsn",
+    ) -> ChunkStore:
+        """Memory-mapped :class:`~neddata.chunkstore.ChunkStore` of the
+        parallel JSON arrays *fnames*, records are ``{<stem>: value}``
+        and indexed by position and by *key*. Built once into
+        ``<dir>/.neddata/``, keyed by the file hashes.
+
+        The store is opened once and shared between calls, it holds a
+        file handle and a memory map until closed. A closed store is
+        reopened on the next call."""
+        from neddata.chunkstore import ChunkStore, build_chunk_store
+
+        sources, shas = {}, []
+        for fname in fnames:
+            src, sha256 = self.fetch_file(fname)
+            sources[Path(fname).stem] = src
+            shas.append(sha256)
+        ident = hashlib.sha256(" ".join([*shas, str(key)]).encode())
+        dest = self._derived_path("chunks", ident.hexdigest(), "jsonl")
+        ### One build & one open store, also for concurrent first calls
+        with self._chunk_stores_lock:
+            store = self._chunk_stores.get(dest)
+            if store is not None and not store.closed:
+                return store
+            if not dest.is_dir():
+                build_chunk_store(sources, dest, key=key)
+            store = self._chunk_stores[dest] = ChunkStore(dest)
+            return store
+
+    def bm25(
+        self,
+        fname: str = "chunks_tokenized.json",
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> BM25Index:
+        """:class:`~neddata.retrieval.BM25Index` over the token store of
+        *fname*, document ids are positions in that file. Persisted in
+        ``<dir>/.neddata/`` next to the token store."""
+        from neddata.retrieval import BM25Index
+
+        store, sha256 = self._token_store(fname)
+        dest = self._derived_path(fname, sha256, f"bm25-{k1:g}-{b:g}.npz")
+        if dest.is_file():
+            return BM25Index.load(dest, vocab=store.vocab)
+        index = BM25Index.from_token_store(store, k1=k1, b=b)
+        index.save(dest)
+        return index
 
 
 # =====================================================================
@@ -221,16 +474,99 @@ class DataDir(Resource):
 # =====================================================================
 
 
-def make_pooch_registry(dir: Path | Traversable) -> None:
+@dataclass
+class RegistryDiff:
+    """Changes to a ``pooch_registry.txt`` made by :func:`make_pooch_registry`."""
+
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    rehashed: int = 0  # < Files hashed, the rest came from the memo
+    total: int = 0  # < Entries in the new registry
+
+    def __repr__(self) -> str:
+        lines = [
+            f"<{self.__class__.__name__}(total={self.total}, "
+            f"added={len(self.added)}, removed={len(self.removed)}, "
+            f"changed={len(self.changed)}, rehashed={self.rehashed})>"
+        ]
+        for sign, fnames in (
+            ("+", self.added),
+            ("-", self.removed),
+            ("~", self.changed),
+        ):
+            lines.extend(f"  {sign} {fname}" for fname in fnames)
+        return "\n".join(lines)
+
+
+def _read_registry(manifest: Path) -> dict[str, str]:
+    """``{fname: hash}`` of a registry file, like pooch.load_registry()."""
+    entries = {}
+    with open(manifest, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                fname, fhash = line.split()[:2]
+                entries[fname] = fhash
+    return entries
+
+
+def make_pooch_registry(
+    dir: Path | Traversable,
+    workers: int | None = None,
+    memo: bool = True,
+) -> RegistryDiff:
+    """Write ``pooch_registry.txt`` for every file below *dir*, like
+    ``pooch.make_registry()``, but incremental and parallel: Hashes are
+    memoized by (path, size, mtime_ns, inode), only changed files are
+    re-hashed, in a process pool.
+
+    :param workers: Hashing processes, None = os.cpu_count()
+    :param memo: False re-hashes every file
+    """
+    from neddata.cache import FileHashMemo, _sha256_file
 
     raw_dir = Path(str(dir)).expanduser()
     manifest = raw_dir / "pooch_registry.txt"
 
     if not manifest.is_file():  # < Create empty .txt
         manifest.touch()
+    old = _read_registry(manifest)
 
-    pooch.make_registry(raw_dir, manifest)
-
+    ### Same selection as pooch.make_registry(): All files, recursively
+    paths = sorted(
+        (p for p in raw_dir.glob("**/*") if p.is_file()),
+        key=lambda p: str(p.relative_to(raw_dir)),
+    )
+    if memo:
+        hash_memo = FileHashMemo()
+        try:
+            hashes, rehashed = hash_memo.hash_files(paths, workers=workers)
+        finally:
+            hash_memo.close()
+    else:
+        hashes = {p: _sha256_file(str(p)) for p in paths}
+        rehashed = paths
+    new = {p.relative_to(raw_dir).as_posix(): hashes[p] for p in paths}
+
+    ### Write atomically
+    tmp = manifest.with_name(f".{manifest.name}.{os.getpid()}")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for fname, fhash in new.items():
+            f.write(f"{fname} {fhash}\n")
+    os.replace(tmp, manifest)
+
+    ### The manifest hashes itself (like pooch), skip that noise
+    new_fnames = new.keys() - {manifest.name}
+    old_fnames = old.keys() - {manifest.name}
+    diff = RegistryDiff(
+        added=sorted(new_fnames - old_fnames),
+        removed=sorted(old_fnames - new_fnames),
+        changed=sorted(f for f in new_fnames & old_fnames if new[f] != old[f]),
+        rehashed=len(rehashed),
+        total=len(new),
+    )
+    print(diff)
     print(
         textwrap.dedent(
             f"""
@@ -240,10 +576,13 @@ def make_pooch_registry(dir: Path | Traversable) -> None:
     """
         )
     )
+    return diff
 
 
 def make_pooch(package: str, base_url: str) -> pooch.Pooch:
     """Create a :class:`pooch.Pooch` for *package* using the shipped registry."""
+    import pooch
+
     poochy = pooch.create(
         path=pooch.os_cache(package),
         base_url=base_url,
@@ -275,6 +614,9 @@ def make_pooch(package: str, base_url: str) -> pooch.Pooch:
 # ---------------------------------------------------------------------------
 
 
+SHEET_SEP = "::"  # < Sheet keys: "<workbook key>::<sheet>"
+
+
 def _format_key(key: str) -> str:
     """Normalise keys so look‑ups are case‑insensitive and whitespace tolerant."""
     return key.lower().strip().replace(" ", "_").replace("-", "_")
@@ -282,7 +624,69 @@ def _format_key(key: str) -> str:
 
 def _match_any_globs(name: str, patterns: Iterable[str]) -> bool:
     """Return *True* if *name* matches at least one shell‑style glob."""
-    return any(fnmatch.fnmatchcase(name, g) for g in patterns)
+    return compile_globs(tuple(patterns)).match(name) is not None
+
+
+@dataclass
+class PrefetchReport:
+    """Outcome of :meth:`Catalog.prefetch`, per registry file."""
+
+    fetched: dict[str, Path] = field(default_factory=dict)
+    failed: dict[str, BaseException] = field(default_factory=dict)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def __repr__(self) -> str:
+        failed = "".join(
+            f"\n  ✗ {fname}: {type(e).__name__}: {e}"
+            for fname, e in sorted(self.failed.items())
+        )
+        return (
+            f"<{self.__class__.__name__}(fetched={len(self.fetched)}, "
+            f"failed={len(self.failed)}, seconds={self.seconds:.2f})>{failed}"
+        )
+
+
+@dataclass
+class VerifyReport:
+    """Outcome of :meth:`Catalog.verify`, per registry file."""
+
+    verified: list[str] = field(default_factory=list)  # < Hash matches
+    missing: list[str] = field(default_factory=list)  # < Not in the cache
+    corrupt: list[str] = field(default_factory=list)  # < Hash mismatch
+    stale: list[str] = field(default_factory=list)  # < Not in the registry
+    refetched: dict[str, Path] = field(default_factory=dict)
+    failed: dict[str, BaseException] = field(default_factory=dict)
+    pruned: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """All registry files are (now) in the cache and intact."""
+        bad = set(self.missing) | set(self.corrupt)
+        return not self.failed and bad <= self.refetched.keys()
+
+    def __repr__(self) -> str:
+        lines = [
+            f"<{self.__class__.__name__}(verified={len(self.verified)}, "
+            f"missing={len(self.missing)}, corrupt={len(self.corrupt)}, "
+            f"stale={len(self.stale)}, refetched={len(self.refetched)}, "
+            f"failed={len(self.failed)}, seconds={self.seconds:.2f})>"
+        ]
+        for sign, fnames in (
+            ("missing", self.missing),
+            ("corrupt", self.corrupt),
+            ("stale", self.stale),
+        ):
+            lines.extend(f"  {sign}: {fname}" for fname in fnames)
+        lines.extend(
+            f"  ✗ {fname}: {type(e).__name__}: {e}"
+            for fname, e in sorted(self.failed.items())
+        )
+        return "\n".join(lines)
 
 
 class Catalog(Mapping[str, Resource]):
@@ -298,21 +702,34 @@ class Catalog(Mapping[str, Resource]):
         ".old",
         "*.IGNORE*",
     )
+    DIR_PATTERNS = ("*RAGI*",)  # < Directories that are one DataDir
 
     def __init__(
         self,
         package: str,
         pooch: pooch.Pooch,
-        dir_patterns: Sequence[str] = ("*RAGI*",),
+        dir_patterns: Sequence[str] = DIR_PATTERNS,
+        cache: LoadCache | None = None,
+        columnar: ColumnarFormat | None = None,
+        strict: bool = False,
     ) -> None:
         self.package = package
         self.pooch = pooch
         self.dir_patterns = dir_patterns
+        self.cache = cache  # < Optional in-memory cache of loaded objects
+        self.columnar = columnar  # < Format of on-disk DataFrame sidecars
+        self.strict = strict  # < Re-hash cached files on every fetch
 
         self._root = files(package)
         ###
         self._data: Dict[str, Resource] = {}
-        self._loaders: Dict[str, Callable[[Path], Any]] = {}
+        self._index = KeyIndex()  # < Sorted keys & prefix tree of _data
+        self._sheets: Dict[str, list[str]] = {}  # < Workbook -> sheet keys
+        self._loaders: PatternMap[Callable[[Path], Any]] = PatternMap()
+        self._chunkers: PatternMap[Callable[[Path, int], Iterator[Any]]] = (
+            PatternMap()
+        )
+        self._schemas: PatternMap[Schema] = PatternMap()
 
         ### Build
         self._build()
@@ -323,46 +740,100 @@ class Catalog(Mapping[str, Resource]):
 
     def _build(self) -> None:
         """Populate ``self._data`` from *pooch* registry entries."""
-        for p in self.pooch.registry.keys():
-            p = Path(p)
-            if self._is_ignored(p):
-                continue
-            key, key_dir = self._construct_keys(p)
-            ### DataDir
-            if self._is_datadir(p):
-                self._data[key_dir] = DataDir(p.parent, self.pooch)
-            elif self._is_inside_datadir(p):
-                continue  # > Skip everything nested inside a DataDir
+        for key, fname in self._walk_registry(
+            self.pooch.registry.keys(), self.dir_patterns
+        ):
+            p = Path(fname)
+            ### DataDir: Files nested inside it are not catalogued
+            if key.endswith("/"):
+                self._data[key] = DataDir(p, self.pooch, strict=self.strict)
             ### DataFile
-            elif _match_any_globs(p.name, self.FILE_PATTERNS):
+            else:
                 loader = self._get_customloader(
                     key
                 ) or u.fileio.get_default_loader(p)
-                self._data[key] = DataFile(p, self.pooch, loader)
+                chunker = self._get_customchunker(key)
+                schema = self._schemas.first(key)
+                self._data[key] = self._make_datafile(
+                    p, loader, chunker, schema
+                )
+        self._index = KeyIndex(self._data)
+
+    @classmethod
+    def keys_in_registry(
+        cls, fnames: Iterable[str], dir_patterns: Sequence[str] = DIR_PATTERNS
+    ) -> list[str]:
+        """Keys a catalogue would have for the registry file names *fnames*,
+        without creating pooch or resources."""
+        return [key for key, _ in cls._walk_registry(fnames, dir_patterns)]
+
+    @classmethod
+    def _walk_registry(
+        cls, fnames: Iterable[str], dir_patterns: Sequence[str]
+    ) -> Iterator[tuple[str, str]]:
+        """Yield ``(key, path)`` of every catalogued registry entry. DataDirs
+        are yielded once, with their directory as path, and their keys end
+        with ``/``."""
+        # > Works on posix strings and classifies every directory only
+        # > once: Registries repeat the same directories many times
+        dirs: dict[str, tuple[bool, bool]] = {}  # < parent -> flags
+        seen_dirs: set[str] = set()
+        for fname in fnames:
+            parent, _, name = fname.rpartition("/")
+            if parent not in dirs:
+                parts = parent.split("/") if parent else []
+                dirs[parent] = (
+                    cls._is_ignored(parts),
+                    cls._is_datadir(parts, dir_patterns),
+                )
+            ignored, in_datadir = dirs[parent]
+            if ignored or cls._is_ignored([name]):
+                continue
+            key, key_dir = cls._construct_keys(parent, name)
+            if in_datadir or cls._is_datadir([name], dir_patterns):
+                if key_dir not in seen_dirs:
+                    seen_dirs.add(key_dir)
+                    yield key_dir, parent
+            elif _match_any_globs(name, cls.FILE_PATTERNS):
+                yield key, fname
+
+    def _make_datafile(
+        self,
+        path: Path,
+        loader: Callable[[Path], Any] | None,
+        chunker: Callable[[Path, int], Iterator[Any]] | None = None,
+        schema: Schema | None = None,
+    ) -> DataFile:
+        """Create a DataFile with the catalogue-wide settings."""
+        return DataFile(
+            path=path,
+            pooch=self.pooch,
+            loader=loader,
+            columnar=self.columnar,
+            chunker=chunker,
+            strict=self.strict,
+            schema=schema,
+        )
 
-    def _construct_keys(self, path: Path) -> tuple[str, str]:
-        """Create a key from the path, normalised for case and whitespace."""
-        _p: Path = Path(path.as_posix())
-        key: str = _format_key(f"{_p.parent}/{_p.name}")
-        key_dir: str = _format_key(f"{_p.parent}/")
+    @staticmethod
+    def _construct_keys(parent: str, name: str) -> tuple[str, str]:
+        """Create a key from the posix *parent* directory and file *name*,
+        normalised for case and whitespace."""
+        parent = parent or "."  # < Top-level files, like Path().parent
+        key: str = _format_key(f"{parent}/{name}")
+        key_dir: str = _format_key(f"{parent}/")
 
         return key, key_dir
 
-    def _is_ignored(self, path: Path) -> bool:
+    @classmethod
+    def _is_ignored(cls, parts: Sequence[str]) -> bool:
         return any(
-            _match_any_globs(part, self.IGNORE_PATTERNS) for part in path.parts
+            _match_any_globs(part, cls.IGNORE_PATTERNS) for part in parts
         )
 
-    def _is_datadir(self, path: Path) -> bool:
-        return any(
-            _match_any_globs(part, self.dir_patterns) for part in path.parts
-        )
-
-    def _is_inside_datadir(self, path: Path) -> bool:
-        return path.is_file() and any(
-            _match_any_globs(parent.name, self.dir_patterns)
-            for parent in path.parents
-        )
+    @staticmethod
+    def _is_datadir(parts: Sequence[str], dir_patterns: Sequence[str]) -> bool:
+        return any(_match_any_globs(part, dir_patterns) for part in parts)
 
     # =================================================================
     # === Load
@@ -373,10 +844,332 @@ class Catalog(Mapping[str, Resource]):
         Load a resource by its key. If the resource is a DataFile, it will
         be loaded using its loader function.
         """
-        key = _format_key(key)
+        key = self._resolve(key)
         if not key in self._data:
             self._raise_key_error(bad_key=key)
-        return self._data[key].load()
+        resource = self._data[key]
+        with instrument.record(key, type(resource).__name__, self.package):
+            if self.cache is None or not isinstance(resource, DataFile):
+                return resource.load()
+            ### Cached: Key includes the registry hash, so changes invalidate
+            cache_key = self._cache_key(key, resource)
+            obj = self.cache.get(cache_key, default=_MISSING)
+            if obj is _MISSING:
+                obj = self.cache.put(cache_key, resource.load())
+            else:
+                instrument.note(source="memory")
+                instrument.result(obj)
+            return obj
+
+    def _cache_key(self, key: str, resource: DataFile) -> tuple:
+        sha256 = self.pooch.registry.get(resource.path.as_posix())
+        return (key, sha256, resource.loader, resource.schema)
+
+    def iter_chunks(self, key: str, chunksize: int = 10_000) -> Iterator[Any]:
+        """Iterate over a DataFile in chunks, see :meth:`DataFile.iter_chunks`."""
+        resource = self[key]
+        if not isinstance(resource, DataFile):
+            raise TypeError(
+                f"'{key}' is a {type(resource).__name__}, not a DataFile"
+            )
+        return resource.iter_chunks(chunksize)
+
+    # =================================================================
+    # === Async Load
+    # =================================================================
+
+    async def aload(self, key: str, max_concurrency: int = 8) -> Any:
+        """Like :meth:`load`, but without blocking the event loop."""
+        (obj,) = await self.aload_many([key], max_concurrency=max_concurrency)
+        return obj
+
+    async def aload_many(
+        self, keys: Sequence[str], max_concurrency: int = 8
+    ) -> list[Any]:
+        """Load several resources concurrently, results in order of *keys*.
+
+        Downloads run over async HTTP (see :mod:`neddata.aio`), at most
+        *max_concurrency* at a time, verified against the registry hash
+        like pooch does. Parsing runs in the default thread executor.
+        """
+        from neddata import aio
+
+        keys = [_format_key(k) for k in keys]
+        ### Sheet keys: Read the sheet lists without blocking the loop
+        for key in set(keys) - self._data.keys():
+            await asyncio.to_thread(self._resolve, key)
+        for key in keys:
+            if key not in self._data:
+                self._raise_key_error(bad_key=key)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with aio.open_session() as session:
+            return await asyncio.gather(
+                *(self._aload(key, session, semaphore) for key in keys)
+            )
+
+    async def _aload(
+        self, key: str, session: Any, semaphore: asyncio.Semaphore
+    ) -> Any:
+        resource = self._data[key]
+        with instrument.record(key, type(resource).__name__, self.package):
+            obj = await self._aload_resource(key, session, semaphore)
+            instrument.result(obj)
+            return obj
+
+    async def _aload_resource(
+        self, key: str, session: Any, semaphore: asyncio.Semaphore
+    ) -> Any:
+        from neddata import aio
+
+        resource = self._data[key]
+        ### DataDir: Fetch all files concurrently, archives in a thread
+        if isinstance(resource, DataDir):
+            if resource.is_archive:
+                return await asyncio.to_thread(resource.load)
+            instrument.note(source="dir")
+            await asyncio.gather(
+                *(
+                    aio.afetch(
+                        self.pooch, fname, session, semaphore, self.strict
+                    )
+                    for fname in resource.registry_files()
+                )
+            )
+            return resource.path_local
+        ### DataFile: Memory cache -> sidecar -> download & parse
+        cache_key = self._cache_key(key, resource)
+        if self.cache is not None:
+            obj = self.cache.get(cache_key, default=_MISSING)
+            if obj is not _MISSING:
+                instrument.note(source="memory")
+                return obj
+        obj = await asyncio.to_thread(resource._load_sidecar)
+        if obj is _MISSING:
+            fname = resource.path.as_posix()
+            local_fp = await aio.afetch(
+                self.pooch, fname, session, semaphore, resource.strict
+            )
+            obj = await asyncio.to_thread(resource.parse, local_fp)
+        if self.cache is not None:
+            obj = self.cache.put(cache_key, obj)
+        return obj
+
+    # =================================================================
+    # === Cache
+    # =================================================================
+
+    def enable_cache(
+        self, max_bytes: int = 1 << 30, view: View = "copy"
+    ) -> LoadCache:
+        """Keep loaded objects in memory, evicting the least recently used
+        ones beyond *max_bytes*. See :func:`neddata.cache.make_view` for the
+        *view* modes handed out to callers."""
+        self.cache = LoadCache(max_bytes=max_bytes, view=view)
+        return self.cache
+
+    def reload_registry(self) -> None:
+        """Re-read ``pooch_registry.txt`` and rebuild the catalogue. Cached
+        objects of changed files are no longer hit (their hash differs)."""
+        self.pooch.registry.clear()
+        self.pooch.load_registry(self._root / "pooch_registry.txt")
+        self._data.clear()
+        self._sheets.clear()
+        self._build()
+
+    # =================================================================
+    # === Sheets
+    # =================================================================
+
+    def sheets(self, key: str) -> list[str]:
+        """Keys of the sheets of the xlsx workbook *key*, in workbook order,
+        e.g. ``"kdb/kdb_complete.xlsx::tabelle1"``. Each sheet becomes a
+        DataFile of its own: :meth:`load` parses only that sheet,
+        :meth:`iter_chunks` streams its rows.
+
+        The sheet list is read on first use (fetching the workbook, but
+        parsing only its index) and remembered. Loading a sheet key calls
+        this implicitly.
+        """
+        key = _format_key(key)
+        if key in self._sheets:
+            return self._sheets[key]
+        resource = self[key]
+        is_xlsx = resource.path.suffix == ".xlsx" and SHEET_SEP not in key
+        if not isinstance(resource, DataFile) or not is_xlsx:
+            raise ValueError(f"'{key}' is not an xlsx workbook")
+        sheet_keys = []
+        for name in u.fileio.xlsx_sheet_names(resource.fetch()):
+            sheet_key = f"{key}{SHEET_SEP}{_format_key(name)}"
+            self._data[sheet_key] = self._make_datafile(
+                path=resource.path,
+                loader=u.fileio.excel_sheet_loader(name),
+                chunker=u.fileio.excel_sheet_chunker(name),
+                schema=self._schemas.first(sheet_key),
+            )
+            sheet_keys.append(sheet_key)
+        self._index.update(sheet_keys)
+        self._sheets[key] = sheet_keys
+        return sheet_keys
+
+    def _resolve(self, key: str) -> str:
+        """Normalise *key*, listing the sheets of its workbook if it is a
+        sheet key not seen before."""
+        key = _format_key(key)
+        if key not in self._data and SHEET_SEP in key:
+            workbook = key.partition(SHEET_SEP)[0]
+            if workbook in self._data and workbook not in self._sheets:
+                self.sheets(workbook)
+        return key
+
+    # =================================================================
+    # === Prefetch
+    # =================================================================
+
+    def prefetch(
+        self,
+        patterns: str | Sequence[str] = "*",
+        workers: int = 8,
+        progress: Callable[[str, BaseException | None], None] | None = None,
+    ) -> PrefetchReport:
+        """Download and verify every file of the resources matching
+        *patterns* (globs over keys) in parallel. Failures don't abort
+        the other downloads, they are collected in the report.
+
+        :param workers: Number of threads, downloads are I/O bound.
+        :param progress: Called as ``progress(fname, error_or_None)`` after
+            each file.
+        """
+        tasks = self._fetch_tasks(patterns)
+        report = PrefetchReport()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(task): fname for fname, task in tasks.items()}
+            for future in as_completed(futures):
+                fname = futures[future]
+                try:
+                    report.fetched[fname] = Path(future.result())
+                    error = None
+                except Exception as e:  # < Report, don't abort the others
+                    report.failed[fname] = error = e
+                if progress is not None:
+                    progress(fname, error)
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def _fetch_tasks(
+        self, patterns: str | Sequence[str]
+    ) -> dict[str, Callable[[], Path | str]]:
+        """One fetch callable per registry file behind the keys matching
+        any of *patterns*."""
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        keys = {key for pattern in patterns for key in self.glob(pattern)}
+        if not keys:
+            self._raise_key_error(bad_key=", ".join(patterns))
+        tasks: dict[str, Callable[[], Path | str]] = {}
+        for key in sorted(keys):
+            resource = self._data[key]
+            if isinstance(resource, DataFile):
+                tasks[resource.path.as_posix()] = resource.fetch
+            elif isinstance(resource, DataDir) and resource.is_archive:
+                tasks[resource.path.as_posix()] = resource.load
+            elif isinstance(resource, DataDir):
+                for fname in resource.registry_files():
+                    tasks[fname] = functools.partial(
+                        fetch_verified, self.pooch, fname, self.strict
+                    )
+        return tasks
+
+    # =================================================================
+    # === Verify
+    # =================================================================
+
+    def verify(
+        self,
+        patterns: str | Sequence[str] | None = None,
+        workers: int = 8,
+        refetch: bool = False,
+        prune: bool = False,
+        progress: Callable[[str, str], None] | None = None,
+    ) -> VerifyReport:
+        """Check the local cache against the registry, hashing files in
+        parallel, without loading anything.
+
+        :param patterns: Globs over keys, None checks the whole registry
+            and also reports stale files (cached, but not in the registry).
+        :param refetch: Download missing and corrupt files again.
+        :param prune: Delete stale files.
+        :param progress: Called as ``progress(fname, status)`` per file.
+        """
+        from pooch.hashes import hash_matches
+
+        if patterns is None:
+            fnames = sorted(self.pooch.registry)
+        else:
+            fnames = sorted(self._fetch_tasks(patterns))
+        root = Path(self.pooch.abspath)
+
+        def check(fname: str) -> str:
+            local = root / fname
+            if not local.is_file():
+                return "missing"
+            if hash_matches(str(local), self.pooch.registry[fname]):
+                mark_verified(self.pooch, fname, local)
+                return "verified"
+            return "corrupt"
+
+        report = VerifyReport()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # > hashlib releases the GIL, threads hash in parallel
+            for fname, status in zip(fnames, pool.map(check, fnames)):
+                getattr(report, status).append(fname)
+                if progress is not None:
+                    progress(fname, status)
+            if patterns is None:
+                report.stale = self._stale_files(root)
+            if refetch:
+                bad = report.missing + report.corrupt
+                futures = {
+                    pool.submit(fetch_verified, self.pooch, fname, True): fname
+                    for fname in bad
+                }
+                for future in as_completed(futures):
+                    fname = futures[future]
+                    try:
+                        report.refetched[fname] = Path(future.result())
+                        status = "refetched"
+                    except Exception as e:  # < Report, don't abort the others
+                        report.failed[fname] = e
+                        status = "failed"
+                    if progress is not None:
+                        progress(fname, status)
+        if prune:
+            for fname in report.stale:
+                (root / fname).unlink(missing_ok=True)
+                report.pruned.append(fname)
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def _stale_files(self, root: Path) -> list[str]:
+        """Files below *root* that are not in the registry. Derived files
+        (``.neddata/``) and unpacked archives (``*.unzip``, ``*.untar``)
+        belong to registry entries and are skipped."""
+        if not root.is_dir():
+            return []
+        skip_dirs = {DERIVED_DIRNAME}
+        stale = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [
+                d
+                for d in dirnames
+                if d not in skip_dirs and not d.endswith((".unzip", ".untar"))
+            ]
+            for name in filenames:
+                fname = (Path(dirpath) / name).relative_to(root).as_posix()
+                if fname not in self.pooch.registry:
+                    stale.append(fname)
+        return sorted(stale)
 
     # =================================================================
     # === Custom Loader
@@ -398,26 +1191,106 @@ class Catalog(Mapping[str, Resource]):
             if not matches:
                 self._raise_key_error(bad_key=pattern)
             for key in matches:
+                if SHEET_SEP in key:
+                    continue  # < Sheets keep their sheet loader
                 _resource = self._data.get(key)
                 if isinstance(_resource, DataFile):
-                    self._data[key] = DataFile(  # < Replace loader
+                    self._data[key] = self._make_datafile(  # < Replace loader
                         path=_resource.path,
-                        pooch=self.pooch,
                         loader=func,
+                        chunker=_resource.chunker,
+                        schema=_resource.schema,
                     )
             self._loaders[pattern] = func  # < Store the loader
             return func
 
         return decorator
 
+    def set_chunker(self, pattern: str) -> Callable[
+        [Callable[[Path, int], Iterator[Any]]],
+        Callable[[Path, int], Iterator[Any]],
+    ]:
+        """
+        Decorator: register a custom *chunker* for :meth:`iter_chunks` of
+        every key that matches *pattern*. A chunker is called as
+        ``chunker(path, chunksize)`` and yields chunks. Raises KeyError if
+        no key matches.
+        """
+
+        def decorator(
+            func: Callable[[Path, int], Iterator[Any]], pattern: str = pattern
+        ) -> Callable[[Path, int], Iterator[Any]]:
+            pattern = _format_key(pattern)
+            matches = self.glob(pattern)
+            if not matches:
+                self._raise_key_error(bad_key=pattern)
+            for key in matches:
+                if SHEET_SEP in key:
+                    continue  # < Sheets keep their sheet chunker
+                _resource = self._data.get(key)
+                if isinstance(_resource, DataFile):
+                    self._data[key] = self._make_datafile(  # < Replace chunker
+                        path=_resource.path,
+                        loader=_resource.loader,
+                        chunker=func,
+                        schema=_resource.schema,
+                    )
+            self._chunkers[pattern] = func  # < Store the chunker
+            return func
+
+        return decorator
+
+    def set_schema(
+        self, pattern: str, schema: Schema | Mapping[str, str]
+    ) -> Schema:
+        """
+        Register declared dtypes (see :class:`~neddata.schema.Schema`) for
+        every key that matches *pattern*, e.g.
+        ``cat.set_schema("KDB/*.csv", {"diocese": "category"})``. Applied
+        while loading, before sidecars and the memory cache see the frame.
+        Raises KeyError if no key matches.
+        """
+        from neddata.schema import Schema
+
+        if not isinstance(schema, Schema):
+            schema = Schema(schema)
+        pattern = _format_key(pattern)
+        matches = self.glob(pattern)
+        if not matches:
+            self._raise_key_error(bad_key=pattern)
+        for key in matches:
+            _resource = self._data.get(key)
+            if isinstance(_resource, DataFile):
+                self._data[key] = self._make_datafile(  # < Replace schema
+                    path=_resource.path,
+                    loader=_resource.loader,
+                    chunker=_resource.chunker,
+                    schema=schema,
+                )
+        self._schemas[pattern] = schema  # < Store the schema
+        return schema
+
+    def schema_report(self, key: str) -> SchemaReport:
+        """Memory of *key*'s DataFrame loaded without and with its schema,
+        per column. Parses the file without schema once more."""
+        from neddata.schema import schema_report
+
+        resource = self[key]
+        if not isinstance(resource, DataFile) or resource.schema is None:
+            raise ValueError(f"'{key}' has no schema")
+        before = resource.loader(resource.fetch())
+        return schema_report(before, self.load(key), key=_format_key(key))
+
     def _get_customloader(self, key: str) -> Callable[[Path], Any] | None:
         """Return the first loader whose pattern matches *key* (exact or
         glob)."""
-        key = _format_key(key)
-        for pattern, loader in self._loaders.items():
-            if fnmatch.fnmatchcase(key, pattern):  # shell-style wildcards
-                return loader
-        return None
+        return self._loaders.first(_format_key(key))
+
+    def _get_customchunker(
+        self, key: str
+    ) -> Callable[[Path, int], Iterator[Any]] | None:
+        """Return the first chunker whose pattern matches *key*."""
+        return self._chunkers.first(_format_key(key))
 
     # =================================================================
     # === Search & Glob
@@ -425,21 +1298,16 @@ class Catalog(Mapping[str, Resource]):
 
     def search(self, query: str, cutoff: int = 80) -> list[str]:
         """Searches keys based on fuzzy matching against the query."""
-        query = _format_key(query)
-        matches = []
-        for key in self.keys():
-            if fuzz.partial_ratio(key, query) > cutoff:
-                matches.append(key)
-        return matches
+        return self._index.search(_format_key(query), cutoff=cutoff)
 
     def glob(self, pattern: str) -> list[str]:
         """Searches keys based on shell-style glob patterns."""
-        pattern = _format_key(pattern)
-        matches = []
-        for key in self.keys():
-            if fnmatch.fnmatchcase(key, pattern):
-                matches.append(key)
-        return matches
+        return self._index.glob(_format_key(pattern))
+
+    def ls(self, prefix: str = "") -> list[str]:
+        """List keys and sub-directories directly below *prefix*, e.g.
+        ``cat.ls("kdb/")``. Sub-directories end with ``/``."""
+        return self._index.ls(_format_key(prefix))
 
     # =================================================================
     # === Public: Helpers
@@ -449,11 +1317,18 @@ class Catalog(Mapping[str, Resource]):
         return self._data.items()
 
     def keys(self) -> list[str]:
-        """List all resource keys in the catalogue."""
-        return sorted(self._data.keys())
+        """List all resource keys in the catalogue. Sheet keys of a
+        workbook are listed once its sheets are known, see :meth:`sheets`.
+        """
+        return self._index.keys()
 
     def get(self, key: str, default: Any = None) -> Resource | Any:
-        key = _format_key(key)
+        """Resource of *key*, or *default*. A sheet key not seen before
+        fetches its workbook to list the sheets, like ``cat[key]``."""
+        try:
+            key = self._resolve(key)
+        except (ValueError, OSError):
+            return default  # < No workbook, or the fetch failed
         return self._data.get(key, default)
 
     @property
@@ -472,14 +1347,20 @@ class Catalog(Mapping[str, Resource]):
             f"{name} = {loader.__name__ if loader else 'None'}"
             for name, loader in self._loaders.items()
         ]
+        schemas_repr = [
+            f"{name} = {schema}" for name, schema in self._schemas.items()
+        ]
         s = "\n    "
 
         return (
             f"<{self.__class__.__name__}(package='{self.package}', dir_patterns={self.dir_patterns}, pooch={self.pooch})>\n"
             f" ._root = {s}'{self._root}'\n"
             f" .pooch.base_url = {s}'{self.pooch.base_url}'\n"
+            f" .cache = {s}{self.cache}\n"
+            f" .columnar = {s}{self.columnar}\n"
             f" .datadirs = {s}- {f"{s}- ".join(self.datadirs)}\n"
             f" ._loaders = {s}- {f"{s}- ".join(loaders_repr)}\n"
+            f" ._schemas = {s}- {f"{s}- ".join(schemas_repr)}\n"
             f" len = {len(self)}\n"
             f" .keys() = {s}- {f"{s}- ".join(self.keys())}\n"
         )
@@ -490,7 +1371,7 @@ class Catalog(Mapping[str, Resource]):
 
     def __getitem__(self, key: str) -> Resource:
         """Catalogue[key] -> Resource"""
-        key = _format_key(key)
+        key = self._resolve(key)
         if not key in self._data:
             self._raise_key_error(bad_key=key)
         return self._data[key]
@@ -502,7 +1383,12 @@ class Catalog(Mapping[str, Resource]):
         return len(self._data)
 
     def __contains__(self, key: str) -> bool:
-        key = _format_key(key)
+        """Like ``cat[key]`` succeeding: Sheet keys not seen before fetch
+        their workbook to list the sheets, False if that fails."""
+        try:
+            key = self._resolve(key)
+        except (ValueError, OSError):
+            return False  # < No workbook, or the fetch failed
         return key in self._data
 
     def _suggest_alternative_keys(
@@ -565,6 +1451,8 @@ if __name__ == "__main__":
     # %%
     cat.search("RAGI")
     # %%
+    cat.ls("kdb/")  # < Keys & sub-directories below a prefix
+    # %%
     # =========================
     # === pooch
     # =========================
@@ -589,6 +1477,39 @@ if __name__ == "__main__":
     df: pd.DataFrame = cat.load("Regests/2_ben-Cist Identifizierungen.csv")
     display(df.head())  # < Display the first few rows of the DataFrame
 
+    # %%
+    # =========================
+    # === Cache loaded objects
+    # =========================
+    cat.enable_cache(max_bytes=500_000_000, view="readonly")
+    with u.stdlib.timer("1st load (parse)"):
+        df = cat.load("KDB/KDB_Complete_2.csv")
+    with u.stdlib.timer("2nd load (cached)"):
+        df = cat.load("KDB/KDB_Complete_2.csv")
+    print(cat.cache)
+
+    # %%
+    # =========================
+    # === Prefetch in parallel
+    # =========================
+    report = cat.prefetch(["kdb/*", "regests/*"], workers=8)
+    print(report)
+
+    # %%
+    # =========================
+    # === Verify the local cache
+    # =========================
+    print(cat.verify())
+
+    # %%
+    # =========================
+    # === Async load
+    # =========================
+    dfs = asyncio.run(
+        cat.aload_many(["KDB/KDB_Complete.csv", "Regests/2_Ben-Cist.xlsx"])
+    )
+    print([df.shape for df in dfs])
+
     # %%
     # =========================
     # === load DataDirs
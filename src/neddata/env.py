@@ -7,6 +7,7 @@
 import sys
 import os
 import subprocess
+import hashlib
 from pathlib import Path
 import json
 
@@ -109,13 +110,129 @@ if __name__ == "__main__":
 
 
 # %%
-def _load_direnv_envrc(cwd: str | Path = ".", quiet: bool = False) -> None:
-    """Merge the official .envrc into the current environment"""
+### Files whose changes invalidate the cached `direnv export json`
+_ENVRC_WATCHED = (".envrc", ".secrets.env")
+### `direnv export json` is a diff against the calling environment (e.g.
+### `layout python3` prepends to the caller's PATH). The cache is keyed
+### on the caller's values of these and of every exported variable.
+_PARENT_VARS = ("PATH", "VIRTUAL_ENV", "PYTHONPATH")
+### Exports are not cached if a variable name contains one of these
+_SECRET_MARKERS = ("SECRET", "TOKEN", "PASSWORD", "PASSWD", "API_KEY")
+
+
+def _direnv_cache_file(cwd: Path) -> Path:
+    """Cache file per project, below $XDG_CACHE_HOME (default ~/.cache)."""
+    cache_home = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache")
+    digest = hashlib.sha1(str(cwd.resolve()).encode()).hexdigest()[:16]
+    return cache_home / "neddata" / "direnv" / f"{digest}.json"
+
+
+def _direnv_allow_dirs() -> list[Path]:
+    """Where direnv records `direnv allow` and `direnv deny`."""
+    data_home = Path(
+        os.getenv("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    )
+    return [data_home / "direnv" / "allow", data_home / "direnv" / "deny"]
+
+
+def _envrc_stamp(cwd: Path) -> list[list]:
+    """(name, mtime_ns, size) of every watched file, changes on edits, and
+    mtime_ns of direnv's allow/deny dirs, changes on allow/deny/revoke."""
+    stamp = []
+    for name in _ENVRC_WATCHED:
+        try:
+            st = (cwd / name).stat()
+        except FileNotFoundError:
+            continue
+        stamp.append([name, st.st_mtime_ns, st.st_size])
+    for d in _direnv_allow_dirs():
+        try:
+            stamp.append([str(d), d.stat().st_mtime_ns])
+        except FileNotFoundError:
+            stamp.append([str(d), None])
+    return stamp
+
+
+def _parent_digest(names: Sequence[str]) -> str:
+    """Hash of the current values of *names*, unset ones included."""
+    items = sorted((n, os.environ.get(n)) for n in {*names, *_PARENT_VARS})
+    return hashlib.sha256(json.dumps(items).encode()).hexdigest()
+
+
+def _has_secrets(cwd: Path, env_vars: dict) -> bool:
+    if (cwd / ".secrets.env").exists():
+        return True
+    return any(m in name.upper() for name in env_vars for m in _SECRET_MARKERS)
+
+
+def _apply_env(env_vars: dict) -> None:
+    """Apply a `direnv export json` diff, None unsets a variable."""
+    for name, value in env_vars.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+def _read_direnv_cache(cwd: Path) -> dict | None:
+    try:
+        cached = json.loads(_direnv_cache_file(cwd).read_text())
+    except (OSError, ValueError):
+        return None
+    if cached.get("stamp") != _envrc_stamp(cwd):
+        return None  # !! .envrc or its allow state changed since we cached
+    env_vars = cached.get("env")
+    if not isinstance(env_vars, dict):
+        return None
+    if cached.get("parent") != _parent_digest(list(env_vars)):
+        return None  # !! Exported from a different calling environment
+    return env_vars
+
+
+def _write_direnv_cache(cwd: Path, env_vars: dict, parent: str) -> None:
+    cache_file = _direnv_cache_file(cwd)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # > Owner-only permissions, in case .envrc exports anything private
+        fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "stamp": _envrc_stamp(cwd),
+                    "parent": parent,
+                    "env": env_vars,
+                },
+                f,
+            )
+    except OSError:
+        pass  # > Caching is best effort
+
+
+def _load_direnv_envrc(
+    cwd: str | Path = ".", quiet: bool = False, use_cache: bool = True
+) -> None:
+    """Merge the official .envrc into the current environment.
+
+    The output of `direnv export json` is cached, so repeated calls don't
+    spawn a subprocess. The cache is keyed on:
+    - mtime and size of .envrc and .secrets.env;
+    - direnv's allow state;
+    - the caller's values of the exported variables and PATH.
+    Exports that may hold secrets (a .secrets.env, or variables named
+    like tokens/passwords) are never written to disk.
+    """
 
     ### Skip if we already ran inside a direnv session
     if "DIRENV_DIR" in os.environ:
         return  # !! Early exit; 2nd Call causes JSONDecodeError
 
+    ### Use cached export if .envrc is unchanged
+    cwd = Path(cwd)
+    cached = _read_direnv_cache(cwd) if use_cache else None
+    if cached is not None:
+        _apply_env(cached)
+        return  # !! Early exit, no subprocess
+
     ### Prepare child-process environment
     child_env = os.environ.copy()  # < Lives only until child process spawns
     if quiet:
@@ -131,12 +248,21 @@ def _load_direnv_envrc(cwd: str | Path = ".", quiet: bool = False) -> None:
             env=child_env,  # < Use our modified environment
             stderr=subprocess.DEVNULL if quiet else None,
         )
-        os.environ.update(json.loads(payload))  # idempotent; no new venv
-    except (FileNotFoundError, subprocess.CalledProcessError):
+        env_vars = json.loads(payload)
+    except (FileNotFoundError, subprocess.CalledProcessError, ValueError):
         # > direnv binary missing
-        # > .envrc not yet allowed
+        # > .envrc not yet allowed (or denied)
         # > export produced non-JSON because of an unexpected message
-        pass
+        try:
+            _direnv_cache_file(cwd).unlink(missing_ok=True)
+        except OSError:
+            pass
+        return
+    ### Key on the caller's environment *before* applying the diff
+    parent = _parent_digest(list(env_vars))
+    _apply_env(env_vars)  # idempotent; no new venv
+    if use_cache and not _has_secrets(cwd, env_vars):
+        _write_direnv_cache(cwd, env_vars, parent)
 
 
 if __name__ == "__main__":
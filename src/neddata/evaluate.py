@@ -0,0 +1,365 @@
+"""Benchmark retrievers against gold identifications, e.g.
+``Benchmark/RAG_Ben-Cist_from_CompleteKDB.json`` (``input`` = header|sublemma,
+``ID`` = list of gold ids):
+- load_cases(): Read the benchmark into BenchCases
+- run_benchmark(): Quality (recall@k, MRR) and speed (latency percentiles,
+  throughput, peak memory) of any retriever callable
+- BenchResult.to_json(): Write results, to compare retrievers run over run
+- compare_results(): Diff two results, flag worse quality or speed
+
+A retriever is ``retriever(query: str, k: int) -> Sequence[id]``, ranked
+best first. A case can have several gold ids, all of them relevant:
+recall@k is the fraction of them in the first k, MRR uses the rank of the
+first one retrieved.
+"""
+
+# %%
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Sequence
+
+if TYPE_CHECKING:
+    from neddata.datamodel import Catalog
+
+Retriever = Callable[[str, int], Sequence[Hashable]]
+
+BENCHMARK_KEY = "benchmark/rag_ben_cist_from_completekdb.json"
+
+
+# =====================================================================
+# === Cases
+# =====================================================================
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    query: str
+    gold: frozenset  # < Gold ids, all of them relevant
+
+
+def load_cases(
+    catalog: Catalog | None = None,
+    key: str = BENCHMARK_KEY,
+    query_field: str = "input",
+    gold_field: str = "ID",
+) -> list[BenchCase]:
+    """Read a JSON list of ``{query_field: str, gold_field: [ids]}``
+    records from *catalog* (default: the abbey catalog)."""
+    if catalog is None:
+        from neddata import abbey_catalog as catalog
+    records = catalog.load(key)
+    return [
+        BenchCase(
+            query=r[query_field],
+            gold=frozenset(
+                r[gold_field]
+                if isinstance(r[gold_field], list)
+                else [r[gold_field]]
+            ),
+        )
+        for r in records
+    ]
+
+
+# =====================================================================
+# === Metrics
+# =====================================================================
+
+
+def recall_at_k(ranked: Sequence[Hashable], gold: frozenset, k: int) -> float:
+    """Fraction of *gold* ids within the first *k* of *ranked*."""
+    if not gold:
+        return 0.0
+    return len(gold.intersection(ranked[:k])) / len(gold)
+
+
+def reciprocal_rank(ranked: Sequence[Hashable], gold: frozenset) -> float:
+    """1 / rank of the first gold id retrieved (the others don't count),
+    0 if none was."""
+    for rank, doc in enumerate(ranked, start=1):
+        if doc in gold:
+            return 1.0 / rank
+    return 0.0
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    """Linear-interpolated percentile, *q* in [0, 100]."""
+    s = sorted(values)
+    if not s:
+        return float("nan")
+    pos = (len(s) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(s) - 1)
+    return s[lo] + (s[hi] - s[lo]) * (pos - lo)
+
+
+# =====================================================================
+# === Run
+# =====================================================================
+
+
+@dataclass
+class BenchResult:
+    name: str
+    n_queries: int
+    k: int
+    recall: dict[str, float]  # < "recall@<k>" -> mean recall
+    mrr: float
+    latency_ms: dict[str, float]  # < p50, p95, p99, mean, max
+    throughput_qps: float
+    peak_traced_mb: float | None  # < Python allocations during one pass
+    maxrss_mb: float | None  # < Peak RSS of the process, None on Windows
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    def __repr__(self) -> str:
+        recall = ", ".join(f"{k}={v:.3f}" for k, v in self.recall.items())
+        lat = self.latency_ms
+        return (
+            f"BenchResult('{self.name}', n={self.n_queries}, {recall}, "
+            f"mrr={self.mrr:.3f}, p50={lat['p50']:.2f} ms, "
+            f"p95={lat['p95']:.2f} ms, p99={lat['p99']:.2f} ms, "
+            f"{self.throughput_qps:,.0f} q/s)"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def to_json(self, path: Path | str) -> Path:
+        """Write the result as JSON, creating parent directories."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+    @classmethod
+    def from_json(cls, path: Path | str) -> BenchResult:
+        with open(path, encoding="utf-8") as f:
+            return cls(**json.load(f))
+
+
+def _maxrss_mb() -> float | None:
+    """Peak RSS of the process, None where ``resource`` is missing."""
+    try:
+        import resource  # < Unix only
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    ### Linux reports KiB, macOS bytes
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / 1024
+
+
+def run_benchmark(
+    retriever: Retriever,
+    cases: Sequence[BenchCase] | None = None,
+    ks: Sequence[int] = (1, 5, 10),
+    name: str | None = None,
+    warmup: int = 1,
+    trace_memory: bool = True,
+) -> BenchResult:
+    """Run *retriever* once per case and score its rankings.
+
+    :param ks: Cut-offs for recall@k, the retriever is asked for max(ks)
+    :param warmup: Untimed calls before measuring (caches, lazy imports)
+    :param trace_memory: One extra pass under ``tracemalloc`` for the peak
+        of Python allocations. Kept out of the timed pass, tracing slows
+        allocation-heavy code down.
+    """
+    cases = load_cases() if cases is None else cases
+    k = max(ks)
+    for case in cases[:warmup]:
+        retriever(case.query, k)
+
+    ### Timed pass
+    rankings, latencies = [], []
+    t_start = time.perf_counter()
+    for case in cases:
+        t = time.perf_counter()
+        ranked = list(retriever(case.query, k))
+        latencies.append((time.perf_counter() - t) * 1000)
+        rankings.append(ranked)
+    total_s = time.perf_counter() - t_start
+
+    ### Memory pass
+    peak_mb = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            for case in cases:
+                retriever(case.query, k)
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1 << 20)
+        finally:
+            tracemalloc.stop()
+
+    ### Quality
+    n = max(len(cases), 1)
+    recall = {
+        f"recall@{kk}": sum(
+            recall_at_k(r, c.gold, kk) for r, c in zip(rankings, cases)
+        )
+        / n
+        for kk in ks
+    }
+    mrr = sum(reciprocal_rank(r, c.gold) for r, c in zip(rankings, cases)) / n
+
+    return BenchResult(
+        name=name or getattr(retriever, "__name__", type(retriever).__name__),
+        n_queries=len(cases),
+        k=k,
+        recall=recall,
+        mrr=mrr,
+        latency_ms={
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "mean": sum(latencies) / n,
+            "max": max(latencies, default=float("nan")),
+        },
+        throughput_qps=len(cases) / total_s if total_s > 0 else float("inf"),
+        peak_traced_mb=peak_mb,
+        maxrss_mb=_maxrss_mb(),
+        meta={
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+    )
+
+
+# =====================================================================
+# === Compare
+# =====================================================================
+
+
+@dataclass
+class ResultComparison:
+    """Metrics of two BenchResults: ``(metric, baseline, current, status)``
+    with status "ok", "better" or "worse"."""
+
+    baseline: str
+    current: str
+    rows: list[tuple[str, float, float, str]]
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> list[str]:
+        return [metric for metric, *_, status in self.rows if status == "worse"]
+
+    def __repr__(self) -> str:
+        lines = [f"!! {w}" for w in self.warnings]
+        lines.append(
+            f"{'metric':<16} {self.baseline[:12]:>12} {self.current[:12]:>12}"
+        )
+        for metric, base, cur, status in self.rows:
+            mark = "" if status == "ok" else f"  {status}"
+            lines.append(f"{metric:<16} {base:>12.4g} {cur:>12.4g}{mark}")
+        n = len(self.regressions)
+        lines.append(f"{n} regression(s)" if n else "No regressions")
+        return "\n".join(lines)
+
+
+def compare_results(
+    baseline: BenchResult,
+    current: BenchResult,
+    tolerance: float = 0.005,
+    threshold: float = 0.25,
+) -> ResultComparison:
+    """Diff *current* against *baseline*, e.g. the same retriever run over
+    run, or two retrievers on the same cases.
+
+    :param tolerance: Absolute drop of recall@k or MRR that is still "ok"
+    :param threshold: Relative change of latency percentiles and
+        throughput that is still "ok", timings are noisy
+    """
+    warns = []
+    if baseline.n_queries != current.n_queries:
+        warns.append(
+            f"Different cases: {baseline.n_queries} vs. "
+            f"{current.n_queries} queries"
+        )
+    rows = []
+    ### Quality, higher is better
+    quality = {**baseline.recall, "mrr": baseline.mrr}
+    for metric, b in quality.items():
+        c = current.mrr if metric == "mrr" else current.recall.get(metric)
+        if c is None:
+            continue  # < Other ks
+        status = "worse" if c < b - tolerance else "ok"
+        status = "better" if c > b + tolerance else status
+        rows.append((metric, b, c, status))
+    ### Speed, relative
+    for q in ("p50", "p95", "p99"):
+        b, c = baseline.latency_ms[q], current.latency_ms[q]
+        status = "worse" if c > b * (1 + threshold) else "ok"
+        status = "better" if b > c * (1 + threshold) else status
+        rows.append((f"{q}_ms", b, c, status))
+    b, c = baseline.throughput_qps, current.throughput_qps
+    status = "worse" if b > c * (1 + threshold) else "ok"
+    status = "better" if c > b * (1 + threshold) else status
+    rows.append(("throughput_qps", b, c, status))
+    return ResultComparison(
+        baseline=baseline.name, current=current.name, rows=rows, warnings=warns
+    )
+
+
+if __name__ == "__main__":
+    import re
+
+    from neddata import abbey_catalog as cat
+
+    cases = load_cases(cat)
+    print(f"{len(cases)} cases")
+
+    # %%
+    ### BM25 over the RAGI chunks, chunk position -> id_gsn
+    ragi = cat["kdb/kdb_complete_ragi/"]
+    index = ragi.bm25()
+    with open(ragi.fetch_file("chunks.json")[0]) as f:
+        chunk_ids = [int(re.match(r"id_gsn: (\d+)", c).group(1)) for c in json.load(f)]
+
+    def _tokenize(text: str) -> list[str]:
+        """Like chunks_tokenized.json: lowercase, with and without dots."""
+        tokens = []
+        for w in re.split(r"[\s|,;:()\[\]]+", text.lower()):
+            tokens.extend({w, w.strip(".")} - {""})
+        return tokens
+
+    def bm25(query: str, k: int) -> list[int]:
+        doc_ids, _ = index.query([_tokenize(query)], k=4 * k)
+        ### Several chunks per monastery: Keep the first of each id
+        ranked = list(dict.fromkeys(chunk_ids[i] for i in doc_ids[0]))
+        return ranked[:k]
+
+    result = run_benchmark(bm25, cases)
+    print(result)
+
+    # %%
+    ### Fuzzy linking of the header against KDB names
+    from neddata.linking import FuzzyLinker
+
+    linker = FuzzyLinker.from_frame(cat.load("kdb/kdb_complete.csv"))
+
+    def fuzzy(query: str, k: int) -> list[int]:
+        ids, _ = linker.link([query], k=k)
+        return ids[0].tolist()
+
+    print(run_benchmark(fuzzy, cases))
+
+    # %%
+    ### Write, to compare with the next run
+    import tempfile
+
+    out = result.to_json(Path(tempfile.gettempdir()) / "bench_bm25.json")
+    print(BenchResult.from_json(out) == result)
+
+    # %%
+    ### Next run (or another retriever) against the saved one
+    print(compare_results(BenchResult.from_json(out), run_benchmark(bm25, cases)))
@@ -0,0 +1,425 @@
+"""One catalogue over all installed dataset packages (``neddata.abbey``,
+...), with keys prefixed by the dataset name:
+``"abbey/kdb/kdb_complete.csv"``.
+- discover_datasets(): Find dataset packages through the
+  ``neddata.datasets`` entry point group, and by scanning ``neddata.*``
+  for packages that ship a ``pooch_registry.txt``
+- FederatedCatalog: Mapping over all datasets, ``cat.load("abbey/...")``
+
+Listing, globbing and searching keys only reads the registries (plain
+text). A dataset's ``catalog.py``, with its pooch, Catalog and custom
+loaders, is imported when one of its resources is first touched. Datasets
+that are never used cost one directory listing.
+
+Third-party dataset packages register themselves in their
+``pyproject.toml``::
+
+    [project.entry-points."neddata.datasets"]
+    my_dataset = "my_package.my_dataset"  # < Has catalog.py with `cat`
+"""
+
+# %%
+from __future__ import annotations
+
+import importlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping
+
+from neddata.datamodel import (
+    SHEET_SEP,
+    Catalog,
+    PrefetchReport,
+    Resource,
+    _format_key,
+)
+from neddata.utils.keyindex import KeyIndex, literal_prefix
+
+if TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
+
+ENTRY_POINT_GROUP = "neddata.datasets"
+REGISTRY_FNAME = "pooch_registry.txt"
+CATALOG_MODULE = "catalog"  # < <package>.catalog defines `cat`
+SEP = "/"  # < Between dataset name and key
+
+
+# =====================================================================
+# === Discovery
+# =====================================================================
+
+
+@dataclass(frozen=True)
+class Dataset:
+    name: str  # < Key prefix, e.g. "abbey"
+    package: str  # < e.g. "neddata.abbey"
+
+    @property
+    def registry(self) -> Path | Traversable | None:
+        """Path of the shipped registry, found without importing the
+        package itself (only its parents)."""
+        from importlib.resources import files
+        from importlib.util import find_spec
+
+        try:
+            spec = find_spec(self.package)
+        except (ImportError, ValueError):
+            return None
+        if spec is None:
+            return None
+        if spec.submodule_search_locations:
+            for location in spec.submodule_search_locations:
+                p = Path(location) / REGISTRY_FNAME
+                if p.is_file():
+                    return p
+            return None
+        ### Not on the file system (e.g. zipped), needs the import
+        p = files(self.package) / REGISTRY_FNAME
+        return p if p.is_file() else None
+
+    def read_registry(self) -> list[str]:
+        """File names listed in the registry, same parsing as pooch."""
+        registry = self.registry
+        if registry is None:
+            return []
+        fnames = []
+        with registry.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    fnames.append(line.split()[0])
+        return fnames
+
+
+def discover_datasets(
+    entry_points: bool = True, scan: bool = True
+) -> dict[str, Dataset]:
+    """Dataset packages by name. Entry points win over scanned packages
+    of the same name. Nothing is imported.
+
+    :param entry_points: Read the ``neddata.datasets`` entry point group
+    :param scan: Look for ``neddata.<name>/pooch_registry.txt``
+    """
+    found: dict[str, Dataset] = {}
+    if entry_points:
+        from importlib.metadata import entry_points as _entry_points
+
+        for ep in _entry_points(group=ENTRY_POINT_GROUP):
+            name = _format_key(ep.name)
+            found.setdefault(name, Dataset(name, ep.module))
+    if scan:
+        import pkgutil
+
+        import neddata
+
+        for info in pkgutil.iter_modules(neddata.__path__):
+            if not info.ispkg or info.name.startswith("_"):
+                continue
+            name = _format_key(info.name)
+            location = getattr(info.module_finder, "path", None)
+            if name in found or location is None:
+                continue
+            if (Path(location) / info.name / REGISTRY_FNAME).is_file():
+                found[name] = Dataset(name, f"neddata.{info.name}")
+    return dict(sorted(found.items()))
+
+
+# =====================================================================
+# === FederatedCatalog
+# =====================================================================
+
+
+class FederatedCatalog(Mapping[str, Resource]):
+    """Read-only catalogue over several dataset catalogues.
+
+    Keys are ``<dataset>/<key of the dataset's Catalog>``. Until a dataset
+    is imported, its keys are derived from its registry with the default
+    :attr:`Catalog.DIR_PATTERNS`; afterwards its Catalog's own keys are
+    used.
+
+    :param datasets: Fixed datasets, default is :func:`discover_datasets`
+        on first use
+    """
+
+    def __init__(
+        self,
+        datasets: Iterable[Dataset] | None = None,
+        entry_points: bool = True,
+        scan: bool = True,
+    ) -> None:
+        self._datasets: dict[str, Dataset] | None = (
+            None if datasets is None else {d.name: d for d in datasets}
+        )
+        self._discover = dict(entry_points=entry_points, scan=scan)
+        self._catalogs: dict[str, Catalog] = {}  # < Imported datasets
+        self._indexed: set[str] = set()  # < Datasets with keys in _index
+        self._synced: dict[str, int] = {}  # < Imported dataset -> len(cat)
+        self._index = KeyIndex()  # < Prefixed keys
+        self._lock = threading.RLock()
+
+    # =================================================================
+    # === Datasets
+    # =================================================================
+
+    @property
+    def datasets(self) -> dict[str, Dataset]:
+        if self._datasets is None:
+            with self._lock:
+                if self._datasets is None:
+                    self._datasets = discover_datasets(**self._discover)
+        return self._datasets
+
+    def catalog(self, name: str) -> Catalog:
+        """The Catalog of dataset *name*, importing its ``catalog.py`` on
+        first access."""
+        name = _format_key(name)
+        cat = self._catalogs.get(name)
+        if cat is not None:
+            return cat
+        dataset = self._dataset(name)
+        with self._lock:
+            if name not in self._catalogs:
+                module = importlib.import_module(
+                    f"{dataset.package}.{CATALOG_MODULE}"
+                )
+                self._catalogs[name] = module.cat
+                ### The Catalog's keys replace the registry-derived ones
+                self._drop_keys(name)
+                self._index.update(self._prefixed(name, module.cat.keys()))
+                self._indexed.add(name)
+                self._synced[name] = len(module.cat)
+        return self._catalogs[name]
+
+    @property
+    def imported(self) -> list[str]:
+        """Names of the datasets whose catalogue was imported."""
+        return sorted(self._catalogs)
+
+    def _dataset(self, name: str) -> Dataset:
+        if name not in self.datasets:
+            raise KeyError(
+                f"Dataset '{name}' not found. Known datasets: "
+                f"{list(self.datasets)}"
+            )
+        return self.datasets[name]
+
+    def _split(self, key: str) -> tuple[str, str]:
+        """``"abbey/kdb/x.csv"`` -> ``("abbey", "kdb/x.csv")``"""
+        name, sep, rest = _format_key(key).partition(SEP)
+        if not sep:
+            raise KeyError(
+                f"Key '{key}' has no dataset prefix, e.g. "
+                f"'{next(iter(self.datasets), '<dataset>')}{SEP}{key}'"
+            )
+        self._dataset(name)
+        return name, rest
+
+    # =================================================================
+    # === Keys
+    # =================================================================
+
+    @staticmethod
+    def _prefixed(name: str, keys: Iterable[str]) -> Iterator[str]:
+        return (f"{name}{SEP}{key}" for key in keys)
+
+    def _drop_keys(self, name: str) -> None:
+        for key in self._index.with_prefix(f"{name}{SEP}"):
+            self._index.remove(key)
+        self._indexed.discard(name)
+
+    def _ensure_keys(self, names: Iterable[str] | None = None) -> None:
+        """Add the keys of datasets *names* (default: all) to the index,
+        read from their registries."""
+        names = self.datasets if names is None else names
+        with self._lock:
+            for name in names:
+                cat = self._catalogs.get(name)
+                if cat is not None and len(cat) != self._synced.get(name):
+                    ### Sheet keys join a Catalog when its sheets are listed
+                    self._index.update(self._prefixed(name, cat.keys()))
+                    self._synced[name] = len(cat)
+                if name in self._indexed:
+                    continue
+                fnames = self.datasets[name].read_registry()
+                keys = Catalog.keys_in_registry(fnames)
+                self._index.update(self._prefixed(name, keys))
+                self._indexed.add(name)
+
+    def _names_for(self, pattern: str) -> list[str]:
+        """Datasets a key pattern can match, from its literal prefix."""
+        name, sep, _ = literal_prefix(pattern).partition(SEP)
+        if sep:
+            return [name] if name in self.datasets else []
+        return [n for n in self.datasets if n.startswith(name)]
+
+    def keys(self) -> list[str]:
+        """All keys of all datasets, sorted. Imports nothing."""
+        self._ensure_keys()
+        return self._index.keys()
+
+    def glob(self, pattern: str) -> list[str]:
+        """Keys matching the shell-style *pattern*, e.g. ``"abbey/kdb/*"``.
+        Only registries of datasets the pattern can match are read."""
+        pattern = _format_key(pattern)
+        self._ensure_keys(self._names_for(pattern))
+        return self._index.glob(pattern)
+
+    def search(self, query: str, cutoff: int = 80) -> list[str]:
+        """Fuzzy search over the keys of all datasets."""
+        self._ensure_keys()
+        return self._index.search(_format_key(query), cutoff=cutoff)
+
+    def ls(self, prefix: str = "") -> list[str]:
+        """Entries directly below *prefix*. ``ls()`` lists the datasets
+        without reading any registry."""
+        prefix = _format_key(prefix)
+        name = prefix.strip(SEP).partition(SEP)[0]
+        if not name:
+            return [f"{n}{SEP}" for n in self.datasets]
+        if name in self.datasets:
+            self._ensure_keys([name])
+        return self._index.ls(prefix)
+
+    # =================================================================
+    # === Load
+    # =================================================================
+
+    def load(self, key: str) -> Any:
+        """Load a resource, see :meth:`Catalog.load`."""
+        name, rest = self._split(key)
+        return self.catalog(name).load(rest)
+
+    def iter_chunks(self, key: str, chunksize: int = 10_000) -> Iterator[Any]:
+        """Iterate over a DataFile in chunks, see :meth:`Catalog.iter_chunks`."""
+        name, rest = self._split(key)
+        return self.catalog(name).iter_chunks(rest, chunksize)
+
+    async def aload(self, key: str, max_concurrency: int = 8) -> Any:
+        """Load a resource asynchronously, see :meth:`Catalog.aload`."""
+        name, rest = self._split(key)
+        return await self.catalog(name).aload(rest, max_concurrency)
+
+    def prefetch(
+        self,
+        patterns: str | Iterable[str] = "*",
+        workers: int = 8,
+        progress: Callable[[str, BaseException | None], None] | None = None,
+    ) -> PrefetchReport:
+        """Download the resources matching *patterns* (globs over prefixed
+        keys), dataset by dataset. Only the datasets with matches are
+        imported. Report entries are prefixed with the dataset name."""
+        patterns = [patterns] if isinstance(patterns, str) else patterns
+        by_dataset: dict[str, list[str]] = {}
+        for pattern in patterns:
+            for key in self.glob(pattern):
+                name, rest = self._split(key)
+                by_dataset.setdefault(name, []).append(rest)
+        report = PrefetchReport()
+        for name, keys in by_dataset.items():
+            sub = self.catalog(name).prefetch(
+                [self._escape(k) for k in keys],
+                workers=workers,
+                progress=progress,
+            )
+            report.fetched.update(self._prefixed_items(name, sub.fetched))
+            report.failed.update(self._prefixed_items(name, sub.failed))
+            report.seconds += sub.seconds
+        return report
+
+    @staticmethod
+    def _escape(key: str) -> str:
+        """Glob that matches exactly *key*."""
+        import glob
+
+        return glob.escape(key)
+
+    @staticmethod
+    def _prefixed_items(name: str, d: dict[str, Any]) -> dict[str, Any]:
+        return {f"{name}{SEP}{k}": v for k, v in d.items()}
+
+    # =================================================================
+    # === Mapping API
+    # =================================================================
+
+    def __getitem__(self, key: str) -> Resource:
+        name, rest = self._split(key)
+        return self.catalog(name)[rest]
+
+    def get(self, key: str, default: Any = None) -> Resource | Any:
+        """See :meth:`Catalog.get`, *default* for unknown datasets."""
+        try:
+            name, rest = self._split(key)
+        except KeyError:
+            return default
+        return self.catalog(name).get(rest, default)
+
+    def __contains__(self, key: object) -> bool:
+        """Read from the registries, except for sheet keys and imported
+        datasets: Those ask the dataset's Catalog, see
+        :meth:`Catalog.__contains__`."""
+        if not isinstance(key, str):
+            return False
+        key = _format_key(key)
+        name, _, rest = key.partition(SEP)
+        if name not in self.datasets:
+            return False
+        if SHEET_SEP in rest or name in self._catalogs:
+            return rest in self.catalog(name)
+        self._ensure_keys([name])
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __repr__(self) -> str:
+        s = "\n    "
+        datasets = [
+            f"{d.name} = {d.package}"
+            + (" (imported)" if d.name in self._catalogs else "")
+            for d in self.datasets.values()
+        ]
+        return (
+            f"<{self.__class__.__name__}(datasets={len(self.datasets)}, "
+            f"imported={len(self._catalogs)})>\n"
+            f" .datasets = {s}- {f'{s}- '.join(datasets)}\n"
+        )
+
+
+# > Module-level instance, as `neddata.catalog`. Constructing it discovers
+# > nothing yet
+cat = FederatedCatalog()
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # %%
+    t = time.perf_counter()
+    print(cat.ls())
+    print(cat.glob("abbey/kdb/*"))
+    print(f"{(time.perf_counter() - t) * 1000:.1f} ms")
+    registry_keys = cat.glob("abbey/*")
+    assert "neddata.abbey.catalog" not in sys.modules
+    print(cat)
+
+    # %%
+    ### First touch imports the abbey catalogue, with its custom loaders
+    t = time.perf_counter()
+    df = cat.load("abbey/kdb/kdb_complete.csv")
+    print(df.shape, f"{(time.perf_counter() - t) * 1000:.1f} ms")
+    assert "neddata.abbey.catalog" in sys.modules
+    print(cat["abbey/regests/2_ben_cist_identifizierungen.csv"].loader)
+
+    # %%
+    ### Same keys as the dataset's own Catalog
+    from neddata.abbey.catalog import cat as abbey
+
+    assert cat.glob("abbey/*") == [f"abbey/{k}" for k in abbey.keys()]
+    assert registry_keys == cat.glob("abbey/*")
+    print(cat.search("kdb complete"))
@@ -0,0 +1,435 @@
+"""Structured events for every load, to see which resources dominate job
+startup:
+- LoadEvent: Time spent downloading, verifying hashes and parsing, bytes
+  downloaded & read, size of the loaded object, peak traced memory
+- add_sink() / recording(): Send events to callables ("sinks")
+- StatsTable, JsonlSink, LoggingSink: Sinks for an in-memory summary, a
+  JSON-lines file and the ``logging`` module
+
+Without sinks, loads are not instrumented at all: :func:`record` and
+:func:`stage` return after one check.
+"""
+
+# %%
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Literal
+
+if TYPE_CHECKING:
+    import pooch
+
+Sink = Callable[["LoadEvent"], None]
+Stage = Literal["download", "verify", "parse"]
+
+_log = logging.getLogger(__name__)
+_sinks: list[tuple[Sink, bool]] = []  # < (sink, trace_memory)
+_current: contextvars.ContextVar[LoadEvent | None] = contextvars.ContextVar(
+    "neddata_load_event", default=None
+)
+### Records tracing memory right now; tracemalloc stops after the last one
+_tracing_lock = threading.Lock()
+_tracing_records = 0
+_started_tracing = False  # < We started tracemalloc, not the user
+
+
+# =====================================================================
+# === Event
+# =====================================================================
+
+
+@dataclass
+class LoadEvent:
+    """One load of a resource. Stage times don't add up to *total_s*,
+    the rest is bookkeeping (cache lookups, sidecar writes, ...)."""
+
+    key: str  # < Catalogue key, or the path for direct Resource loads
+    kind: str  # < "DataFile" or "DataDir"
+    package: str = ""
+    source: str = ""  # < "memory", "sidecar", "parse" or "dir"
+    download_s: float = 0.0
+    verify_s: float = 0.0  # < Hashing cached or downloaded files
+    parse_s: float = 0.0  # < Loader, sidecar read or archive unpacking
+    total_s: float = 0.0
+    bytes_downloaded: int = 0
+    bytes_read: int = 0  # < Size of the parsed file or sidecar
+    nbytes: int = 0  # < Estimated size of the loaded object
+    peak_traced_mb: float | None = None  # < Only if a sink traces memory
+    error: str | None = None
+    timestamp: float = field(default_factory=time.time)
+    pid: int = field(default_factory=os.getpid)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def __str__(self) -> str:
+        peak = (
+            ""
+            if self.peak_traced_mb is None
+            else f", peak={self.peak_traced_mb:.1f} MiB"
+        )
+        error = f", error={self.error}" if self.error else ""
+        return (
+            f"load {self.key} ({self.source or self.kind}): "
+            f"{self.total_s * 1000:.1f} ms = download "
+            f"{self.download_s * 1000:.1f} + verify {self.verify_s * 1000:.1f}"
+            f" + parse {self.parse_s * 1000:.1f} ms, "
+            f"read={self.bytes_read:,} B, nbytes={self.nbytes:,} B{peak}"
+            f"{error}"
+        )
+
+
+# =====================================================================
+# === Recording
+# =====================================================================
+
+
+def add_sink(sink: Sink, trace_memory: bool = False) -> Sink:
+    """Send every following :class:`LoadEvent` to *sink*.
+
+    :param trace_memory: Also record the peak of Python allocations per
+        load with ``tracemalloc``. Slows allocation-heavy parsing down,
+        and overlapping loads (threads, aload_many) share one peak.
+    """
+    _sinks.append((sink, trace_memory))
+    return sink
+
+
+def remove_sink(sink: Sink) -> None:
+    _sinks[:] = [(s, t) for s, t in _sinks if s is not sink]
+
+
+@contextmanager
+def recording(*sinks: Sink, trace_memory: bool = False) -> Iterator[None]:
+    """Add *sinks* for the duration of the ``with`` block."""
+    for sink in sinks:
+        add_sink(sink, trace_memory=trace_memory)
+    try:
+        yield
+    finally:
+        for sink in sinks:
+            remove_sink(sink)
+
+
+def current() -> LoadEvent | None:
+    """The event of the load running in this context, if recorded."""
+    return _current.get()
+
+
+@contextmanager
+def record(
+    key: str, kind: str, package: str = ""
+) -> Iterator[LoadEvent | None]:
+    """Time the load in the ``with`` block as one event and emit it to
+    the sinks. Nested records (``Catalog.load`` -> ``DataFile.load``)
+    add to the outer event. Yields None if there are no sinks."""
+    if not _sinks or _current.get() is not None:
+        yield _current.get()
+        return
+    event = LoadEvent(key=key, kind=kind, package=package)
+    token = _current.set(event)
+    trace = any(t for _, t in _sinks)
+    if trace:
+        _start_tracing()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    try:
+        yield event
+    except BaseException as e:
+        event.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        event.total_s = time.perf_counter() - start
+        obj = event.__dict__.pop("_result", None)
+        if obj is not None:
+            from neddata.cache import estimate_nbytes
+
+            event.nbytes = estimate_nbytes(obj)
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1] - base
+            event.peak_traced_mb = max(peak, 0) / (1 << 20)
+            _stop_tracing()
+        _current.reset(token)
+        emit(event)
+
+
+def _start_tracing() -> None:
+    global _tracing_records, _started_tracing
+    with _tracing_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _tracing_records += 1
+
+
+def _stop_tracing() -> None:
+    """Stop tracemalloc once no record traces any more, if we started it.
+    Overlapping records (threads) keep tracing until the last one ends."""
+    global _tracing_records, _started_tracing
+    with _tracing_lock:
+        _tracing_records -= 1
+        if _tracing_records == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+def emit(event: LoadEvent) -> None:
+    """Hand *event* to every sink. A failing sink never fails a load."""
+    for sink, _ in list(_sinks):
+        try:
+            sink(event)
+        except Exception:
+            _log.exception("Sink %r failed", sink)
+
+
+@contextmanager
+def stage(name: Stage) -> Iterator[None]:
+    """Add the time of the ``with`` block to ``<name>_s`` of the current
+    event, if any."""
+    event = _current.get()
+    if event is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        setattr(event, f"{name}_s", getattr(event, f"{name}_s") + elapsed)
+
+
+def result(obj: Any) -> None:
+    """Remember the loaded object of the current event. Its size is
+    estimated once, when the outermost :func:`record` ends."""
+    event = _current.get()
+    if event is not None:
+        event._result = obj  # type: ignore[attr-defined]
+
+
+def note(**fields: Any) -> None:
+    """Set fields of the current event, e.g. ``note(source="memory")``.
+    Integer byte counts are added up."""
+    event = _current.get()
+    if event is None:
+        return
+    for name, value in fields.items():
+        if name.startswith("bytes_"):
+            value += getattr(event, name)
+        setattr(event, name, value)
+
+
+def timed_fetch(
+    poochy: pooch.Pooch, fname: str, processor: Any = None
+) -> Path:
+    """``poochy.fetch(fname, processor)``, split into the stages of the
+    current event: Time inside pooch's downloader is download, time inside
+    *processor* (unzipping) is parse, the rest is hash verification.
+    For files not cached yet, pooch's setup before downloading counts as
+    download too."""
+    from pooch.downloaders import choose_downloader
+
+    event = _current.get()
+    if event is None:
+        return Path(poochy.fetch(fname, processor=processor))
+    timings = {"download": 0.0, "parse": 0.0}
+    cached = (Path(poochy.abspath) / fname).exists()
+
+    def downloader(url: str, output_file: Any, pup: Any) -> None:
+        entered = time.perf_counter()
+        ### Not cached: pooch's setup (lazy `import requests`) is download
+        if not cached and not timings["download"]:
+            timings["download"] += entered - start
+        try:
+            choose_downloader(url)(url, output_file, pup)
+        finally:
+            timings["download"] += time.perf_counter() - entered
+        if isinstance(output_file, (str, Path)):
+            note(bytes_downloaded=os.path.getsize(output_file))
+
+    def timed_processor(*args: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return processor(*args)
+        finally:
+            timings["parse"] += time.perf_counter() - start
+
+    start = time.perf_counter()
+    local = poochy.fetch(
+        fname,
+        processor=timed_processor if processor is not None else None,
+        downloader=downloader,
+    )
+    total = time.perf_counter() - start
+    event.download_s += timings["download"]
+    event.parse_s += timings["parse"]
+    event.verify_s += total - timings["download"] - timings["parse"]
+    return Path(local)
+
+
+# =====================================================================
+# === Sinks
+# =====================================================================
+
+
+class StatsTable:
+    """In-memory sink, keeps every event and sums them up per key."""
+
+    def __init__(self) -> None:
+        self.events: list[LoadEvent] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event: LoadEvent) -> None:
+        with self._lock:
+            self.events.append(event)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def summary(self, sort_by: str = "total_s") -> list[dict[str, Any]]:
+        """One row per key: Number of loads, summed times and bytes, max.
+        peak, and loads per source. Sorted by *sort_by*, descending."""
+        rows: dict[str, dict[str, Any]] = {}
+        for e in self.events:
+            row = rows.setdefault(
+                e.key,
+                {
+                    "key": e.key,
+                    "loads": 0,
+                    "total_s": 0.0,
+                    "download_s": 0.0,
+                    "verify_s": 0.0,
+                    "parse_s": 0.0,
+                    "bytes_downloaded": 0,
+                    "bytes_read": 0,
+                    "nbytes": 0,
+                    "peak_traced_mb": None,
+                    "errors": 0,
+                    "sources": defaultdict(int),
+                },
+            )
+            row["loads"] += 1
+            for name in (
+                "total_s",
+                "download_s",
+                "verify_s",
+                "parse_s",
+                "bytes_downloaded",
+                "bytes_read",
+            ):
+                row[name] += getattr(e, name)
+            row["nbytes"] = max(row["nbytes"], e.nbytes)
+            if e.peak_traced_mb is not None:
+                row["peak_traced_mb"] = max(
+                    row["peak_traced_mb"] or 0.0, e.peak_traced_mb
+                )
+            row["errors"] += e.error is not None
+            row["sources"][e.source or e.kind] += 1
+        for row in rows.values():
+            row["sources"] = dict(row["sources"])
+        return sorted(
+            rows.values(), key=lambda r: r[sort_by] or 0, reverse=True
+        )
+
+    def to_frame(self) -> Any:
+        """:meth:`summary` as a pandas DataFrame, indexed by key."""
+        import pandas as pd
+
+        return pd.DataFrame(self.summary()).set_index("key")
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events.clear()
+
+    def __repr__(self) -> str:
+        lines = [f"<{self.__class__.__name__}(events={len(self)})>"]
+        for r in self.summary()[:10]:  # < Slowest keys
+            lines.append(
+                f"  {r['total_s'] * 1000:9.1f} ms  x{r['loads']:<3} "
+                f"dl {r['download_s'] * 1000:7.1f}  "
+                f"verify {r['verify_s'] * 1000:7.1f}  "
+                f"parse {r['parse_s'] * 1000:7.1f}  {r['key']}"
+            )
+        return "\n".join(lines)
+
+
+class JsonlSink:
+    """Append every event as one JSON line to *path*. Each line is one
+    ``write()`` in append mode, so several processes can share a file."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def __call__(self, event: LoadEvent) -> None:
+        line = json.dumps(event.to_dict(), ensure_ascii=False) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.path}')"
+
+    @staticmethod
+    def read(path: Path | str) -> list[LoadEvent]:
+        """Events written to *path*, to compare runs over time."""
+        with open(path, encoding="utf-8") as f:
+            return [LoadEvent(**json.loads(line)) for line in f if line.strip()]
+
+
+class LoggingSink:
+    """Log every event as one record, the event is attached as
+    ``record.load_event`` (a dict) for structured handlers."""
+
+    def __init__(
+        self,
+        logger: logging.Logger | str = "neddata.load",
+        level: int = logging.INFO,
+    ) -> None:
+        self.logger = (
+            logging.getLogger(logger) if isinstance(logger, str) else logger
+        )
+        self.level = level
+
+    def __call__(self, event: LoadEvent) -> None:
+        level = logging.WARNING if event.error else self.level
+        self.logger.log(
+            level, "%s", event, extra={"load_event": event.to_dict()}
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.logger.name}')"
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    # > Sinks must go to the imported module, not to this __main__ copy
+    from neddata import instrument
+    from neddata.abbey.catalog import cat
+
+    # %%
+    stats = instrument.StatsTable()
+    jsonl = instrument.JsonlSink(
+        Path(tempfile.gettempdir()) / "neddata_loads.jsonl"
+    )
+    logging.basicConfig(level=logging.INFO)
+    with instrument.recording(
+        stats, jsonl, instrument.LoggingSink(), trace_memory=True
+    ):
+        cat.load("kdb/kdb_complete.csv")
+        cat.load("regests/2_ben_cist_identifizierungen.csv")
+        cat.load("kdb/kdb_complete.xlsx::kdb_complete")
+    print(stats)
+    print(instrument.JsonlSink.read(jsonl.path)[-1])
@@ -0,0 +1,311 @@
+"""BM25 retrieval over tokenized corpora (see :mod:`neddata.tokenstore`):
+- BM25Index.from_token_store(): Build the index
+- BM25Index.query(): Batched top-k search for lists of token lists
+- BM25Index.save() / .load(): Persist as ``.npz``
+
+The index is a term-major sparse matrix in CSR layout (``indptr``,
+``indices`` = document ids, ``data`` = BM25 weights). IDF and the
+document-length normalization are folded into ``data`` at build time, so
+scoring a batch of queries is one gather of posting lists followed by one
+``np.bincount`` into a (queries x documents) score matrix. Top-k uses
+``np.argpartition``. Only numpy is needed.
+"""
+
+# %%
+from __future__ import annotations
+
+from pathlib import Path
+
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from neddata.tokenstore import TokenStore
+
+SCORES_BUDGET = 1 << 24  # < Max. floats in one (queries x docs) score block
+POSTINGS_BUDGET = 1 << 23  # < Max. postings gathered for one block
+
+
+# =====================================================================
+# === BM25Index
+# =====================================================================
+
+
+class BM25Index:
+    """Okapi BM25 index with precomputed per-posting weights.
+
+    :param indptr: int64, postings of term *t* are ``indptr[t]:indptr[t+1]``
+    :param indices: int32, document id of each posting
+    :param data: float32, BM25 weight of each posting
+    :param vocab: Token strings, indexed by term id (from the TokenStore)
+    """
+
+    def __init__(
+        self,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        data: np.ndarray,
+        n_docs: int,
+        vocab: Sequence[str],
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> None:
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.n_docs = int(n_docs)
+        self.vocab = vocab
+        self.k1 = k1
+        self.b = b
+        self._token_to_id = {t: i for i, t in enumerate(vocab)}
+
+    def __repr__(self) -> str:
+        return (
+            f"BM25Index(docs={self.n_docs}, terms={len(self.vocab)}, "
+            f"postings={len(self.indices)}, k1={self.k1}, b={self.b})"
+        )
+
+    # =================================================================
+    # === Build
+    # =================================================================
+
+    @classmethod
+    def from_token_store(
+        cls, store: TokenStore, k1: float = 1.5, b: float = 0.75
+    ) -> BM25Index:
+        """Build the index from the memory-mapped ids of *store*."""
+        import numpy as np
+
+        n_docs, n_terms = len(store), len(store.vocab)
+        doc_len = store.lengths.astype(np.float64)
+        avgdl = doc_len.mean() if n_docs else 0.0
+
+        ### Term frequencies: Unique (term, doc) pairs, sorted term-major
+        doc_of_token = np.repeat(np.arange(n_docs, dtype=np.int64), store.lengths)
+        pairs = np.asarray(store.ids, dtype=np.int64) * n_docs + doc_of_token
+        pairs, tf = np.unique(pairs, return_counts=True)
+        terms, docs = np.divmod(pairs, n_docs)
+
+        ### IDF (Lucene variant, never negative)
+        df = np.bincount(terms, minlength=n_terms)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+
+        ### Weights
+        norm = k1 * (1 - b + b * doc_len[docs] / avgdl)
+        data = idf[terms] * tf * (k1 + 1) / (tf + norm)
+
+        indptr = np.zeros(n_terms + 1, dtype=np.int64)
+        np.cumsum(df, out=indptr[1:])
+        return cls(
+            indptr=indptr,
+            indices=docs.astype(np.int32),
+            data=data.astype(np.float32),
+            n_docs=n_docs,
+            vocab=store.vocab,
+            k1=k1,
+            b=b,
+        )
+
+    # =================================================================
+    # === Query
+    # =================================================================
+
+    def encode(self, tokens: Sequence[str]) -> np.ndarray:
+        """Term ids of *tokens*, unknown tokens are dropped."""
+        import numpy as np
+
+        lookup = self._token_to_id
+        ids = (lookup.get(t, -1) for t in tokens)
+        return np.fromiter((i for i in ids if i >= 0), dtype=np.int64)
+
+    def scores(self, queries: Sequence[Sequence[str]]) -> np.ndarray:
+        """Dense BM25 scores, shape (len(queries), n_docs)."""
+        return self.scores_ids([self.encode(q) for q in queries])
+
+    def scores_ids(self, queries: Sequence[np.ndarray]) -> np.ndarray:
+        """Like :meth:`scores`, for queries that are already term ids."""
+        import numpy as np
+
+        n_q = len(queries)
+        q_len = np.fromiter((len(q) for q in queries), dtype=np.int64, count=n_q)
+        terms = (
+            np.concatenate(queries).astype(np.int64)
+            if n_q
+            else np.zeros(0, dtype=np.int64)
+        )
+        q_of_term = np.repeat(np.arange(n_q, dtype=np.int64), q_len)
+
+        ### Gather the posting lists of all query terms at once
+        starts = self.indptr[terms]
+        n_post = self.indptr[terms + 1] - starts
+        total = int(n_post.sum())
+        shift = np.repeat(starts - (np.cumsum(n_post) - n_post), n_post)
+        postings = np.arange(total, dtype=np.int64) + shift
+
+        ### Accumulate into the flat (queries x docs) matrix
+        rows = np.repeat(q_of_term, n_post)
+        flat = rows * self.n_docs + self.indices[postings]
+        scores = np.bincount(
+            flat, weights=self.data[postings], minlength=n_q * self.n_docs
+        )
+        return scores.reshape(n_q, self.n_docs)
+
+    def query(
+        self, queries: Sequence[Sequence[str]], k: int = 10
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Top-*k* documents for each query (a list of tokens).
+
+        :return: ``(doc_ids, scores)``, both of shape (len(queries), k),
+            sorted by descending score. Ties keep no particular order.
+        """
+        import numpy as np
+
+        k = max(min(k, self.n_docs), 0)
+        doc_ids = np.empty((len(queries), k), dtype=np.int64)
+        top = np.empty((len(queries), k), dtype=np.float64)
+        if k == 0:
+            return doc_ids, top  # !! argpartition needs k >= 1
+        encoded = [self.encode(q) for q in queries]
+        for lo, hi in self._blocks(encoded):
+            scores = self.scores_ids(encoded[lo:hi])
+            idx = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            part = np.take_along_axis(scores, idx, axis=1)
+            order = np.argsort(-part, axis=1, kind="stable")
+            doc_ids[lo:hi] = np.take_along_axis(idx, order, axis=1)
+            top[lo:hi] = np.take_along_axis(part, order, axis=1)
+        return doc_ids, top
+
+    def _blocks(self, encoded: Sequence[np.ndarray]) -> list[tuple[int, int]]:
+        """Split queries into ``(lo, hi)`` blocks whose dense score matrix
+        and gathered posting lists stay within the budgets."""
+        import numpy as np
+
+        max_q = max(1, SCORES_BUDGET // max(self.n_docs, 1))
+        df = np.diff(self.indptr)
+        blocks, lo, postings = [], 0, 0
+        for i, q in enumerate(encoded):
+            n = int(df[q].sum())
+            if i > lo and (i - lo >= max_q or postings + n > POSTINGS_BUDGET):
+                blocks.append((lo, i))
+                lo, postings = i, 0
+            postings += n
+        if lo < len(encoded):
+            blocks.append((lo, len(encoded)))
+        return blocks
+
+    # =================================================================
+    # === Persist
+    # =================================================================
+
+    def save(self, path: Path) -> Path:
+        """Write the index to *path* (``.npz``), atomically."""
+        import os
+        import threading
+
+        import numpy as np
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ### Unique temp file per process & thread, published by os.replace()
+        ident = f"{os.getpid()}-{threading.get_ident()}"
+        tmp = path.with_name(f".{path.name}.{ident}.npz")
+        try:
+            np.savez(
+                tmp,
+                indptr=self.indptr,
+                indices=self.indices,
+                data=self.data,
+                n_docs=self.n_docs,
+                params=np.array([self.k1, self.b]),
+            )
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return path
+
+    @classmethod
+    def load(cls, path: Path, vocab: Sequence[str]) -> BM25Index:
+        """Read an index written by :meth:`save`. The vocabulary is not
+        stored twice, pass the one of the TokenStore it was built from."""
+        import numpy as np
+
+        with np.load(path) as npz:
+            k1, b = npz["params"].tolist()
+            return cls(
+                indptr=npz["indptr"],
+                indices=npz["indices"],
+                data=npz["data"],
+                n_docs=int(npz["n_docs"]),
+                vocab=vocab,
+                k1=k1,
+                b=b,
+            )
+
+
+if __name__ == "__main__":
+    import json
+    import math
+    import time
+
+    import numpy as np
+
+    from neddata import abbey_catalog as cat
+
+    # %%
+    ragi = cat["kdb/kdb_complete_ragi/"]
+    t = time.perf_counter()
+    index = ragi.bm25()
+    print(index, f"{(time.perf_counter() - t) * 1000:.1f} ms")
+    store = ragi.token_store()
+
+    # %%
+    ### Equivalence with a pure-Python BM25
+    def _bm25_reference(query: list[str], docs: list[list[str]]) -> list[float]:
+        k1, b, n = index.k1, index.b, len(docs)
+        avgdl = sum(map(len, docs)) / n
+        df: dict[str, int] = {}
+        for d in docs:
+            for t in set(d):
+                df[t] = df.get(t, 0) + 1
+        out = []
+        for d in docs:
+            s = 0.0
+            for t in query:
+                tf = d.count(t)
+                if not tf:
+                    continue
+                idf = math.log1p((n - df[t] + 0.5) / (df[t] + 0.5))
+                s += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(d) / avgdl))
+            out.append(s)
+        return out
+
+    docs = list(store)
+    query = docs[42][:6]
+    assert np.allclose(index.scores([query])[0], _bm25_reference(query, docs), rtol=1e-5)
+
+    # %%
+    ### Throughput: Short queries (5 tokens of a document), like regests
+    rng = np.random.default_rng(0)
+    picks = rng.choice(len(docs), size=2000, replace=False)
+    queries = [list(rng.permutation(docs[i])[:5]) for i in picks]
+    t = time.perf_counter()
+    doc_ids, scores = index.query(queries, k=10)
+    dt = time.perf_counter() - t
+    print(f"{len(queries) / dt:,.0f} queries/s (5 tokens)")
+    print(f"source in top-10: {np.mean([p in row for p, row in zip(picks, doc_ids)]):.3f}")
+
+    # %%
+    ### Worst case: Whole documents as queries, each should find itself
+    queries = [docs[i] for i in picks]
+    t = time.perf_counter()
+    doc_ids, scores = index.query(queries, k=10)
+    dt = time.perf_counter() - t
+    print(f"{len(queries) / dt:,.0f} queries/s (whole documents)")
+    print(f"self in top-10: {np.mean([p in row for p, row in zip(picks, doc_ids)]):.3f}")
+
+    # %%
+    ### Map hits back to the text chunks
+    with open(ragi.fetch_file("rag_chunks.json")[0]) as f:
+        rag_chunks = json.load(f)
+    print(rag_chunks[doc_ids[0][0]])
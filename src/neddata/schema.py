@@ -0,0 +1,249 @@
+"""Declared dtypes for the DataFrames of DataFiles, registered next to the
+loaders with ``Catalog.set_schema(pattern, schema)``:
+- Schema: Column -> dtype, e.g. ``"category"``, ``"string[pyarrow]"``,
+  ``"int32"``, ``"float32"`` or ``"downcast"``
+- Schema.apply(): Cast the declared columns of a parsed frame
+- SchemaReport: Memory per column without and with the schema
+
+Text dtypes (categorical, string) are handed to the parser as ``dtype=``
+if the loader accepts that keyword, so the object columns are never
+built. Numeric dtypes are applied to the parsed numbers, loaders often
+clean numbers first (e.g. ``lon_lat_to_numeric``).
+"""
+
+# %%
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+from dataclasses import dataclass, field
+
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+TEXT_DTYPES = ("category", "string", "string[python]", "string[pyarrow]")
+DOWNCAST = "downcast"  # < Smallest lossless int or float dtype
+
+
+@functools.lru_cache(maxsize=None)
+def accepts_dtype(loader: Callable[..., Any]) -> bool:
+    """Whether *loader* takes a ``dtype`` keyword, like ``pd.read_csv``."""
+    try:
+        return "dtype" in inspect.signature(loader).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _resolve(spec: str) -> str | None:
+    """*spec*, or None if it needs pyarrow and pyarrow is missing."""
+    from neddata.cache import columnar_available
+
+    if "pyarrow" in spec and not columnar_available():
+        return None  # < Keep object columns rather than failing the load
+    return spec
+
+
+# =====================================================================
+# === Schema
+# =====================================================================
+
+
+class Schema:
+    """Dtypes of some columns of a DataFrame. Columns missing from a frame
+    are skipped, so one schema can cover a glob of similar files.
+
+    :param dtypes: Column -> dtype string understood by pandas, or
+        ``"downcast"`` for the smallest int/float dtype holding the
+        values exactly (per frame, so chunks may come out smaller, see
+        :attr:`value_dependent`).
+        ``"float32"`` is lossy on purpose, ``"int32"`` etc. raise
+        ValueError if values don't fit.
+    """
+
+    def __init__(self, dtypes: Mapping[str, str]) -> None:
+        self.dtypes = dict(dtypes)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.dtypes})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Schema) and self.dtypes == other.dtypes
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.dtypes.items()))
+
+    @property
+    def token(self) -> str:
+        """Short hash of the declared dtypes, e.g. for sidecar names."""
+        ident = json.dumps(self.dtypes, sort_keys=True)
+        return hashlib.sha256(ident.encode()).hexdigest()[:12]
+
+    def parse_dtypes(self) -> dict[str, str]:
+        """Dtypes to hand to a parser (``read_csv(dtype=...)``): Only text
+        dtypes, every cell parses as text. Hence ``"category"`` on a
+        numeric column gives string categories."""
+        return {
+            col: resolved
+            for col, spec in self.dtypes.items()
+            if spec in TEXT_DTYPES and (resolved := _resolve(spec))
+        }
+
+    @property
+    def value_dependent(self) -> list[str]:
+        """Columns whose dtype depends on the values of the frame:
+        ``"downcast"`` picks the width, ``"category"`` the categories.
+        Chunks of one file can differ in these, pass the dtypes of the
+        whole frame to :meth:`apply` to line them up."""
+        return [
+            col
+            for col, spec in self.dtypes.items()
+            if spec in (DOWNCAST, "category")
+        ]
+
+    def apply(self, df: Any, resolved: Mapping[str, Any] | None = None) -> Any:
+        """Cast the declared columns of *df* in place and return it.
+        Columns already of their dtype are left alone, non-DataFrames are
+        returned unchanged.
+
+        :param resolved: Column -> exact dtype overriding the declared
+            one, e.g. the dtypes of the full frame for a chunk
+        """
+        import pandas as pd
+
+        if not isinstance(df, pd.DataFrame):
+            return df
+        resolved = resolved or {}
+        for col, spec in self.dtypes.items():
+            if col in df.columns:
+                df[col] = _cast(df[col], resolved.get(col, spec))
+        return df
+
+
+def _cast(s: pd.Series, spec: Any) -> pd.Series:
+    """Cast *s* to the dtype string *spec*, or to a dtype object."""
+    import numpy as np
+    import pandas as pd
+    from pandas.api.types import is_float_dtype, is_integer_dtype
+
+    if not isinstance(spec, str):
+        dtype = spec  # < Already resolved, e.g. CategoricalDtype
+    elif spec == DOWNCAST:
+        if is_integer_dtype(s.dtype) and isinstance(s.dtype, np.dtype):
+            return pd.to_numeric(s, downcast="integer")
+        if is_float_dtype(s.dtype) and isinstance(s.dtype, np.dtype):
+            return pd.to_numeric(s, downcast="float")  # < Only if exact
+        return s
+    elif (resolved := _resolve(spec)) is None:
+        return s
+    else:
+        dtype = pd.api.types.pandas_dtype(resolved)
+    if s.dtype == dtype:
+        return s
+    cast = s.astype(dtype)
+    ### numpy wraps integers around silently
+    if is_integer_dtype(dtype) and is_integer_dtype(s.dtype):
+        if not np.array_equal(cast.to_numpy(), s.to_numpy()):
+            raise ValueError(f"Column '{s.name}' does not fit into {dtype}")
+    return cast
+
+
+# =====================================================================
+# === Report
+# =====================================================================
+
+
+@dataclass
+class SchemaReport:
+    """Memory of a DataFrame without and with its schema, per column:
+    ``column -> (dtype before, dtype after, bytes before, bytes after)``.
+    """
+
+    key: str
+    columns: dict[str, tuple[str, str, int, int]] = field(
+        default_factory=dict
+    )
+
+    @property
+    def nbytes_before(self) -> int:
+        return sum(c[2] for c in self.columns.values())
+
+    @property
+    def nbytes_after(self) -> int:
+        return sum(c[3] for c in self.columns.values())
+
+    @property
+    def saved(self) -> int:
+        return self.nbytes_before - self.nbytes_after
+
+    @property
+    def ratio(self) -> float:
+        """Before / after, e.g. 4.0 for a frame four times smaller."""
+        return self.nbytes_before / max(self.nbytes_after, 1)
+
+    def __repr__(self) -> str:
+        mib = 1 << 20
+        lines = [
+            f"<{self.__class__.__name__}('{self.key}', "
+            f"before={self.nbytes_before / mib:.2f} MiB, "
+            f"after={self.nbytes_after / mib:.2f} MiB, "
+            f"saved={self.saved / mib:.2f} MiB, ratio={self.ratio:.1f}x)>"
+        ]
+        lines.extend(
+            f"  {col}: {d0} -> {d1}, {b0 / 1024:,.0f} -> {b1 / 1024:,.0f} KiB"
+            for col, (d0, d1, b0, b1) in self.columns.items()
+            if d0 != d1
+        )
+        return "\n".join(lines)
+
+
+def schema_report(
+    before: pd.DataFrame, after: pd.DataFrame, key: str = ""
+) -> SchemaReport:
+    """Compare the deep memory usage of a frame loaded without (*before*)
+    and with (*after*) its schema."""
+    mem0 = before.memory_usage(deep=True, index=False)
+    mem1 = after.memory_usage(deep=True, index=False)
+    return SchemaReport(
+        key=key,
+        columns={
+            col: (
+                str(before[col].dtype),
+                str(after[col].dtype),
+                int(mem0[col]),
+                int(mem1[col]),
+            )
+            for col in before.columns
+        },
+    )
+
+
+if __name__ == "__main__":
+    import numpy as np
+    import pandas as pd
+
+    # %%
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "order": rng.choice(["Benediktiner", "Zisterzienser"], 10_000),
+            "id": np.arange(10_000),
+            "lon": rng.uniform(5, 15, 10_000),
+            "half": rng.integers(0, 4, 10_000) / 2,
+        }
+    )
+    schema = Schema(
+        {"order": "category", "id": "int32", "lon": "float32", "half": DOWNCAST}
+    )
+    typed = schema.apply(df.copy())
+    print(typed.dtypes.to_dict())
+    print(schema_report(df, typed, key="demo"))
+
+    # %%
+    try:
+        Schema({"id": "int8"}).apply(df.copy())  # !! raises
+    except ValueError as e:
+        print(e)
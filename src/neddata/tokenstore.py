@@ -0,0 +1,185 @@
+"""Memory-mapped token store for tokenized corpora (nested JSON lists of
+token strings, e.g. ``KDB_Complete_RAGI/chunks_tokenized.json``):
+- build_token_store(): Convert the JSON once into a binary store
+- TokenStore: Read it back with (almost) zero load time
+
+Layout of a store directory:
+- ``vocab.json``: List of unique tokens, the index is the token id
+- ``ids.npy``: int32, token ids of all documents, concatenated
+- ``offsets.npy``: int64, document *i* is ``ids[offsets[i]:offsets[i+1]]``
+
+The arrays are opened with ``np.load(mmap_mode="r")``: Nothing is parsed,
+and concurrent workers share the OS page cache instead of each holding
+millions of small Python strings.
+"""
+
+# %%
+from __future__ import annotations
+
+import functools
+import json
+import os
+import shutil
+import threading
+from array import array
+from pathlib import Path
+
+from typing import TYPE_CHECKING, Iterable, Iterator, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+VOCAB_FNAME = "vocab.json"
+IDS_FNAME = "ids.npy"
+OFFSETS_FNAME = "offsets.npy"
+
+
+# =====================================================================
+# === Build
+# =====================================================================
+
+
+def build_token_store(src: Path, dest: Path, chunksize: int = 1_000) -> Path:
+    """Convert the nested JSON list *src* into a token store at *dest*.
+
+    The JSON is parsed incrementally, token ids are collected in compact
+    ``array`` buffers. The store is written into a temporary directory and
+    renamed, so readers never see a half-written store.
+    """
+    import numpy as np
+
+    from neddata.utils.fileio import iterchunks_json
+
+    vocab: dict[str, int] = {}
+    ids = array("i")  # < int32
+    offsets = array("q", [0])  # < int64
+    for docs in iterchunks_json(src, chunksize):
+        for tokens in docs:
+            if not isinstance(tokens, list):
+                raise ValueError(
+                    f"{src}: Expected a list of token lists, got {type(tokens).__name__}"
+                )
+            ids.extend(vocab.setdefault(t, len(vocab)) for t in tokens)
+            offsets.append(len(ids))
+
+    ### Write to a temporary dir per process & thread, then rename
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{os.getpid()}-{threading.get_ident()}")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir()
+    try:
+        np.save(tmp / IDS_FNAME, np.frombuffer(ids, dtype=np.int32))
+        np.save(tmp / OFFSETS_FNAME, np.frombuffer(offsets, dtype=np.int64))
+        with open(tmp / VOCAB_FNAME, "w", encoding="utf-8") as f:
+            json.dump(list(vocab), f, ensure_ascii=False)
+        try:
+            os.rename(tmp, dest)
+        except OSError:
+            if not dest.is_dir():
+                raise
+            # > Another process or thread was faster, its store is identical
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return dest
+
+
+# =====================================================================
+# === Read
+# =====================================================================
+
+
+class TokenStore(Sequence[list[str]]):
+    """Read-only view of a token store. Behaves like the nested list it
+    was built from (``len()``, indexing, iteration yield token lists), but
+    also exposes the memory-mapped id arrays for vectorized work."""
+
+    def __init__(self, path: Path) -> None:
+        import numpy as np
+
+        self.path = Path(path)
+        self.ids: np.ndarray = np.load(self.path / IDS_FNAME, mmap_mode="r")
+        self.offsets: np.ndarray = np.load(
+            self.path / OFFSETS_FNAME, mmap_mode="r"
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"TokenStore('{self.path.name}', docs={len(self)}, "
+            f"tokens={len(self.ids)})"
+        )
+
+    # === Vocabulary ==================================================
+
+    @functools.cached_property
+    def vocab(self) -> list[str]:
+        """Token strings, indexed by token id. Loaded on first access."""
+        with open(self.path / VOCAB_FNAME, encoding="utf-8") as f:
+            return json.load(f)
+
+    @functools.cached_property
+    def token_to_id(self) -> dict[str, int]:
+        return {t: i for i, t in enumerate(self.vocab)}
+
+    def encode(self, tokens: Iterable[str]) -> np.ndarray:
+        """Token ids of *tokens*, -1 for tokens not in the vocabulary."""
+        import numpy as np
+
+        lookup = self.token_to_id
+        return np.fromiter(
+            (lookup.get(t, -1) for t in tokens), dtype=np.int32
+        )
+
+    def decode(self, ids: Iterable[int]) -> list[str]:
+        vocab = self.vocab
+        return [vocab[i] for i in ids]
+
+    # === Documents ===================================================
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Number of tokens per document."""
+        import numpy as np
+
+        return np.diff(self.offsets)
+
+    def doc_ids(self, i: int) -> np.ndarray:
+        """Token ids of document *i*, a view into the memory map."""
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"Document index out of range: {i}")
+        return self.ids[self.offsets[i] : self.offsets[i + 1]]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return self.decode(self.doc_ids(i).tolist())
+
+    def __iter__(self) -> Iterator[list[str]]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+if __name__ == "__main__":
+    import time
+
+    from neddata import abbey_catalog as cat
+
+    # %%
+    ### Build (once) and open the store of the RAGI index
+    ragi = cat["kdb/kdb_complete_ragi/"]
+    t = time.perf_counter()
+    store = ragi.token_store()
+    print(store, f"{(time.perf_counter() - t) * 1000:.1f} ms")
+
+    # %%
+    ### Equivalence with the JSON
+    t = time.perf_counter()
+    with open(ragi.path_local / "chunks_tokenized.json") as f:
+        nested = json.load(f)
+    print(f"json.load: {(time.perf_counter() - t) * 1000:.1f} ms")
+    assert list(store) == nested
+    print(store[0][:8], store.doc_ids(0)[:8])
@@ -1 +1,21 @@
-from . import stdlib, fileio, pd
+"""Utility modules, imported lazily on first attribute access (e.g.
+``u.pd``), so that pandas & co. are only loaded when actually needed."""
+
+import importlib
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import stdlib, fileio, pd, keyindex
+
+_SUBMODULES = ("stdlib", "fileio", "pd", "keyindex")
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_SUBMODULES])
@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 import json
 from pathlib import Path
 
-import numpy as np
-import pandas as pd
+from typing import TYPE_CHECKING, Callable, Any, Iterator, Optional
 
-from typing import Callable, Any, Optional
+# > Heavy libraries are imported inside the loaders that need them
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 
 def defaultload_json(file_path: Path) -> dict:
@@ -19,18 +23,24 @@ def defaultload_text(file_path: Path) -> str:
         return f.read()
 
 
-def defaultload_csv(file_path: Path) -> pd.DataFrame:
+def defaultload_csv(file_path: Path, dtype: Any = None) -> pd.DataFrame:
     """Read a CSV file and return its contents as a pandas DataFrame."""
-    return pd.read_csv(file_path)
+    import pandas as pd
+
+    return pd.read_csv(file_path, dtype=dtype)
 
 
-def defaultload_excel(file_path: Path) -> pd.DataFrame:
+def defaultload_excel(file_path: Path, dtype: Any = None) -> pd.DataFrame:
     """Read an Excel file and return its contents as a pandas DataFrame."""
-    return pd.read_excel(file_path)
+    import pandas as pd
+
+    return pd.read_excel(file_path, dtype=dtype)
 
 
 def defaultload_npy(file_path: Path) -> np.ndarray:
     """Read a NumPy file and return its contents as a NumPy array."""
+    import numpy as np
+
     return np.load(file_path)
 
 
@@ -47,3 +57,488 @@ def get_default_loader(file_path: Path) -> Callable[[Path], Any] | None:
     """Return the default loader function for a given file type."""
     ext = file_path.suffix[1:]
     return DEFAULT_LOADERS.get(ext)
+
+
+# =====================================================================
+# === Chunked Iteration
+# =====================================================================
+# > Chunkers yield a file piece by piece, keeping memory flat for files
+# > that grow beyond what we want to hold at once.
+# > Signature: chunker(file_path, chunksize) -> Iterator[chunk]
+
+
+def iterchunks_csv(
+    file_path: Path, chunksize: int = 10_000, **read_csv_kwargs: Any
+) -> Iterator[pd.DataFrame]:
+    """Yield DataFrames of at most *chunksize* rows from a CSV file."""
+    import pandas as pd
+
+    with pd.read_csv(file_path, chunksize=chunksize, **read_csv_kwargs) as reader:
+        yield from reader
+
+
+_NUMBER_CHARS = "0123456789+-.eE"  # < Can continue a cut-off number
+
+
+def iterchunks_json(
+    file_path: Path, chunksize: int = 10_000, blocksize: int = 1 << 20
+) -> Iterator[list]:
+    """Yield lists of at most *chunksize* records from a top-level JSON
+    array, parsing incrementally: Only one block of text (*blocksize*
+    characters, grown for oversized records) and one chunk are in memory.
+    """
+    decoder = json.JSONDecoder()
+    with open(file_path, "r") as f:
+        buf, pos, eof = "", 0, False
+
+        def _fill(min_size: int = blocksize) -> None:
+            """Drop parsed text, append the next block."""
+            nonlocal buf, pos, eof
+            block = f.read(max(blocksize, min_size))
+            eof = not block
+            buf, pos = buf[pos:] + block, 0
+
+        def _skip() -> str:
+            """Advance *pos* over whitespace, refill as needed. Return the
+            next character, "" at the end of the file."""
+            nonlocal pos
+            if pos < len(buf) and not buf[pos].isspace():
+                return buf[pos]  # < Fast path, compact JSON
+            while True:
+                while pos < len(buf) and buf[pos].isspace():
+                    pos += 1
+                if pos < len(buf) or eof:
+                    return buf[pos : pos + 1]
+                _fill()
+
+        ### Opening bracket
+        _fill()
+        if _skip() != "[":
+            raise ValueError(f"{file_path} does not contain a JSON array")
+        pos += 1
+
+        ### Records: Exactly one comma between two records, like json.loads
+        chunk: list = []
+        if _skip() == "]":
+            pos += 1  # < Empty array
+        else:
+            while True:
+                nxt = _skip()
+                if nxt in ("", ",", "]"):
+                    raise ValueError(
+                        f"{file_path}: Expected a record, got {nxt!r}"
+                        if nxt
+                        else f"{file_path}: JSON array is not closed"
+                    )
+                try:
+                    record, end = decoder.raw_decode(buf, pos)
+                    # > A number at the end of the buffer may be cut off,
+                    # > e.g. "-4" of "-4.5": Wait for a character after it
+                    if (
+                        not eof
+                        and isinstance(record, (int, float))
+                        and (end == len(buf) or buf[end] in _NUMBER_CHARS)
+                    ):
+                        raise json.JSONDecodeError("Truncated", buf, end)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    _fill(min_size=2 * len(buf))  # < Record spans blocks
+                    continue
+                pos = end
+                chunk.append(record)
+                if len(chunk) >= chunksize:
+                    yield chunk
+                    chunk = []
+                ### Separator or end of the array
+                nxt = _skip()
+                if nxt not in (",", "]"):
+                    raise ValueError(
+                        f"{file_path}: Expected ',' or ']', got {nxt!r}"
+                        if nxt
+                        else f"{file_path}: JSON array is not closed"
+                    )
+                pos += 1
+                if nxt == "]":
+                    break
+
+        ### Only whitespace may follow the closing bracket
+        if _skip():
+            raise ValueError(f"{file_path}: Extra data after the JSON array")
+        if chunk:
+            yield chunk
+
+
+# =====================================================================
+# === Bounded-Split Delimited Text
+# =====================================================================
+# > For files whose last column contains the delimiter, e.g. regest texts
+# > with ";": Split each line at the first *maxsplit* delimiters only.
+# > Read block by block and collected column by column, so memory peaks
+# > near the size of the resulting DataFrame.
+
+
+def _iter_line_blocks(
+    file_path: Path, encoding: str, blocksize: int
+) -> Iterator[list[str]]:
+    """Yield lists of lines, same as ``text.splitlines()`` on the whole
+    file, reading about *blocksize* characters at a time."""
+    with open(file_path, "r", encoding=encoding) as f:
+        rest = ""
+        while block := f.read(blocksize):
+            block = rest + block
+            cut = block.rfind("\n") + 1  # < Lines never span blocks
+            rest = block[cut:]
+            if cut:
+                yield block[:cut].splitlines()
+        if rest:
+            yield rest.splitlines()
+
+
+def _hash_lines(lines: list[str]) -> tuple[list[int], list[int]]:
+    """Two independent 64-bit hashes per line."""
+    import numpy as np
+    import pandas as pd
+
+    values = np.array(lines, dtype=object)
+    return (
+        pd.util.hash_array(values, categorize=False).tolist(),
+        pd.util.hash_array(
+            values, hash_key="neddata-dedup-02", categorize=False
+        ).tolist(),
+    )
+
+
+def _iter_split_columns(
+    file_path: Path,
+    sep: str,
+    maxsplit: int | None,
+    names: list[str] | None,
+    drop_duplicates: bool,
+    encoding: str,
+    blocksize: int,
+) -> Iterator[tuple[list[str], list[tuple], list[int] | None]]:
+    """Yield ``(names, columns, positions)`` per block of lines: One tuple
+    of values per column, and the row positions of the kept rows if
+    duplicates are dropped. Missing trailing fields are None.
+
+    Duplicates are found by 64-bit hashes of the lines (equal lines split
+    into equal rows), not by keeping every row: A second, independent hash
+    confirms each hit, rows whose first hashes collide are kept whole."""
+    from itertools import compress, zip_longest
+
+    seen: dict[int, int] = {}  # < First hash -> second hash of kept rows
+    collided: set[str] = set()  # < Lines sharing a first hash
+    position = 0  # < Row number, without header
+    for lines in _iter_line_blocks(file_path, encoding, blocksize):
+        if names is None:
+            names = lines[0].split(sep, -1 if maxsplit is None else maxsplit)
+            lines = lines[1:]
+        n = len(names) - 1 if maxsplit is None else maxsplit
+        columns = list(zip_longest(*(line.split(sep, n) for line in lines)))
+        if len(columns) > len(names):
+            raise ValueError(
+                f"{file_path}: {len(names)} columns passed, passed data had "
+                f"{len(columns)} columns"
+            )
+        columns += [(None,) * len(lines)] * (len(names) - len(columns))
+        positions = None
+        if drop_duplicates:
+            ### Keep the first occurrence, like DataFrame.drop_duplicates()
+            keep = []
+            for line, h1, h2 in zip(lines, *_hash_lines(lines)):
+                n_seen = len(seen)
+                first = seen.setdefault(h1, h2)
+                if len(seen) > n_seen:
+                    keep.append(True)  # < New row
+                elif first == h2:
+                    keep.append(False)  # < Seen before
+                else:
+                    keep.append(line not in collided)  # < Compare whole
+                    collided.add(line)
+            columns = [tuple(compress(col, keep)) for col in columns]
+            rows = range(position, position + len(lines))
+            positions = list(compress(rows, keep))
+        position += len(lines)
+        yield names, columns, positions
+
+
+def load_bounded_split(
+    file_path: Path,
+    sep: str = ";",
+    maxsplit: int | None = None,
+    names: list[str] | None = None,
+    drop_duplicates: bool = False,
+    encoding: str = "utf-8",
+    blocksize: int = 1 << 20,
+) -> pd.DataFrame:
+    """Read delimited text, splitting every line at the first *maxsplit*
+    delimiters only: The last column keeps any further delimiters. Values
+    are kept as strings, missing trailing fields become None.
+
+    :param maxsplit: Default is one less than the number of columns
+    :param names: Column names, default is the first line
+    :param drop_duplicates: Drop repeated rows while reading, the index
+        then keeps the row numbers of the first occurrences
+    :param blocksize: Characters read at a time
+    """
+    import pandas as pd
+
+    collected: list[list] | None = None  # < Values per column
+    positions: list[int] = []
+    for names, columns, kept in _iter_split_columns(
+        file_path, sep, maxsplit, names, drop_duplicates, encoding, blocksize
+    ):
+        if collected is None:
+            collected = [[] for _ in names]
+        for values, col in zip(collected, columns):
+            values.extend(col)
+        if kept is not None:
+            positions.extend(kept)
+    if collected is None:
+        return pd.DataFrame(columns=names)  # < Empty file
+    df = pd.DataFrame(dict(enumerate(collected)))
+    df.columns = names
+    if positions and positions[-1] + 1 != len(positions):
+        df.index = pd.Index(positions)  # < Gaps of dropped duplicates
+    return df
+
+
+def iterchunks_bounded_split(
+    file_path: Path,
+    chunksize: int = 10_000,
+    sep: str = ";",
+    maxsplit: int | None = None,
+    names: list[str] | None = None,
+    drop_duplicates: bool = False,
+    encoding: str = "utf-8",
+    blocksize: int = 1 << 20,
+) -> Iterator[pd.DataFrame]:
+    """Chunked :func:`load_bounded_split`: DataFrames of at most
+    *chunksize* rows, indexed by row number in the file (without header),
+    so the chunks concatenate to the loaded frame. Duplicates are dropped
+    across chunks."""
+    import pandas as pd
+
+    position = 0  # < Row number of the first row of the block
+    for names, columns, kept in _iter_split_columns(
+        file_path, sep, maxsplit, names, drop_duplicates, encoding, blocksize
+    ):
+        n = len(columns[0]) if columns else 0
+        for lo in range(0, n, chunksize):
+            df = pd.DataFrame(
+                {i: col[lo : lo + chunksize] for i, col in enumerate(columns)}
+            )
+            df.columns = names
+            if kept is not None:
+                df.index = pd.Index(kept[lo : lo + chunksize])
+            else:
+                df.index = pd.RangeIndex(position + lo, position + lo + len(df))
+            yield df
+        position += n
+
+
+def bounded_split_loader(**kwargs: Any) -> Callable[[Path], pd.DataFrame]:
+    """:func:`load_bounded_split` with fixed keyword arguments, to register
+    with ``Catalog.set_loader(pattern)``. The arguments are part of the
+    loader's name, so sidecars of different settings don't collide."""
+    args = ", ".join(f"{k}={v!r}" for k, v in sorted(kwargs.items()))
+
+    def loader(file_path: Path) -> pd.DataFrame:
+        return load_bounded_split(file_path, **kwargs)
+
+    loader.__name__ = loader.__qualname__ = f"bounded_split_loader({args})"
+    return loader
+
+
+# =====================================================================
+# === Excel Workbooks
+# =====================================================================
+# > pd.read_excel() materialises every cell of a sheet as an openpyxl
+# > cell object before parsing. Here rows are streamed as plain value
+# > tuples from a read-only workbook, converted like pandas does, and
+# > parsed chunk by chunk.
+
+_XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+def xlsx_sheet_names(file_path: Path) -> list[str]:
+    """Sheet names of an xlsx workbook, in workbook order. Reads only
+    ``xl/workbook.xml`` from the archive, not the sheets."""
+    import zipfile
+    import xml.etree.ElementTree as ET
+
+    with zipfile.ZipFile(file_path) as zf, zf.open("xl/workbook.xml") as f:
+        return [
+            el.attrib["name"]
+            for _, el in ET.iterparse(f)
+            if el.tag == f"{_XLSX_NS}sheet"
+        ]
+
+
+def _convert_xlsx_value(value: Any) -> Any:
+    """Cell value as ``pd.read_excel`` sees it: Empty cells are "", whole
+    floats are ints."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def iterchunks_xlsx(
+    file_path: Path,
+    chunksize: int = 10_000,
+    sheet_name: str | int = 0,
+) -> Iterator[pd.DataFrame]:
+    """Yield DataFrames of at most *chunksize* rows from one sheet of an
+    xlsx workbook, the first row is the header. Only one chunk of rows is
+    in memory. Each chunk is parsed like ``pd.read_excel`` parses a whole
+    sheet, so dtypes are inferred per chunk (as with ``read_csv``).
+
+    :param sheet_name: Sheet name or position
+    """
+    import openpyxl
+    from pandas.io.parsers import TextParser
+
+    wb = openpyxl.load_workbook(
+        file_path, read_only=True, data_only=True, keep_links=False
+    )
+    try:
+        if isinstance(sheet_name, int):
+            ws = wb.worksheets[sheet_name]
+        else:
+            ws = wb[sheet_name]
+        ### Width from the stored sheet size, but read every row: Some
+        ### writers store a wrong size
+        width = ws.max_column or 0
+        ws.reset_dimensions()
+        rows = ws.iter_rows(values_only=True)
+        header = [_convert_xlsx_value(v) for v in next(rows, ())]
+        while header and header[-1] == "":
+            header.pop()  # < Trailing empty cells, like pandas
+        width = max(width, len(header))
+        header += [""] * (width - len(header))  # < "Unnamed: <i>" columns
+
+        def _parse(chunk: list[list], start: int) -> pd.DataFrame:
+            parser = TextParser(
+                [header, *chunk], header=0, skip_blank_lines=False
+            )
+            df = parser.read()
+            df.index += start
+            return df
+
+        chunk: list[list] = []
+        blank: list[list] = []  # < Empty rows, dropped if trailing
+        start = 0
+        for values in rows:
+            row = [_convert_xlsx_value(v) for v in values]
+            while len(row) > width and row[-1] == "":
+                row.pop()
+            if len(row) > width:  # < Wider than stored, later chunks only
+                header += [""] * (len(row) - width)
+                width = len(row)
+            row += [""] * (width - len(row))
+            if all(v == "" for v in row):
+                blank.append(row)
+                continue
+            for row_ in (*blank, row):
+                chunk.append(row_)
+                if len(chunk) >= chunksize:
+                    yield _parse(chunk, start)
+                    start += len(chunk)
+                    chunk = []
+            blank = []
+        if chunk or not start:
+            yield _parse(chunk, start)
+    finally:
+        wb.close()
+
+
+def excel_sheet_loader(sheet_name: str) -> Callable[[Path], pd.DataFrame]:
+    """Loader of a single sheet, opening the workbook read-only. The
+    sheet is part of the loader's name, so sidecars of different sheets
+    don't collide."""
+
+    def loader(file_path: Path, dtype: Any = None) -> pd.DataFrame:
+        import pandas as pd
+
+        return pd.read_excel(file_path, sheet_name=sheet_name, dtype=dtype)
+
+    loader.__name__ = loader.__qualname__ = (
+        f"excel_sheet_loader({sheet_name!r})"
+    )
+    return loader
+
+
+def excel_sheet_chunker(
+    sheet_name: str,
+) -> Callable[[Path, int], Iterator[pd.DataFrame]]:
+    """:func:`iterchunks_xlsx` over a single sheet."""
+
+    def chunker(
+        file_path: Path, chunksize: int = 10_000
+    ) -> Iterator[pd.DataFrame]:
+        return iterchunks_xlsx(file_path, chunksize, sheet_name=sheet_name)
+
+    chunker.__name__ = chunker.__qualname__ = (
+        f"excel_sheet_chunker({sheet_name!r})"
+    )
+    return chunker
+
+
+DEFAULT_CHUNKERS: dict[str, Callable[..., Iterator[Any]]] = {
+    "csv": iterchunks_csv,
+    "json": iterchunks_json,
+    "xlsx": iterchunks_xlsx,
+}
+
+
+def get_default_chunker(file_path: Path) -> Callable[..., Iterator[Any]] | None:
+    """Return the default chunker function for a given file type."""
+    ext = file_path.suffix[1:]
+    return DEFAULT_CHUNKERS.get(ext)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    records = [{"id": i, "text": "x" * i} for i in range(25)] + [1.5, 23]
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(records, f)
+    ### Tiny blocks to exercise records spanning several reads
+    chunks = list(iterchunks_json(Path(f.name), chunksize=10, blocksize=16))
+    print([len(c) for c in chunks], sum(chunks, []) == records)
+
+    # %%
+    ### Bounded split: ";" inside the last column, ragged and repeated rows
+    text = "a;b;text\n1;2;x;y\n3\n1;2;x;y\n4;5;z\n"
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+        f.write(text)
+    df = load_bounded_split(Path(f.name), drop_duplicates=True, blocksize=4)
+    print(df)
+    naive = [line.split(";", 2) for line in text.splitlines()]
+    assert df.values.tolist() == [
+        row + [None] * (3 - len(row)) for row in (naive[1], naive[2], naive[4])
+    ]
+    chunks = iterchunks_bounded_split(Path(f.name), 2, drop_duplicates=True)
+    print([c.index.tolist() for c in chunks])
+
+    # %%
+    ### Excel: Two sheets, a trailing empty row, a row wider than the header
+    import openpyxl
+    import pandas as pd
+
+    wb = openpyxl.Workbook()
+    wb.active.title = "first"
+    for row in [("a", "b"), (1, 2.5), (None, "x"), (3, 4.0, "wide"), ()]:
+        wb["first"].append(row)
+    wb.create_sheet("second").append(("only", "header"))
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
+        wb.save(f.name)
+    print(xlsx_sheet_names(Path(f.name)))
+    for sheet in xlsx_sheet_names(Path(f.name)):
+        ref = pd.read_excel(f.name, sheet_name=sheet)
+        chunks = list(iterchunks_xlsx(Path(f.name), 10, sheet_name=sheet))
+        pd.testing.assert_frame_equal(pd.concat(chunks), ref)
+    print([c.shape for c in iterchunks_xlsx(Path(f.name), 2)])
@@ -0,0 +1,261 @@
+"""Indexed lookups over catalogue keys (``"kdb/kdb_complete.csv"``), for
+registries with 100k+ files:
+- compile_globs(): Shell-style globs compiled once into one regex
+- PatternMap: Ordered glob -> value mapping, first match wins
+- KeyIndex: Prefix tree for ``ls()``, prefix-narrowed ``glob()`` and
+  batched fuzzy ``search()``
+"""
+
+# %%
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import functools
+import re
+
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+WILDCARDS = "*?["
+
+
+# =====================================================================
+# === Globs
+# =====================================================================
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_globs(patterns: tuple[str, ...]) -> re.Pattern:
+    """One regex matching a string if any of *patterns* matches it (same
+    semantics as ``fnmatch.fnmatchcase``). Each pattern is a named group
+    ``g<i>``, so ``m.lastgroup`` tells which pattern matched first."""
+    if not patterns:
+        return re.compile(r"(?!)")  # < Matches nothing
+    alternatives = (
+        f"(?P<g{i}>{fnmatch.translate(p)})" for i, p in enumerate(patterns)
+    )
+    return re.compile("|".join(alternatives))
+
+
+def literal_prefix(pattern: str) -> str:
+    """Part of *pattern* before its first wildcard."""
+    for i, ch in enumerate(pattern):
+        if ch in WILDCARDS:
+            return pattern[:i]
+    return pattern
+
+
+class PatternMap(Generic[T]):
+    """Insertion-ordered ``glob -> value`` mapping. :meth:`first` returns
+    the value of the first pattern matching a key, with one regex match
+    instead of one ``fnmatch`` per pattern."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, T] = {}
+
+    def __setitem__(self, pattern: str, value: T) -> None:
+        self._values[pattern] = value
+
+    def __getitem__(self, pattern: str) -> T:
+        return self._values[pattern]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def items(self) -> Iterable[tuple[str, T]]:
+        return self._values.items()
+
+    def first(self, key: str) -> T | None:
+        if not self._values:
+            return None
+        patterns = tuple(self._values)
+        m = compile_globs(patterns).match(key)
+        if m is None:
+            return None
+        return self._values[patterns[int(m.lastgroup[1:])]]
+
+
+# =====================================================================
+# === KeyIndex
+# =====================================================================
+
+
+class _Node:
+    __slots__ = ("children", "key")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.key: str | None = None  # < Full key, if this node is one
+
+
+class KeyIndex:
+    """Index of ``/``-separated keys. Keys ending with ``/`` (directories)
+    are keys too.
+
+    - A trie over path segments answers ``ls(prefix)`` in time of the
+      listed directory, not of the whole catalogue.
+    - A sorted list narrows ``glob()`` to the keys sharing the pattern's
+      literal prefix (bisect), the rest is one compiled regex per key.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        self._root = _Node()
+        self._sorted: list[str] = []
+        self.update(keys)
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __contains__(self, key: object) -> bool:
+        i = bisect.bisect_left(self._sorted, key)  # type: ignore[arg-type]
+        return i < len(self._sorted) and self._sorted[i] == key
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sorted)
+
+    def __repr__(self) -> str:
+        return f"KeyIndex(keys={len(self)})"
+
+    # === Mutate ======================================================
+
+    def add(self, key: str) -> None:
+        if key in self:
+            return
+        bisect.insort(self._sorted, key)
+        node = self._root
+        for segment in self._segments(key):
+            node = node.children.setdefault(segment, _Node())
+        node.key = key
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add many keys, sorting once instead of inserting one by one."""
+        new = set(keys).difference(self._sorted)
+        for key in new:
+            node = self._root
+            for segment in self._segments(key):
+                node = node.children.setdefault(segment, _Node())
+            node.key = key
+        self._sorted = sorted(self._sorted + list(new))
+
+    def remove(self, key: str) -> None:
+        i = bisect.bisect_left(self._sorted, key)
+        if i == len(self._sorted) or self._sorted[i] != key:
+            raise KeyError(key)
+        del self._sorted[i]
+        ### Unmark, then prune empty branches
+        path = [self._root]
+        for segment in self._segments(key):
+            path.append(path[-1].children[segment])
+        path[-1].key = None
+        for segment, node, parent in zip(
+            reversed(self._segments(key)), reversed(path), reversed(path[:-1])
+        ):
+            if node.children or node.key is not None:
+                break
+            del parent.children[segment]
+
+    def clear(self) -> None:
+        self._root = _Node()
+        self._sorted.clear()
+
+    @staticmethod
+    def _segments(key: str) -> list[str]:
+        """``"a/b/c.csv"`` -> ``["a", "b", "c.csv"]``, ``"a/"`` -> ``["a"]``"""
+        return key.rstrip("/").split("/")
+
+    # === Query =======================================================
+
+    def keys(self) -> list[str]:
+        """All keys, sorted."""
+        return list(self._sorted)
+
+    def with_prefix(self, prefix: str) -> list[str]:
+        """All keys starting with *prefix*, sorted."""
+        lo = bisect.bisect_left(self._sorted, prefix)
+        hi = lo
+        while hi < len(self._sorted) and self._sorted[hi].startswith(prefix):
+            hi += 1
+        return self._sorted[lo:hi]
+
+    def ls(self, prefix: str = "") -> list[str]:
+        """Entries directly below directory *prefix*: Keys, and
+        sub-directories (ending with ``/``) that contain keys."""
+        node = self._root
+        prefix = prefix.strip("/")
+        for segment in prefix.split("/") if prefix else []:
+            node = node.children.get(segment)  # type: ignore[assignment]
+            if node is None:
+                return []
+        base = f"{prefix}/" if prefix else ""
+        return sorted(
+            f"{base}{name}/" if child.children else child.key
+            for name, child in node.children.items()
+        )
+
+    def glob(self, pattern: str) -> list[str]:
+        """Keys matching the shell-style *pattern* (``fnmatchcase``)."""
+        regex = compile_globs((pattern,))
+        candidates = self.with_prefix(literal_prefix(pattern))
+        return [k for k in candidates if regex.match(k)]
+
+    def search(
+        self, query: str, cutoff: float = 80, scorer: Any = None
+    ) -> list[str]:
+        """Keys scoring more than *cutoff* against *query*, default scorer
+        is ``fuzz.partial_ratio``. One batched ``process.extract`` call."""
+        from rapidfuzz import fuzz, process
+
+        matches = process.extract(
+            query,
+            self._sorted,
+            scorer=scorer or fuzz.partial_ratio,
+            score_cutoff=cutoff,
+            limit=None,
+        )
+        ### extract() keeps scores >= cutoff, sorted by score
+        return sorted(key for key, score, _ in matches if score > cutoff)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # %%
+    ### Synthetic catalogue with 100k keys
+    rng = random.Random(0)
+    keys = [
+        f"set_{rng.randrange(100)}/sub_{rng.randrange(30)}/file_{i}.csv"
+        for i in range(100_000)
+    ]
+    t = time.perf_counter()
+    index = KeyIndex(keys)
+    print(index, f"built in {time.perf_counter() - t:.2f} s")
+
+    # %%
+    ### Equivalence with linear scans
+    for pattern in ["set_7/*", "set_1?/sub_2/*", "*file_99*.csv", "set_3/sub_[12]/*"]:
+        linear = sorted(k for k in keys if fnmatch.fnmatchcase(k, pattern))
+        assert index.glob(pattern) == linear, pattern
+    print(index.ls("set_7/")[:3], len(index.ls()))
+
+    # %%
+    t = time.perf_counter()
+    for _ in range(100):
+        index.glob("set_7/sub_1/*")
+    print(f"indexed glob: {(time.perf_counter() - t) * 10:.2f} ms")
+    t = time.perf_counter()
+    [k for k in keys if fnmatch.fnmatchcase(k, "set_7/sub_1/*")]
+    print(f"linear glob:  {(time.perf_counter() - t) * 1000:.2f} ms")
+
+    # %%
+    loaders: PatternMap[str] = PatternMap()
+    loaders["set_1/*"] = "a"
+    loaders["*.csv"] = "b"
+    assert loaders.first("set_1/x.csv") == "a"
+    assert loaders.first("set_2/x.csv") == "b"
+    assert loaders.first("set_2/x.txt") is None
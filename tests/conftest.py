@@ -0,0 +1,75 @@
+"""A toy dataset package, its files served by a local HTTP server."""
+
+import functools
+import json
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+import pytest
+
+PACKAGE = "toy_dataset"
+FNAMES = ["data/b.json", "data/book.xlsx", "data/sub/a.csv"]
+SHEETS = {
+    "First Sheet": pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}),
+    "Second": pd.DataFrame({"c": [1.5, 2.5, 3.5]}),
+}
+
+CATALOG_PY = """\
+from importlib.resources import files
+
+import pooch
+
+from neddata import datamodel as dm
+
+POOCHY = pooch.create(path={cache!r}, base_url={url!r}, registry=None)
+POOCHY.load_registry(files("{package}") / "pooch_registry.txt")
+cat = dm.Catalog("{package}", pooch=POOCHY)
+"""
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def dataset(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Package ``toy_dataset`` on sys.path, with a registry of FNAMES and a
+    ``catalog.py`` fetching them from a local server into
+    ``tmp_path/"cache"``. Yields the package directory."""
+    import pooch
+
+    root = tmp_path / PACKAGE
+    (root / "data" / "sub").mkdir(parents=True)
+    (root / "__init__.py").touch()
+    pd.DataFrame({"i": [1, 2, 3]}).to_csv(root / "data/sub/a.csv", index=False)
+    (root / "data/b.json").write_text(json.dumps([{"k": 1}, {"k": 2}]))
+    with pd.ExcelWriter(root / "data/book.xlsx") as writer:
+        for name, df in SHEETS.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+    (root / "pooch_registry.txt").write_text(
+        "".join(f"{f} {pooch.file_hash(str(root / f))}\n" for f in FNAMES)
+    )
+
+    handler = functools.partial(_QuietHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    (root / "catalog.py").write_text(
+        CATALOG_PY.format(
+            cache=str(tmp_path / "cache"),
+            url=f"http://127.0.0.1:{server.server_port}/",
+            package=PACKAGE,
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        yield root
+    finally:
+        server.shutdown()
+        server.server_close()
+        for name in [m for m in sys.modules if m.partition(".")[0] == PACKAGE]:
+            del sys.modules[name]
@@ -0,0 +1,77 @@
+"""Benchmark suite (``neddata bench``): Run offline, compare as a gate."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from neddata import cli
+from neddata._tools.bench import SuiteResult, Timing, compare, run_suite
+
+
+def _timing(name: str, median_s: float) -> Timing:
+    return Timing(name, 100, median_s, median_s, median_s, repeat=3)
+
+
+@pytest.fixture
+def baseline() -> SuiteResult:
+    return SuiteResult(
+        timings={
+            "load/a": _timing("load/a", 0.100),
+            "pd/b": _timing("pd/b", 0.200),
+        },
+        meta={"scale": 1},
+    )
+
+
+def test_compare_statuses(baseline: SuiteResult) -> None:
+    current = SuiteResult(
+        timings={
+            "load/a": _timing("load/a", 0.200),  # < 2x slower
+            "pd/new": _timing("pd/new", 0.100),
+        },
+        meta={"scale": 1},
+    )
+    comparison = compare(baseline, current, threshold=0.25)
+    status = {name: s for name, *_, s in comparison.rows}
+    assert status == {"load/a": "slower", "pd/b": "missing", "pd/new": "new"}
+    assert comparison.regressions == ["load/a", "pd/b"]
+
+
+def test_noise_is_no_regression(baseline: SuiteResult) -> None:
+    current = replace(
+        baseline,
+        timings={
+            "load/a": _timing("load/a", 0.1005),  # < Below min_delta
+            "pd/b": _timing("pd/b", 0.100),
+        },
+    )
+    comparison = compare(baseline, current, min_delta=0.001)
+    assert comparison.regressions == []
+
+
+def test_cli_gate(baseline: SuiteResult, tmp_path: Path) -> None:
+    """A missing benchmark fails the gate unless --select excludes it."""
+    current = replace(baseline, timings={"pd/b": baseline.timings["pd/b"]})
+    base_json = baseline.to_json(tmp_path / "base.json")
+    cur_json = current.to_json(tmp_path / "cur.json")
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["bench", "compare", str(base_json), str(cur_json)])
+    assert exc.value.code == 1
+    cli.main(["bench", "compare", str(base_json), str(cur_json), "-k", "pd/*"])
+
+
+def test_run_suite_offline(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Inputs are read from the package, not fetched."""
+    import pooch
+
+    def no_network(*args, **kwargs):
+        raise AssertionError("The bench suite must not fetch")
+
+    monkeypatch.setattr(pooch.Pooch, "fetch", no_network)
+    select = ["load/load_utf8_csv", "load/load_ben_cist_data"]
+    result = run_suite(scale=1, repeat=1, select=select, workdir=tmp_path)
+    assert list(result.timings) == select
+    assert SuiteResult.from_json(result.to_json(tmp_path / "r.json")) == result
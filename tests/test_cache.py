@@ -0,0 +1,183 @@
+"""Caching layers of neddata.cache."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from neddata import cache
+from neddata.cache import (
+    FileHashMemo,
+    LoadCache,
+    estimate_nbytes,
+    find_sidecar,
+    loader_token,
+    read_sidecar,
+    sidecar_path,
+    write_sidecar,
+)
+from neddata.schema import Schema
+
+# =====================================================================
+# === LoadCache
+# =====================================================================
+
+
+def test_lru_byte_budget() -> None:
+    arrays = {k: np.zeros(100) for k in "abcd"}
+    nbytes = estimate_nbytes(arrays["a"])
+    c = LoadCache(max_bytes=3 * nbytes)
+    for k in "abc":
+        c.put(k, arrays[k])
+    assert c.get("a") is not None  # < "b" is now least recently used
+    c.put("d", arrays["d"])
+    assert [k in c for k in "abcd"] == [True, False, True, True]
+    assert c.nbytes == 3 * nbytes and (c.hits, c.misses) == (1, 0)
+    assert c.get("b", "miss") == "miss" and c.misses == 1
+
+    big = np.zeros(1_000)
+    assert c.put("big", big) is big and "big" not in c  # < Over budget
+    assert len(c) == 3
+
+
+def test_invalidate_by_key_prefix() -> None:
+    c = LoadCache()
+    for key in [("k", "sha1"), ("k", "sha2"), ("j", "sha1"), "k"]:
+        c.put(key, [1])
+    c.invalidate("k")
+    assert len(c) == 1 and ("j", "sha1") in c
+    c.clear()
+    assert len(c) == 0 and c.nbytes == 0
+
+
+@pytest.mark.parametrize("view", ["copy", "cow", "readonly"])
+def test_views_isolate_callers(view: str) -> None:
+    c = LoadCache(view=view)
+    c.put("df", pd.DataFrame({"x": [1, 2, 3]}))
+    c.put("arr", np.arange(3))
+    c.put("dict", {"x": [1]})
+    df, arr = c.get("df"), c.get("arr")
+    if view == "readonly":
+        with pytest.raises(ValueError):
+            df.loc[0, "x"] = -1
+        with pytest.raises(ValueError):
+            arr[0] = -1
+    else:
+        df.loc[0, "x"] = -1
+        arr[0] = -1
+    c.get("dict")["x"].append(2)  # < Always a deep copy
+    assert c.get("df")["x"].tolist() == [1, 2, 3]
+    assert c.get("arr").tolist() == [0, 1, 2]
+    assert c.get("dict") == {"x": [1]}
+
+
+def test_unknown_view() -> None:
+    with pytest.raises(ValueError, match="Unknown view"):
+        LoadCache(view="shared")
+
+
+# =====================================================================
+# === File Hash Memo
+# =====================================================================
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_memo_rehashes_changed_files(tmp_path: Path, workers: int) -> None:
+    import pooch
+
+    files = [tmp_path / f"{i}.bin" for i in range(4)]
+    for i, f in enumerate(files):
+        f.write_bytes(bytes([i]) * 1000)
+    memo = FileHashMemo(tmp_path / "hashes.sqlite")
+    try:
+        hashes, rehashed = memo.hash_files(files, workers=workers)
+        assert rehashed == files
+        assert hashes == {f: pooch.file_hash(str(f)) for f in files}
+        assert memo.hash_files(files, workers=workers)[1] == []
+        files[2].write_bytes(b"changed")
+        hashes, rehashed = memo.hash_files(files, workers=workers)
+        assert rehashed == [files[2]]
+        assert hashes[files[2]] == pooch.file_hash(str(files[2]))
+    finally:
+        memo.close()
+
+
+# =====================================================================
+# === Columnar Sidecars
+# =====================================================================
+
+needs_arrow = pytest.mark.skipif(
+    not cache.columnar_available(), reason="pyarrow is not installed"
+)
+
+
+def _loader(path: Path) -> pd.DataFrame:
+    return pd.read_csv(path)
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "i": np.arange(4, dtype=np.int16),
+            "f": [1.5, np.nan, 3.0, 4.0],
+            "nan": ["x", np.nan, "y", "x"],  # < NaN for missing
+            "none": ["x", None, "y", None],  # < None for missing
+            "cat": pd.Categorical(["a", "b", "a", None]),
+            "s": pd.array(["u", None, "w", "v"], dtype="string[pyarrow]"),
+        }
+    )
+
+
+@needs_arrow
+@pytest.mark.parametrize("fmt", ["parquet", "feather"])
+def test_sidecar_roundtrip(
+    frame: pd.DataFrame, tmp_path: Path, fmt: str
+) -> None:
+    path = sidecar_path(tmp_path / "f.csv", "0" * 64, _loader, fmt)
+    assert path.parent.name == cache.DERIVED_DIRNAME
+    written = write_sidecar(frame, path)
+    assert written == find_sidecar(path) == path
+    pd.testing.assert_frame_equal(read_sidecar(path), frame)
+    ### Some columns only, missing ones are skipped
+    part = read_sidecar(path, columns=["cat", "nan", "gone"])
+    pd.testing.assert_frame_equal(part, frame[["cat", "nan"]])
+
+
+@needs_arrow
+def test_no_pickle_fallback(tmp_path: Path) -> None:
+    """Frames Arrow can't store get no sidecar, pickles are never read."""
+    path = sidecar_path(tmp_path / "f.csv", "0" * 64, _loader)
+    mixed = pd.DataFrame({"o": [1, "a"]})
+    assert write_sidecar(mixed, path) is None
+    assert find_sidecar(path) is None
+    mixed.to_pickle(path.with_suffix(".pkl"))  # < Planted, or old
+    assert find_sidecar(path) is None
+    assert write_sidecar([1, 2], path) is None  # < Not a DataFrame
+
+
+def test_sidecar_keys(tmp_path: Path) -> None:
+    """Source hash, loader and schema each change the sidecar name."""
+    base = sidecar_path(tmp_path / "f.csv", "0" * 64, _loader)
+    assert base != sidecar_path(tmp_path / "f.csv", "1" * 64, _loader)
+    assert base != sidecar_path(tmp_path / "f.csv", "0" * 64, pd.read_csv)
+    typed = sidecar_path(
+        tmp_path / "f.csv", "0" * 64, _loader, schema=Schema({"i": "int8"})
+    )
+    assert base != typed
+
+
+def test_loader_token_includes_runtime(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Bumping SIDECAR_VERSION (or upgrading pandas, ...) invalidates."""
+    before = loader_token(_loader)
+    loader_token.cache_clear()
+    cache._runtime_token.cache_clear()
+    monkeypatch.setattr(cache, "SIDECAR_VERSION", cache.SIDECAR_VERSION + 1)
+    try:
+        assert loader_token(_loader) != before
+    finally:
+        loader_token.cache_clear()
+        cache._runtime_token.cache_clear()
@@ -0,0 +1,62 @@
+"""Chunk store: Build from parallel JSON arrays, read by position & key."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from neddata.chunkstore import ChunkStore, build_chunk_store
+
+
+@pytest.fixture
+def sources(tmp_path: Path) -> dict[str, Path]:
+    texts = [f"Text {i}, mit Umlaut ä" for i in range(25)]
+    metas = [{"id_gsn": i % 7, "order": "OSB"} for i in range(25)]
+    paths = {"chunks": tmp_path / "chunks.json", "metas": tmp_path / "m.json"}
+    paths["chunks"].write_text(json.dumps(texts), encoding="utf-8")
+    paths["metas"].write_text(json.dumps(metas), encoding="utf-8")
+    return paths
+
+
+def test_records_and_keys(sources: dict[str, Path], tmp_path: Path) -> None:
+    dest = build_chunk_store(sources, tmp_path / "store", chunksize=4)
+    with ChunkStore(dest) as store:
+        assert len(store) == 25
+        assert store[3] == {
+            "chunks": "Text 3, mit Umlaut ä",
+            "metas": {"id_gsn": 3, "order": "OSB"},
+        }
+        assert store[-1]["chunks"] == "Text 24, mit Umlaut ä"
+        assert [r["chunks"] for r in store.get(2)] == [
+            f"Text {i}, mit Umlaut ä" for i in (2, 9, 16, 23)
+        ]
+        with pytest.raises(KeyError):
+            store.get(99)
+        with pytest.raises(IndexError):
+            store[25]
+
+
+def test_sources_of_different_length(tmp_path: Path) -> None:
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    a.write_text("[1, 2, 3]")
+    b.write_text("[1, 2]")
+    with pytest.raises(ValueError, match="not parallel"):
+        build_chunk_store({"a": a, "b": b}, tmp_path / "store", key=None)
+    assert not (tmp_path / "store").exists()
+
+
+def test_concurrent_builds(sources: dict[str, Path], tmp_path: Path) -> None:
+    """Threads of one process build into their own temp dirs."""
+    dest = tmp_path / "store"
+    with ThreadPoolExecutor(8) as pool:
+        futures = [
+            pool.submit(build_chunk_store, sources, dest, chunksize=2)
+            for _ in range(8)
+        ]
+        assert all(f.result() == dest for f in futures)
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        ["chunks.json", "m.json", "store"]
+    )
+    with ChunkStore(dest) as store:
+        assert len(store) == 25
@@ -0,0 +1,154 @@
+"""Catalog: Prefetch and verify against a local server, sheet keys."""
+
+import importlib
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from neddata import instrument
+from neddata.cache import fetch_verified, is_verified
+from neddata.datamodel import Catalog
+
+from conftest import FNAMES, PACKAGE, SHEETS
+
+
+def _catalog() -> Catalog:
+    """The toy dataset's ``cat``, see the ``dataset`` fixture."""
+    return importlib.import_module(f"{PACKAGE}.catalog").cat
+
+
+def _offline(tmp_path: Path) -> Catalog:
+    """The toy dataset with a server that refuses connections."""
+    import pooch
+
+    poochy = pooch.create(
+        path=tmp_path / "offline",
+        base_url="http://127.0.0.1:9/",  # < Discard port, nothing listens
+        registry=dict(_catalog().pooch.registry),
+    )
+    return Catalog(PACKAGE, pooch=poochy)
+
+
+# =====================================================================
+# === Prefetch
+# =====================================================================
+
+
+def test_prefetch(dataset: Path) -> None:
+    cat = _catalog()
+    done = []
+    report = cat.prefetch(progress=lambda fname, e: done.append((fname, e)))
+    assert report.ok and sorted(report.fetched) == FNAMES
+    assert sorted(done) == [(fname, None) for fname in FNAMES]
+    for fname, local in report.fetched.items():
+        assert local.read_bytes() == (dataset / fname).read_bytes()
+    assert cat.load("data/sub/a.csv")["i"].tolist() == [1, 2, 3]
+
+
+def test_prefetch_collects_failures(dataset: Path) -> None:
+    (dataset / "data/b.json").unlink()  # < 404
+    report = _catalog().prefetch(["data/*.json", "data/sub/*"])
+    assert list(report.fetched) == ["data/sub/a.csv"]
+    assert list(report.failed) == ["data/b.json"] and not report.ok
+    with pytest.raises(KeyError):
+        _catalog().prefetch("nothing/*")
+
+
+# =====================================================================
+# === Verify
+# =====================================================================
+
+
+def test_verify(dataset: Path) -> None:
+    cat = _catalog()
+    report = cat.verify()
+    assert report.missing == FNAMES and not report.ok
+    cat.prefetch()
+    root = Path(cat.pooch.abspath)
+    (root / "data/sub/a.csv").write_text("corrupt")
+    (root / "data/b.json").unlink()
+    (root / "data/old.csv").write_text("x")
+
+    report = cat.verify()
+    assert report.verified == ["data/book.xlsx"]
+    assert report.corrupt == ["data/sub/a.csv"]
+    assert report.missing == ["data/b.json"]
+    assert report.stale == ["data/old.csv"] and not report.ok
+    assert cat.verify("data/sub/*").stale == []  # < Only without patterns
+
+    report = cat.verify(refetch=True, prune=True)
+    assert report.ok
+    assert sorted(report.refetched) == ["data/b.json", "data/sub/a.csv"]
+    assert report.pruned == ["data/old.csv"]
+    assert not (root / "data/old.csv").exists()
+    assert cat.verify().verified == FNAMES
+
+
+def test_fetch_verified_skips_hashing(
+    dataset: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verified files cost a stat(), changed ones are hashed again."""
+    cat = _catalog()
+    cat.prefetch()
+    calls = []
+    timed_fetch = instrument.timed_fetch
+
+    def counted(poochy, fname):
+        calls.append(fname)
+        return timed_fetch(poochy, fname)
+
+    monkeypatch.setattr(instrument, "timed_fetch", counted)
+    fname = "data/sub/a.csv"
+    local = fetch_verified(cat.pooch, fname)
+    assert calls == [] and is_verified(cat.pooch, fname)
+    fetch_verified(cat.pooch, fname, strict=True)
+    assert calls == [fname]
+
+    local.write_text("i\n9\n")  # < New stat and hash
+    assert not is_verified(cat.pooch, fname)
+    fetch_verified(cat.pooch, fname)  # < Downloads again
+    assert calls == [fname, fname] and is_verified(cat.pooch, fname)
+    assert local.read_bytes() == (dataset / fname).read_bytes()
+
+
+# =====================================================================
+# === Sheet keys
+# =====================================================================
+
+
+def test_sheets(dataset: Path) -> None:
+    cat = _catalog()
+    keys = ["data/book.xlsx::first_sheet", "data/book.xlsx::second"]
+    assert keys[0] not in cat.keys()  # < Listed on first use
+    assert cat.sheets("data/book.xlsx") == keys
+    assert set(keys) <= set(cat.keys()) and keys[0] in cat.glob("*::*")
+    local = cat["data/book.xlsx"].fetch()
+    for key, name in zip(keys, SHEETS):
+        pd.testing.assert_frame_equal(
+            cat.load(key), pd.read_excel(local, sheet_name=name)
+        )
+    chunks = list(cat.iter_chunks(keys[1], chunksize=2))
+    assert sum(len(c) for c in chunks) == 3
+    with pytest.raises(ValueError):
+        cat.sheets("data/b.json")
+
+
+def test_sheet_keys_in_and_get(dataset: Path) -> None:
+    """Membership lists the sheets of a workbook not seen before."""
+    cat = _catalog()
+    assert "Data/Book.xlsx::Second" in cat
+    assert cat.get("data/book.xlsx::second") is cat["data/book.xlsx::second"]
+    assert "data/book.xlsx::nope" not in cat
+    assert "data/b.json::x" not in cat  # < Not a workbook
+    assert cat.get("data/b.json::x", "default") == "default"
+    with pytest.raises(KeyError):
+        cat["data/book.xlsx::nope"]
+
+
+def test_sheet_keys_offline(dataset: Path, tmp_path: Path) -> None:
+    """A failed fetch makes a sheet key unknown, it doesn't raise."""
+    cat = _offline(tmp_path)
+    assert "data/book.xlsx::second" not in cat
+    assert cat.get("data/book.xlsx::second") is None
+    assert "data/book.xlsx" in cat  # < Plain keys never fetch
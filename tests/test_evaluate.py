@@ -0,0 +1,69 @@
+"""Retrieval benchmark: Metrics, runs and run-over-run comparison."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from neddata.evaluate import (
+    BenchCase,
+    BenchResult,
+    compare_results,
+    recall_at_k,
+    reciprocal_rank,
+    run_benchmark,
+)
+
+CASES = [
+    BenchCase(query="a", gold=frozenset({1, 2})),
+    BenchCase(query="b", gold=frozenset({3})),
+    BenchCase(query="c", gold=frozenset({9})),
+]
+
+
+def _retriever(query: str, k: int) -> list[int]:
+    return {"a": [2, 5, 1], "b": [4, 3], "c": [7, 8]}[query][:k]
+
+
+def test_metrics_with_several_gold_ids() -> None:
+    gold = frozenset({1, 2})
+    assert recall_at_k([2, 5, 1], gold, 1) == 0.5  # < Fraction of gold
+    assert recall_at_k([2, 5, 1], gold, 3) == 1.0
+    assert recall_at_k([5], frozenset(), 1) == 0.0
+    assert reciprocal_rank([5, 1, 2], gold) == 0.5  # < First gold id
+    assert reciprocal_rank([5, 6], gold) == 0.0
+
+
+def test_run_benchmark() -> None:
+    result = run_benchmark(_retriever, CASES, ks=(1, 3), warmup=0)
+    assert result.n_queries == 3 and result.k == 3
+    assert result.recall == pytest.approx(
+        {"recall@1": 0.5 / 3, "recall@3": 2 / 3}
+    )
+    assert result.mrr == pytest.approx((1 + 0.5 + 0) / 3)
+    assert result.peak_traced_mb is not None
+
+
+def test_json_roundtrip(tmp_path: Path) -> None:
+    result = run_benchmark(_retriever, CASES, ks=(1,), trace_memory=False)
+    path = result.to_json(tmp_path / "sub" / "r.json")
+    assert BenchResult.from_json(path) == result
+
+
+def test_compare_results() -> None:
+    base = replace(
+        run_benchmark(_retriever, CASES, ks=(1, 3), warmup=0),
+        latency_ms={"p50": 1.0, "p95": 2.0, "p99": 3.0, "mean": 1.2, "max": 3},
+        throughput_qps=800.0,
+    )
+    assert compare_results(base, base).regressions == []
+
+    worse = replace(
+        base,
+        mrr=base.mrr - 0.1,
+        latency_ms={**base.latency_ms, "p95": base.latency_ms["p95"] * 2},
+    )
+    comparison = compare_results(base, worse)
+    assert comparison.regressions == ["mrr", "p95_ms"]
+    assert compare_results(worse, base).regressions == []
+    assert "2 regression(s)" in repr(comparison)
@@ -0,0 +1,49 @@
+"""FederatedCatalog over the toy dataset package."""
+
+from pathlib import Path
+
+import pytest
+
+from neddata.federation import Dataset, FederatedCatalog
+
+from conftest import FNAMES, PACKAGE
+
+
+@pytest.fixture
+def fed(dataset: Path) -> FederatedCatalog:
+    return FederatedCatalog(datasets=[Dataset("toy", PACKAGE)])
+
+
+def test_keys_without_import(fed: FederatedCatalog) -> None:
+    assert fed.keys() == [f"toy/{f}" for f in FNAMES]
+    assert fed.ls() == ["toy/"] and fed.ls("toy/data/") == [
+        "toy/data/b.json",
+        "toy/data/book.xlsx",
+        "toy/data/sub/",
+    ]
+    assert "toy/data/sub/a.csv" in fed and "other/x.csv" not in fed
+    assert fed.imported == []
+
+
+def test_load_and_prefetch(fed: FederatedCatalog) -> None:
+    assert fed.load("toy/data/sub/a.csv")["i"].tolist() == [1, 2, 3]
+    assert fed.imported == ["toy"]
+    report = fed.prefetch("toy/data/*.json")
+    assert report.ok and list(report.fetched) == ["toy/data/b.json"]
+
+
+def test_sheet_keys(fed: FederatedCatalog) -> None:
+    """Sheet keys ask the dataset's Catalog, then join the key index."""
+    key = "toy/data/book.xlsx::second"
+    assert key not in fed.keys()
+    assert key in fed
+    assert fed.get(key) is fed[key]
+    assert key in fed.keys() and fed.glob("toy/*::*") == [
+        "toy/data/book.xlsx::first_sheet",
+        key,
+    ]
+    assert "toy/data/book.xlsx::nope" not in fed
+    assert "toy/data/b.json::x" not in fed
+    assert fed.get("toy/data/b.json::x") is None
+    assert fed.get("other/x.csv", "default") == "default"
+    assert fed.get("no_prefix") is None
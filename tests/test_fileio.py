@@ -0,0 +1,136 @@
+"""File readers of neddata.utils.fileio."""
+
+import json
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from neddata.utils import fileio
+
+# =====================================================================
+# === Strict JSON chunks
+# =====================================================================
+
+RECORDS = [
+    {"a": 1, "s": "]},["},
+    [1, 2],
+    "x",
+    -4.5,
+    1e10,
+    None,
+    True,
+    {"nested": {"b": [1.25, "]"]}},
+    12345678901234567890,
+]
+
+
+@pytest.mark.parametrize("blocksize", [1, 2, 7, 1 << 20])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_json_chunks_concat_to_load(
+    tmp_path: Path, blocksize: int, indent: int | None
+) -> None:
+    """Records and numbers cut at block edges are parsed whole."""
+    path = tmp_path / "x.json"
+    path.write_text(json.dumps(RECORDS, indent=indent))
+    chunks = list(fileio.iterchunks_json(path, chunksize=4, blocksize=blocksize))
+    assert [len(c) for c in chunks] == [4, 4, 1]
+    assert sum(chunks, []) == RECORDS
+
+
+@pytest.mark.parametrize("text", ["[]", " [ ]\n", "[\n]"])
+def test_json_empty_array(tmp_path: Path, text: str) -> None:
+    path = tmp_path / "x.json"
+    path.write_text(text)
+    assert list(fileio.iterchunks_json(path, blocksize=1)) == []
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ('{"a": 1}', "does not contain a JSON array"),
+        ("", "does not contain a JSON array"),
+        ("[1,,2]", "Expected a record, got ','"),
+        ("[1,]", "Expected a record, got ']'"),
+        ("[,1]", "Expected a record"),
+        ("[1 2]", "Expected ',' or ']', got '2'"),
+        ("[1, 2", "JSON array is not closed"),
+        ("[1, 2,", "JSON array is not closed"),
+        ("[1] [2]", "Extra data after the JSON array"),
+        ('[{"a": 1', "Expecting"),
+    ],
+)
+@pytest.mark.parametrize("blocksize", [1, 1 << 20])
+def test_json_errors(
+    tmp_path: Path, text: str, message: str, blocksize: int
+) -> None:
+    """Rejects what json.loads() rejects (and non-arrays)."""
+    path = tmp_path / "x.json"
+    path.write_text(text)
+    with pytest.raises(ValueError, match=message):
+        list(fileio.iterchunks_json(path, chunksize=1, blocksize=blocksize))
+
+
+# =====================================================================
+# === Bounded split
+# =====================================================================
+
+
+@pytest.fixture
+def split_csv(tmp_path: Path) -> Path:
+    """Repeated rows, separators in the last column, missing fields."""
+    rng = random.Random(0)
+    fields = ["a", "b", "c;d", "", ";", "ä"]
+    rows = [
+        ";".join(rng.choice(fields) for _ in range(rng.randint(1, 4)))
+        for _ in range(2_000)
+    ]
+    path = tmp_path / "split.csv"
+    path.write_text("A;B;C\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("blocksize", [64, 1 << 20])
+@pytest.mark.parametrize("drop_duplicates", [False, True])
+def test_chunks_concat_to_load(
+    split_csv: Path, drop_duplicates: bool, blocksize: int
+) -> None:
+    kwargs = dict(drop_duplicates=drop_duplicates, blocksize=blocksize)
+    loaded = fileio.load_bounded_split(split_csv, **kwargs)
+    chunks = list(
+        fileio.iterchunks_bounded_split(split_csv, chunksize=7, **kwargs)
+    )
+    assert max(len(c) for c in chunks) == 7
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks), loaded, check_index_type=False
+    )
+
+
+def test_drop_duplicates_like_pandas(split_csv: Path) -> None:
+    expected = fileio.load_bounded_split(split_csv).drop_duplicates()
+    result = fileio.load_bounded_split(
+        split_csv, drop_duplicates=True, blocksize=64
+    )
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+
+def test_drop_duplicates_with_hash_collisions(
+    split_csv: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Rows whose first hashes collide are compared whole."""
+    expected = fileio.load_bounded_split(split_csv).drop_duplicates()
+    monkeypatch.setattr(
+        fileio,
+        "_hash_lines",
+        lambda lines: ([1] * len(lines), [hash(line) for line in lines]),
+    )
+    result = fileio.load_bounded_split(split_csv, drop_duplicates=True)
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+
+def test_maxsplit_keeps_separators(tmp_path: Path) -> None:
+    path = tmp_path / "x.csv"
+    path.write_text("A;B\n1;a;b\n2\n", encoding="utf-8")
+    df = fileio.load_bounded_split(path)
+    assert df.to_dict("list") == {"A": ["1", "2"], "B": ["a;b", None]}
@@ -0,0 +1,75 @@
+"""Load instrumentation: Events, sinks and memory tracing."""
+
+import logging
+import threading
+import tracemalloc
+
+import pytest
+
+from neddata import instrument
+
+
+def test_record_emits_one_event() -> None:
+    events = []
+    with instrument.recording(events.append):
+        with instrument.record("a.csv", "DataFile") as event:
+            with instrument.record("inner", "DataFile") as inner:
+                assert inner is event  # < Nested records add to the outer
+            instrument.note(source="parse", bytes_read=10)
+    assert [e.key for e in events] == ["a.csv"]
+    assert events[0].source == "parse" and events[0].total_s >= 0
+    with instrument.record("b.csv", "DataFile") as event:
+        assert event is None  # < No sinks
+    assert len(events) == 1
+
+
+def test_errors_are_recorded() -> None:
+    events = []
+    with instrument.recording(events.append):
+        with pytest.raises(KeyError):
+            with instrument.record("a.csv", "DataFile"):
+                raise KeyError("x")
+    assert events[0].error.startswith("KeyError")
+
+
+def test_failing_sink_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    def broken(event: instrument.LoadEvent) -> None:
+        raise RuntimeError("boom")
+
+    events = []
+    with instrument.recording(broken, events.append):
+        with caplog.at_level(logging.WARNING, logger="neddata.instrument"):
+            with instrument.record("a.csv", "DataFile"):
+                pass
+    assert len(events) == 1  # < Later sinks still get the event
+    assert "failed" in caplog.text and "boom" in caplog.text
+
+
+def test_overlapping_records_keep_tracing() -> None:
+    """The thread that started tracemalloc may finish first, the others
+    still measure their allocations."""
+    assert not tracemalloc.is_tracing()
+    events = []
+    n = 4
+    inside = threading.Barrier(n)
+    first_done = threading.Event()
+
+    def load(i: int) -> None:
+        with instrument.record(f"{i}.csv", "DataFile"):
+            inside.wait()
+            if i:
+                first_done.wait()
+            data = [bytes(1000) for _ in range(2_000)]  # < ~2 MiB
+            del data
+        if not i:
+            first_done.set()
+
+    with instrument.recording(events.append, trace_memory=True):
+        threads = [threading.Thread(target=load, args=(i,)) for i in range(n)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert len(events) == n
+    assert all(e.peak_traced_mb > 1 for e in events)
+    assert not tracemalloc.is_tracing()  # < Stopped after the last one
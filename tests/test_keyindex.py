@@ -0,0 +1,86 @@
+"""Indexed key lookups of neddata.utils.keyindex."""
+
+import fnmatch
+import random
+
+import pytest
+
+from neddata.utils.keyindex import KeyIndex, PatternMap, literal_prefix
+
+KEYS = [
+    "kdb/a.csv",
+    "kdb/sub/b.csv",
+    "kdb/sub/c.json",
+    "kdb_2/x.csv",
+    "rag/",  # < Directory key
+    "top.txt",
+]
+
+
+@pytest.fixture
+def index() -> KeyIndex:
+    return KeyIndex(KEYS)
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "set_7/*",
+        "set_1?/sub_2/*",
+        "*file_99*.csv",
+        "set_3/sub_[12]/*",
+        "set_3/sub_1/file_1.csv",  # < No wildcard
+        "nothing/*",
+    ],
+)
+def test_glob_like_fnmatch(pattern: str) -> None:
+    rng = random.Random(0)
+    keys = [
+        f"set_{rng.randrange(20)}/sub_{rng.randrange(5)}/file_{i}.csv"
+        for i in range(5_000)
+    ]
+    linear = sorted(k for k in keys if fnmatch.fnmatchcase(k, pattern))
+    assert KeyIndex(keys).glob(pattern) == linear
+
+
+def test_ls(index: KeyIndex) -> None:
+    assert index.ls() == ["kdb/", "kdb_2/", "rag/", "top.txt"]
+    assert index.ls("kdb") == index.ls("kdb/") == ["kdb/a.csv", "kdb/sub/"]
+    assert index.ls("kdb/sub/") == ["kdb/sub/b.csv", "kdb/sub/c.json"]
+    assert index.ls("nothing/") == []
+
+
+def test_with_prefix(index: KeyIndex) -> None:
+    assert index.with_prefix("kdb/") == KEYS[:3]  # < Not kdb_2/
+    assert index.with_prefix("") == sorted(KEYS)
+    assert literal_prefix("kdb/s*/[bc].csv") == "kdb/s"
+
+
+def test_add_and_remove(index: KeyIndex) -> None:
+    index.update(["kdb/a.csv", "new.csv"])
+    index.add("new.csv")
+    assert len(index) == len(KEYS) + 1 and "new.csv" in index
+    index.remove("kdb/sub/b.csv")
+    index.remove("kdb/sub/c.json")
+    assert index.ls("kdb/") == ["kdb/a.csv"]  # < Empty branch pruned
+    assert "kdb/sub/b.csv" not in index
+    with pytest.raises(KeyError):
+        index.remove("kdb/sub/b.csv")
+    index.clear()
+    assert len(index) == 0 and index.ls() == []
+
+
+def test_search(index: KeyIndex) -> None:
+    pytest.importorskip("rapidfuzz")
+    assert index.search("sub/b.csv") == ["kdb/sub/b.csv"]
+    assert index.search("zzzz") == []
+
+
+def test_pattern_map_first_match_wins() -> None:
+    loaders: PatternMap[str] = PatternMap()
+    loaders["set_1/*"] = "a"
+    loaders["*.csv"] = "b"
+    assert loaders.first("set_1/x.csv") == "a"
+    assert loaders.first("set_2/x.csv") == "b"
+    assert loaders.first("set_2/x.txt") is None
+    assert PatternMap().first("x") is None
@@ -0,0 +1,49 @@
+"""Batched fuzzy linking against a knowledge base."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from neddata.linking import FuzzyLinker  # noqa: E402
+
+KB = pd.DataFrame(
+    {
+        "id_gsn": [11, 12, 13, 13],
+        "monastery_name": ["St. Gallen", "Reichenau", "Lorsch", "Laurissa"],
+        "Standort": ["Sankt Gallen", None, "Lorsch", "Lorsch"],
+    }
+)
+
+
+@pytest.fixture
+def linker() -> FuzzyLinker:
+    return FuzzyLinker.from_frame(KB, fields=["monastery_name", "Standort"])
+
+
+def test_top_k(linker: FuzzyLinker) -> None:
+    ids, scores = linker.link(["Kloster Lorsch", "st gallen", None], k=2)
+    assert ids.shape == scores.shape == (3, 2)
+    assert ids[0, 0] == 13 and ids[1, 0] == 11
+    assert (np.diff(scores.astype(int), axis=1) <= 0).all()  # < Descending
+    assert (scores[2] == 0).all()  # < Missing mention
+
+
+def test_k_larger_than_kb(linker: FuzzyLinker) -> None:
+    ids, _ = linker.link(["Lorsch"], k=10)
+    assert sorted(ids[0]) == [11, 12, 13]
+
+
+@pytest.mark.parametrize("k", [0, -1])
+def test_k_not_positive(linker: FuzzyLinker, k: int) -> None:
+    ids, scores = linker.link(["Lorsch", "Reichenau"], k=k)
+    assert ids.shape == scores.shape == (2, 0)
+
+
+def test_empty_kb() -> None:
+    linker = FuzzyLinker.from_frame(KB.iloc[:0], fields=["Standort"])
+    assert len(linker.ids) == 0
+    assert linker.scores(["Lorsch"]).shape == (1, 0)
+    ids, scores = linker.link(["Lorsch"], k=5)
+    assert ids.shape == scores.shape == (1, 0)
@@ -0,0 +1,180 @@
+"""Vectorized coordinate cleaning (``_clean_coord_series``) against the
+element-wise ``_clean_coord_value`` & ``_to_float_or_nan`` it replaced."""
+
+from importlib.resources import files
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from neddata.utils.pd import (
+    LON_LAT_RANGES,
+    _clean_coord_series,
+    _clean_coord_value,
+    _implode_strings,
+    _to_float_or_nan,
+    implode,
+    lon_lat_to_numeric,
+)
+
+
+def _elementwise(ser: pd.Series) -> pd.Series:
+    return ser.map(_clean_coord_value).map(_to_float_or_nan)
+
+
+def assert_same_floats(expected: pd.Series, result: pd.Series) -> None:
+    """Bit-identical, NaN where NaN."""
+    a, b = expected.to_numpy(np.float64), result.to_numpy(np.float64)
+    assert np.array_equal(a, b, equal_nan=True)
+    assert np.array_equal(np.signbit(a), np.signbit(b))
+
+
+def _synthetic(n: int, seed: int = 0) -> pd.Series:
+    """Coordinates in the forms found in the KDB, plus junk."""
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(-180, 180, n)
+    forms = [
+        lambda v: f"{v:.6f}",  # < Clean
+        lambda v: f"{v:.4f}".replace(".", ","),  # < Decimal comma
+        lambda v: f"\u200e{v:.5f}°",  # < Stray characters
+        lambda v: f"{abs(v) * 1e15:,.0f}".replace(",", "."),  # < Many dots
+        lambda v: f"{v:.3f} E",
+        lambda v: None,
+        lambda v: "  ",
+        lambda v: "invalid",
+        lambda v: str(rng.choice(["-", "+5", ".5", "5.", "1-2", "1e-5"])),
+    ]
+    pick = rng.integers(0, len(forms), n)
+    return pd.Series([forms[i](v) for i, v in zip(pick, x)], dtype=object)
+
+
+# =====================================================================
+# === Equivalence
+# =====================================================================
+
+
+@pytest.fixture(scope="module")
+def kdb() -> pd.DataFrame:
+    path = files("neddata.abbey") / "KDB/KDB_Complete.csv"
+    if not path.is_file():
+        pytest.skip("KDB_Complete.csv is not shipped with this install")
+    return pd.read_csv(path, sep=";", dtype={"Lon": str, "Lat": str})
+
+
+@pytest.mark.parametrize("column", ["Lon", "Lat"])
+def test_kdb_columns(kdb: pd.DataFrame, column: str) -> None:
+    ser = kdb[column]
+    assert_same_floats(_elementwise(ser), _clean_coord_series(ser))
+
+
+def test_fuzzed_strings() -> None:
+    rng = np.random.default_rng(42)
+    alphabet = list("0123456789" "..,,++--" "  e°\u200e\t" "abcXYZ€")
+    strs = [
+        "".join(rng.choice(alphabet, size=rng.integers(0, 24)))
+        for _ in range(50_000)
+    ]
+    ser = pd.Series(strs, dtype=object)
+    assert_same_floats(_elementwise(ser), _clean_coord_series(ser))
+
+
+def test_mixed_objects() -> None:
+    """Non-strings go through ``str()``, missing values become NaN."""
+    ser = pd.Series(["1,5", 7, 2.5, None, np.nan, pd.NA, "", "x", True])
+    assert_same_floats(_elementwise(ser), _clean_coord_series(ser))
+
+
+def test_index_and_name_are_kept() -> None:
+    ser = pd.Series(["1,5", "x"], index=[10, 3], name="Lon")
+    result = _clean_coord_series(ser)
+    assert list(result.index) == [10, 3]
+    assert result.name == "Lon"
+
+
+def test_numeric_columns_are_only_cast() -> None:
+    """Documented change: Numeric columns skip the string detour, which
+    turned exponents into other numbers ("1e-05" -> "1-05" -> NaN)."""
+    ser = pd.Series([1e-05, 12.5, np.nan, -3.0])
+    result = _clean_coord_series(ser)
+    assert result.dtype == np.float64
+    assert_same_floats(ser, result)
+    assert np.isnan(_elementwise(ser)[0])
+
+    ints = pd.Series([1, None, 3], dtype="Int64")
+    assert_same_floats(
+        pd.Series([1.0, np.nan, 3.0]), _clean_coord_series(ints)
+    )
+
+
+def test_lon_lat_to_numeric_ranges() -> None:
+    df = pd.DataFrame(
+        {"Lon": ["12,34", "567.8"], "Lat": ["48.1", "\u200e91°"]}
+    )
+    with pytest.warns(UserWarning):
+        lon_lat_to_numeric(df, ranges=LON_LAT_RANGES)
+    assert df["Lon"].tolist()[0] == 12.34
+    assert df[["Lon", "Lat"]].iloc[1].isna().all()
+
+
+def test_1m_rows_equivalent() -> None:
+    """Timings are in the bench suite: ``neddata bench run -k 'pd/*'``."""
+    ser = _synthetic(1_000_000)
+    assert_same_floats(_elementwise(ser), _clean_coord_series(ser))
+
+
+# =====================================================================
+# === Implode
+# =====================================================================
+
+
+def _implode_groupby(df: pd.DataFrame, col: str, as_index: bool):
+    join = lambda x: ", ".join(sorted(set(x)))
+    return df.groupby(col, as_index=as_index).agg(
+        {c: join for c in df.columns if c != col}
+    )
+
+
+def _regests(n: int, dtype: str | None, seed: int = 0) -> pd.DataFrame:
+    """Long, repeated keys like ``complete_no_tags``, short values."""
+    rng = np.random.default_rng(seed)
+    keys = [f"Regest {i} " + "x" * 200 for i in rng.integers(0, n // 3, n)]
+    df = pd.DataFrame(
+        {
+            "key": keys,
+            "url": [f"u{i}" for i in rng.integers(0, 50, n)],
+            "id": [f"{i:05d}" for i in rng.integers(0, 9, n)],
+        }
+    )
+    return df.astype(dtype) if dtype else df
+
+
+@pytest.mark.parametrize("as_index", [False, True])
+@pytest.mark.parametrize("dtype", [None, "string", "string[pyarrow]"])
+def test_implode_equals_groupby(dtype: str | None, as_index: bool) -> None:
+    df = _regests(3_000, dtype)
+    if dtype is None:
+        assert _implode_strings(df, "key", ["url", "id"], as_index) is not None
+    pd.testing.assert_frame_equal(
+        implode(df, "key", as_index=as_index),
+        _implode_groupby(df, "key", as_index),
+    )
+
+
+@pytest.mark.parametrize("dtype", ["string", "string[pyarrow]"])
+def test_implode_missing_values_take_groupby(dtype: str) -> None:
+    """NA in a value column must not leak another group's value in."""
+    df = pd.DataFrame(
+        {"k": ["A", "A", "B"], "url_RG": ["u1", pd.NA, "u3"]}, dtype=dtype
+    )
+    assert _implode_strings(df, "k", ["url_RG"], False) is None
+    with pytest.raises(TypeError):  # < Like groupby() with sorted(set(x))
+        _implode_groupby(df, "k", False)
+    with pytest.raises(TypeError):
+        implode(df, "k")
+
+
+def test_implode_missing_keys_are_dropped() -> None:
+    df = pd.DataFrame({"k": ["A", None, "A"], "v": ["b", "x", "a"]})
+    pd.testing.assert_frame_equal(
+        implode(df, "k"), _implode_groupby(df, "k", False)
+    )
@@ -0,0 +1,52 @@
+"""Token store: Nested JSON token lists as memory-mapped arrays."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from neddata.tokenstore import TokenStore, build_token_store
+
+DOCS = [["kloster", "st.", "gallen"], [], ["kloster", "ä"], ["gallen"]]
+
+
+@pytest.fixture
+def src(tmp_path: Path) -> Path:
+    path = tmp_path / "chunks_tokenized.json"
+    path.write_text(json.dumps(DOCS, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def test_roundtrip(src: Path, tmp_path: Path) -> None:
+    store = TokenStore(build_token_store(src, tmp_path / "store", chunksize=3))
+    assert len(store) == len(DOCS)
+    assert list(store) == DOCS
+    assert store.lengths.tolist() == [3, 0, 2, 1]
+    assert store.decode(store.encode(["gallen", "kloster"])) == [
+        "gallen",
+        "kloster",
+    ]
+
+
+def test_not_a_token_list(tmp_path: Path) -> None:
+    src = tmp_path / "bad.json"
+    src.write_text('[["a"], "b"]')
+    with pytest.raises(ValueError, match="token lists"):
+        build_token_store(src, tmp_path / "store")
+    assert not (tmp_path / "store").exists()
+
+
+def test_concurrent_builds(src: Path, tmp_path: Path) -> None:
+    """Threads of one process build into their own temp dirs."""
+    dest = tmp_path / "store"
+    with ThreadPoolExecutor(8) as pool:
+        futures = [
+            pool.submit(build_token_store, src, dest, 1) for _ in range(8)
+        ]
+        assert all(f.result() == dest for f in futures)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "chunks_tokenized.json",
+        "store",
+    ]
+    assert list(TokenStore(dest)) == DOCS